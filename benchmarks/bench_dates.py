@@ -0,0 +1,110 @@
+# Standard Python library imports
+from datetime import datetime, timedelta
+import os
+import re
+import sys
+import time
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from benchmarks.synthetic import make_timestamps
+from news_browser.dates import parse_many, parse_timestamp
+from news_browser.utils import convert_date_to_mm_aaaa
+
+
+def legacy_convert_date_to_mm_aaaa(date_str):
+    """
+    The conversion as it was before the 'dates' module: two dicts, eight regexes and
+    several strptime formats on every call.
+    """
+    recent_patterns = {
+        "now": datetime.now(),
+        "sec": timedelta(seconds=1),
+        "seconds": timedelta(seconds=1),
+        "min": timedelta(minutes=1),
+        "minutes": timedelta(minutes=1),
+        "hour": timedelta(hours=1),
+        "hours": timedelta(hours=1),
+        "day": timedelta(days=1)
+    }
+    for pattern, delta in recent_patterns.items():
+        if re.match(fr"\b\d+\s*{pattern}\b", date_str):
+            return (datetime.now() - delta).strftime("%m-%Y")
+
+    month_map = {
+        "Jan.": "January", "Jan": "January",
+        "Feb.": "February", "Feb": "February",
+        "March": "March", "Mar": "March",
+        "April": "April", "Apr": "April",
+        "May": "May",
+        "June": "June", "Jun": "June",
+        "July": "July", "Jul": "July",
+        "Aug.": "August", "Aug": "August",
+        "Sept.": "September", "Sep": "September",
+        "Oct.": "October", "Oct": "October",
+        "Nov.": "November", "Nov": "November",
+        "Dec.": "December", "Dec": "December"
+    }
+    for abbr, full in month_map.items():
+        if abbr in date_str:
+            date_str = date_str.replace(abbr, full)
+            break
+
+    for fmt in ["%B. %d, %Y", "%B %d, %Y"]:
+        try:
+            return datetime.strptime(date_str, fmt).strftime("%m-%Y")
+        except ValueError:
+            pass
+    return None
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def bench_dates(num_items=100_000):
+    """
+    Measures the time to convert 'num_items' mixed timestamps with the legacy function,
+    with 'convert_date_to_mm_aaaa' (cold and warm cache) and with 'parse_many'.
+
+    Returns
+    -------
+    list of dict
+        One result per function, with the number of timestamps it could not parse.
+    """
+    timestamps = make_timestamps(num_items)
+    results = []
+
+    legacy, seconds = timed(lambda: [legacy_convert_date_to_mm_aaaa(ts) for ts in timestamps])
+    results.append({"function": "legacy", "seconds": seconds, "unparsed": legacy.count(None)})
+
+    parse_timestamp.cache_clear()
+    converted, seconds = timed(lambda: [convert_date_to_mm_aaaa(ts) for ts in timestamps])
+    results.append({"function": "convert_date (cold cache)", "seconds": seconds, "unparsed": converted.count(None)})
+
+    converted, seconds = timed(lambda: [convert_date_to_mm_aaaa(ts) for ts in timestamps])
+    results.append({"function": "convert_date (warm cache)", "seconds": seconds, "unparsed": converted.count(None)})
+
+    parsed, seconds = timed(parse_many, timestamps)
+    results.append({"function": "parse_many", "seconds": seconds, "unparsed": parsed.count(None)})
+
+    # Both agree on every absolute date the legacy function understood
+    disagreements = sum(1 for ts, old, new in zip(timestamps, legacy, converted)
+                        if old is not None and not ts[0].isdigit() and old != new)
+    for result in results:
+        result["us_per_timestamp"] = round(result["seconds"] / num_items * 1e6, 3)
+        result["seconds"] = round(result["seconds"], 4)
+        result["absolute_disagreements"] = disagreements
+    return results
+
+
+if __name__ == "__main__":
+    for result in bench_dates():
+        print(f"{result['function']:<26} {result['seconds']:>8.4f} s  {result['us_per_timestamp']:>8.3f} us/timestamp  "
+              f"{result['unparsed']:>6} unparsed  {result['absolute_disagreements']} disagreements")
@@ -0,0 +1,103 @@
+# Standard Python library imports
+import os
+import sys
+import tempfile
+import time
+
+# Third party libraries imports
+import openpyxl
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from benchmarks.memory import peak_rss_growth_kb
+from benchmarks.synthetic import iter_news_data, make_news_data
+from news_browser.excel_creator import HEADERS, ExcelStream, excel_row
+
+
+def legacy_create_excel(news_data, excel_filename):
+    """
+    The export as it was before the ExcelStream: a normal in-memory workbook and one 'ws.cell()' per value.
+    """
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for col, header in enumerate(HEADERS, start=1):
+        ws.cell(row=1, column=col, value=header)
+    row_num = 2
+    for item in news_data:
+        if item["bool"]:
+            for col, value in enumerate(excel_row(item), start=1):
+                ws.cell(row=row_num, column=col, value=value)
+            row_num += 1
+    wb.save(excel_filename)
+
+
+def stream_create_excel(news_data, excel_filename):
+    with ExcelStream(excel_filename) as excel_stream:
+        for item in news_data:
+            if item["bool"]:
+                excel_stream.append(item)
+
+
+def run_export(function_name, num_rows, excel_filename):
+    """
+    Builds 'num_rows' synthetic news and exports them, in the memory measuring child process.
+    The "stream_lazy" exporter receives the news one by one, as they are produced, instead of a list.
+    """
+    news_data = iter_news_data(num_rows) if function_name == "stream_lazy" else make_news_data(num_rows)
+    EXPORTERS[function_name](news_data, excel_filename)
+
+
+EXPORTERS = {
+    "legacy": legacy_create_excel,
+    "stream": stream_create_excel,
+    "stream_lazy": stream_create_excel,
+}
+
+
+def read_rows(excel_filename):
+    return [tuple(cell.value for cell in row) for row in openpyxl.load_workbook(excel_filename).active.iter_rows()]
+
+
+def bench_excel(row_counts=(1_000, 10_000, 100_000)):
+    """
+    Measures the export time and the peak RSS growth of the legacy in-memory workbook and of the
+    write-only ExcelStream (fed with a list and with a generator), and checks that all write the same cells.
+
+    Returns
+    -------
+    list of dict
+        One result per exporter and number of rows.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for num_rows in row_counts:
+            news_data = make_news_data(num_rows)
+            files = {}
+            for name, exporter in EXPORTERS.items():
+                files[name] = os.path.join(tmp, f"{name}_{num_rows}.xlsx")
+                start = time.perf_counter()
+                exporter(iter_news_data(num_rows) if name == "stream_lazy" else news_data, files[name])
+                seconds = time.perf_counter() - start
+
+                # The memory is measured in a fresh process, which also builds the news (the same for both)
+                rss_kb = peak_rss_growth_kb(run_export, name, num_rows, files[name])
+                results.append({"exporter": name, "rows": num_rows, "seconds": round(seconds, 3),
+                                "peak_rss_growth_mb": round(rss_kb / 1024, 1),
+                                "file_kb": round(os.path.getsize(files[name]) / 1024, 1)})
+            if num_rows <= 10_000:
+                legacy_rows = read_rows(files["legacy"])
+                same = all(read_rows(files[name]) == legacy_rows for name in EXPORTERS)
+                for result in results[-len(EXPORTERS):]:
+                    result["same_cells"] = same
+    return results
+
+
+if __name__ == "__main__":
+    for result in bench_excel():
+        print(f"{result['exporter']:<11} {result['rows']:>7} rows  {result['seconds']:>8.3f} s  "
+              f"peak RSS +{result['peak_rss_growth_mb']:>7.1f} MB  {result['file_kb']:>8.1f} KB  "
+              f"same cells: {result.get('same_cells', 'not checked')}")
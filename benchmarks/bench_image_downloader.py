@@ -0,0 +1,48 @@
+# Standard Python library imports
+import os
+import sys
+import time
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from benchmarks.image_server import LocalImageServer
+from benchmarks.synthetic import make_news_data
+from news_browser.image_downloader import ImageDownloader
+
+
+def bench_download_images(workers=(1, 8, 32), num_items=100, latency=0.05, image_size=50_000):
+    """
+    Measures the throughput of 'ImageDownloader.download_images' for every number of workers.
+
+    Returns
+    -------
+    list of dict
+        One result per number of workers.
+    """
+    results = []
+    with LocalImageServer(image_size=image_size, latency=latency) as server:
+        for max_workers in workers:
+            news_data = make_news_data(num_items, server.base_url)
+            downloader = ImageDownloader(max_workers=max_workers)
+            start = time.perf_counter()
+            downloader.download_images(news_data)
+            elapsed = time.perf_counter() - start
+            downloader.close()
+            downloader.clear_images()
+            results.append({
+                "workers": max_workers,
+                "images": num_items,
+                "seconds": round(elapsed, 4),
+                "images_per_second": round(num_items / elapsed, 2),
+            })
+    return results
+
+
+if __name__ == "__main__":
+    for result in bench_download_images():
+        print(f"{result['workers']:>3} workers: {result['images']} images in {result['seconds']:.3f}s "
+              f"({result['images_per_second']:.1f} images/s)")
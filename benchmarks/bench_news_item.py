@@ -0,0 +1,109 @@
+# Standard Python library imports
+import os
+import sys
+import time
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from benchmarks.memory import peak_rss_growth_kb, traced_peak_kb
+from benchmarks.synthetic import TIMESTAMPS
+from news_browser.news_item import NewsItem, none_if_missing
+
+
+def make_fields(index):
+    """
+    The raw fields of a synthetic news, a third of them without image and without link.
+    """
+    has_image = index % 3 != 0
+    return {
+        "title": f"Messi and the news number {index}",
+        "date": TIMESTAMPS[index % 3],
+        "description": f"A description of the news {index}, which cost ${index}.5 million, with Messi in it.",
+        "image_url": f"https://ca-times.brightspotcdn.com/dims4/default/image{index}.jpg" if has_image else "N/A",
+        "image_alt": f"Picture of the news {index}" if has_image else "N/A",
+        "article_url": f"https://www.latimes.com/sports/story/news-{index}" if has_image else "N/A",
+        "money_amounts": [{"amount": index * 1e6 + 5e5, "text": f"${index}.5 million", "span": (40, 55)}],
+    }
+
+
+def legacy_news_item(promo, index):
+    """
+    The 'news_data' dictionary as it was before the NewsItem.
+    """
+    return {
+        "title": promo["title"],
+        "date": promo["date"],
+        "description": promo["description"],
+        "image_url": promo["image_url"],
+        "image_alt": promo["image_alt"],
+        "article_url": promo["article_url"],
+        "phrase_matches": 2,
+        "contain_money": bool(promo["money_amounts"]),
+        "money_amounts": promo["money_amounts"],
+        "news_name": f"news{index}",
+        "image_path": f"output/news{index}.jpg" if promo["image_url"] != "N/A" else "N/A",
+        "excel_filename": f"output/excel_files/news{index}.xlsx",
+        "bool": True,
+        "month_ordinal": 24285,
+    }
+
+
+def compact_news_item(promo, index):
+    return NewsItem(
+        index,
+        title=promo["title"],
+        date=promo["date"],
+        description=promo["description"],
+        image_url=none_if_missing(promo["image_url"]),
+        image_alt=none_if_missing(promo["image_alt"]),
+        article_url=none_if_missing(promo["article_url"]),
+        phrase_matches=2,
+        money_amounts=promo["money_amounts"],
+        in_window=True,
+        month_ordinal=24285,
+    )
+
+
+BUILDERS = {"dict": legacy_news_item, "NewsItem": compact_news_item}
+
+
+def build_news_data(builder_name, num_items):
+    """
+    Builds 'num_items' news with one of the builders, the list is kept alive until the peak is measured.
+    """
+    builder = BUILDERS[builder_name]
+    return [builder(make_fields(index), index) for index in range(1, num_items + 1)]
+
+
+def bench_news_item(num_items=100_000):
+    """
+    Measures the build time, the peak of the Python heap and the peak RSS of 'num_items' news
+    as dictionaries and as NewsItem records.
+
+    Returns
+    -------
+    list of dict
+        One result per record type.
+    """
+    results = []
+    for builder_name in BUILDERS:
+        start = time.perf_counter()
+        build_news_data(builder_name, num_items)
+        seconds = time.perf_counter() - start
+        heap_kb = traced_peak_kb(build_news_data, builder_name, num_items)
+        rss_kb = peak_rss_growth_kb(build_news_data, builder_name, num_items)
+        results.append({"record": builder_name, "items": num_items, "seconds": round(seconds, 3),
+                        "heap_mb": round(heap_kb / 1024, 1), "rss_mb": round(rss_kb / 1024, 1),
+                        "bytes_per_item": round(heap_kb * 1024 / num_items)})
+    return results
+
+
+if __name__ == "__main__":
+    for result in bench_news_item():
+        print(f"{result['record']:<9} {result['items']:>7} news  {result['seconds']:>6.3f} s  "
+              f"heap {result['heap_mb']:>7.1f} MB  RSS {result['rss_mb']:>7.1f} MB  "
+              f"{result['bytes_per_item']:>5} bytes per news")
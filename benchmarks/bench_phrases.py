@@ -0,0 +1,71 @@
+# Standard Python library imports
+import os
+import re
+import sys
+import time
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from benchmarks.synthetic import make_news_data
+from news_browser.phrases import PhraseMatcher
+
+
+def legacy_word_counter(text_to_match, search_phrase):
+    """
+    The counter as it was before the 'phrases' module: one regular expression per phrase and per call.
+    """
+    text_to_match = text_to_match.lower()
+    search_phrase = search_phrase.lower()
+    pattern = re.compile(r'\b\w*' + re.escape(search_phrase) + r'\w*\b')
+    return len(pattern.findall(text_to_match))
+
+
+def make_phrases(num_phrases):
+    """
+    Returns 'num_phrases' search phrases, the first ones are found in the synthetic news.
+    """
+    found = ["messi", "news", "description", "million", "number"]
+    return (found + [f"phrase{index}" for index in range(num_phrases)])[:num_phrases]
+
+
+def bench_phrases(num_items=2_000, phrase_counts=(1, 5, 20, 100)):
+    """
+    Measures the cost per news of counting a growing number of phrases in the title and description
+    of 'num_items' news, with one legacy 'word_counter' call per phrase and with one PhraseMatcher scan.
+
+    Returns
+    -------
+    list of dict
+        One result per number of phrases.
+    """
+    texts = [item["title"] + item["description"] for item in make_news_data(num_items)]
+    results = []
+    for num_phrases in phrase_counts:
+        phrases = make_phrases(num_phrases)
+
+        start = time.perf_counter()
+        legacy = [{phrase: legacy_word_counter(text, phrase) for phrase in phrases} for text in texts]
+        legacy_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        matcher = PhraseMatcher(phrases)
+        counts = matcher.count_many(texts)
+        matcher_seconds = time.perf_counter() - start
+
+        results.append({
+            "phrases": num_phrases,
+            "legacy_us_per_news": round(legacy_seconds / num_items * 1e6, 2),
+            "matcher_us_per_news": round(matcher_seconds / num_items * 1e6, 2),
+            "same_counts": legacy == counts,
+        })
+    return results
+
+
+if __name__ == "__main__":
+    for result in bench_phrases():
+        print(f"{result['phrases']:>4} phrases  legacy {result['legacy_us_per_news']:>8.2f} us/news  "
+              f"matcher {result['matcher_us_per_news']:>8.2f} us/news  same counts: {result['same_counts']}")
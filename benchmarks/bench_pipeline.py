@@ -0,0 +1,77 @@
+# Standard Python library imports
+import os
+import sys
+import tempfile
+import time
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from benchmarks.image_server import LocalImageServer
+from benchmarks.synthetic import make_news_data
+from news_browser.excel_creator import ExcelCreator
+from news_browser.image_downloader import ImageDownloader
+from news_browser.pipeline import NewsPipeline
+
+
+def slow_pages(news_data, per_page, page_seconds):
+    """
+    Yields the news page by page, waiting 'page_seconds' before every page as the browser does while it loads.
+    """
+    for start in range(0, len(news_data), per_page):
+        time.sleep(page_seconds)
+        yield news_data[start:start + per_page]
+
+
+def run_phased(pages, output_dir, max_workers):
+    # As 'NewsBrowser.run' without 'streaming': scrape everything, then download, then export
+    news_data = [item for items in pages for item in items]
+    downloader = ImageDownloader(max_workers=max_workers, output_dir=output_dir)
+    downloader.download_images(news_data)
+    downloader.close()
+    ExcelCreator(output_dir).create_excel(news_data, "Messi", "Sports", 1)
+
+
+def run_streaming(pages, output_dir, max_workers):
+    downloader = ImageDownloader(max_workers=max_workers, output_dir=output_dir)
+    excel_creator = ExcelCreator(output_dir)
+    NewsPipeline(downloader).run(pages, lambda items: excel_creator.create_excel(items, "Messi", "Sports", 1))
+    downloader.close()
+
+
+RUNNERS = {"phased": run_phased, "streaming": run_streaming}
+
+
+def bench_pipeline(num_pages=10, per_page=10, page_seconds=0.3, latency=0.05, max_workers=8):
+    """
+    Measures the end-to-end time of a search of 'num_pages' pages that take 'page_seconds' each to load,
+    whose images come from a local server answering after 'latency' seconds, with the phased run and
+    with the NewsPipeline.
+
+    Returns
+    -------
+    list of dict
+        One result per run, with the scrape time alone for reference.
+    """
+    scrape_seconds = num_pages * page_seconds
+    results = []
+    with LocalImageServer(latency=latency) as server:
+        for runner_name, runner in RUNNERS.items():
+            news_data = make_news_data(num_pages * per_page, server.base_url)
+            with tempfile.TemporaryDirectory() as tmp:
+                start = time.perf_counter()
+                runner(slow_pages(news_data, per_page, page_seconds), tmp, max_workers)
+                seconds = time.perf_counter() - start
+            results.append({"run": runner_name, "news": len(news_data), "seconds": round(seconds, 3),
+                            "scrape_seconds": round(scrape_seconds, 3),
+                            "overhead_seconds": round(seconds - scrape_seconds, 3)})
+    return results
+
+
+if __name__ == "__main__":
+    for result in bench_pipeline():
+        print(f"{result['run']:<10} {result['news']} news in {result['seconds']:.3f}s "
+              f"(scraping alone {result['scrape_seconds']:.3f}s, +{result['overhead_seconds']:.3f}s)")
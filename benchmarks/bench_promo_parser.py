@@ -0,0 +1,100 @@
+# Standard Python library imports
+import os
+import sys
+import time
+from functools import partial
+
+# Third party libraries imports
+from bs4 import BeautifulSoup
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from benchmarks.memory import peak_rss_growth_kb, traced_peak_kb
+from benchmarks.synthetic import make_results_page
+from news_browser.promo_parser import parse_promos
+from testing.fixture_server import read_fixture
+
+
+def legacy_parse_promos(html):
+    """
+    The extraction as it was before the engines: a full 'html.parser' tree and five 'find' per news.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    promos = []
+    for item in soup.find_all('div', class_='promo-wrapper'):
+        title_tag = item.find('h3', class_='promo-title')
+        desc_tag = item.find('p', class_='promo-description')
+        time_tag = item.find('p', class_='promo-timestamp')
+        image_tag = item.find('img', class_='image')
+        promos.append({
+            "title": title_tag.text.strip() if title_tag else 'N/A',
+            "description": desc_tag.text.strip() if desc_tag else 'N/A',
+            "date": time_tag.text.strip() if time_tag else 'N/A',
+            "image_url": image_tag.get("src") if image_tag else "N/A",
+            "image_alt": image_tag.get("alt") if image_tag else "N/A",
+        })
+    return promos
+
+
+ENGINES = {
+    "legacy": legacy_parse_promos,
+    "soup": partial(parse_promos, engine="soup"),
+    "lxml": partial(parse_promos, engine="lxml"),
+}
+
+
+def saved_pages():
+    """
+    The saved result pages, plus a synthetic page as big as a real one.
+    """
+    return {
+        "search_page_1.html": read_fixture("search_page_1.html"),
+        "search_page_2.html": read_fixture("search_page_2.html"),
+        "synthetic_full_page": make_results_page(num_promos=10, padding_blocks=40),
+    }
+
+
+def bench_promo_parser(repeat=20):
+    """
+    Measures the parse time per page and the peak memory of every extraction engine.
+
+    The peak memory is given twice: the Python heap (tracemalloc, blind to lxml's C allocations)
+    and the growth of the peak RSS of a child process that parses the page once.
+
+    Note: 'legacy' parses the whole document, so on whole pages it also counts promos outside of the results.
+
+    Returns
+    -------
+    list of dict
+        One result per page and engine.
+    """
+    results = []
+    for page_name, html in saved_pages().items():
+        for engine, parse in ENGINES.items():
+            parse(html)  # Warm up
+            start = time.perf_counter()
+            for _ in range(repeat):
+                promos = parse(html)
+            elapsed = (time.perf_counter() - start) / repeat
+
+            results.append({
+                "page": page_name,
+                "page_kb": round(len(html) / 1024, 1),
+                "engine": engine,
+                "promos": len(promos),
+                "ms_per_page": round(elapsed * 1000, 3),
+                "python_peak_kb": round(traced_peak_kb(parse, html), 1),
+                "rss_growth_kb": round(peak_rss_growth_kb(parse, html), 1),
+            })
+    return results
+
+
+if __name__ == "__main__":
+    for result in bench_promo_parser():
+        print(f"{result['page']:<22} {result['page_kb']:>7.1f} KB  {result['engine']:<7} "
+              f"{result['promos']:>3} promos  {result['ms_per_page']:>8.3f} ms/page  "
+              f"{result['python_peak_kb']:>8.1f} KB heap  {result['rss_growth_kb']:>8.1f} KB RSS")
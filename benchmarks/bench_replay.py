@@ -0,0 +1,77 @@
+# Standard Python library imports
+import logging
+import os
+import sys
+import tempfile
+import time
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from benchmarks.synthetic import TIMESTAMPS, make_results_page
+from news_browser.my_logger import logger
+from news_browser.promo_parser import parse_promos
+from news_browser.recording import SessionRecorder, replay_session
+
+
+def synthetic_page(page_number):
+    """
+    A synthetic result page (as big as a real one) whose news are all recent and have their own
+    links and images, so the replay reads every page instead of stopping at the first old news.
+    """
+    page = make_results_page(num_promos=10, padding_blocks=40)
+    for timestamp in TIMESTAMPS:
+        if not timestamp.endswith("ago"):
+            page = page.replace(f">{timestamp}<", ">2 hours ago<")
+    return page.replace("/story/news-", f"/story/news-{page_number}-").replace("/default/", f"/default/{page_number}-")
+
+
+def record_synthetic_session(path, num_pages, image_size=50_000):
+    """
+    Records a session of 'num_pages' synthetic result pages and one image per news, as the live
+    scrapers and the ImageDownloader would.
+    """
+    recorder = SessionRecorder(path)
+    recorder.begin("Messi", "Sports", 2)
+    image_path = os.path.join(os.path.dirname(path), "image.jpg")
+    with open(image_path, "wb") as f:
+        f.write(os.urandom(image_size))
+
+    for page_number in range(1, num_pages + 1):
+        page = synthetic_page(page_number)
+        if page_number == 1:
+            recorder.add_topics(page)
+        recorder.add_page(page)
+        for promo in parse_promos(page):
+            recorder.add_image(promo["image_url"], image_path)
+    return recorder.close()
+
+
+def bench_replay(num_pages=10):
+    """
+    Measures a full replay of a recorded session: the extraction of its pages, the writing of its
+    images and of the Excel file, without browser nor network.
+
+    Returns
+    -------
+    dict
+        The size of the archive, the number of news replayed and the seconds of the replay.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = record_synthetic_session(os.path.join(tmp, "session.zip"), num_pages)
+        start = time.perf_counter()
+        news_data, excel_file = replay_session(path, output_dir=os.path.join(tmp, "replay"))
+        seconds = time.perf_counter() - start
+        return {"pages": num_pages, "archive_kb": round(os.path.getsize(path) / 1024, 1), "news": len(news_data),
+                "excel": excel_file is not None, "seconds": round(seconds, 3)}
+
+
+if __name__ == "__main__":
+    # The export logs every call, which would bury the results
+    logger.setLevel(logging.WARNING)
+    result = bench_replay()
+    print(f"Replayed {result['pages']} pages ({result['archive_kb']} KB archive), {result['news']} news, "
+          f"in {result['seconds']:.3f} s")
@@ -0,0 +1,91 @@
+# Standard Python library imports
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Third party libraries imports
+import openpyxl
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from benchmarks.synthetic import make_news_data
+from news_browser import sinks
+from news_browser.excel_creator import ExcelStream
+
+
+def read_excel(path):
+    workbook = openpyxl.load_workbook(path, read_only=True)
+    rows = list(workbook.active.iter_rows(values_only=True))[1:]
+    workbook.close()
+    return rows
+
+
+def read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def read_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def read_parquet(path):
+    return sinks.pq.read_table(path).to_pylist()
+
+
+READERS = {"excel": read_excel, "csv": read_csv, "jsonl": read_jsonl, "parquet": read_parquet}
+
+
+def bench_sinks(num_rows=50_000):
+    """
+    Measures the write and read back time and the file size of every output format
+    for 'num_rows' synthetic news. Parquet is left out if pyarrow is not installed.
+
+    Returns
+    -------
+    list of dict
+        One result per format.
+    """
+    news_data = make_news_data(num_rows)
+    formats = ["excel", "csv", "jsonl"] + (["parquet"] if sinks.pa is not None else [])
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        base_path = os.path.join(tmp, "Messi_Sports_1")
+        for output_format in formats:
+            start = time.perf_counter()
+            if output_format == "excel":
+                path = base_path + ".xlsx"
+                with ExcelStream(path) as excel_stream:
+                    for item in news_data:
+                        excel_stream.append(item)
+            else:
+                with sinks.SINKS[output_format](base_path) as sink:
+                    for item in news_data:
+                        sink.write(item)
+                path = sink.path
+            write_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            rows = READERS[output_format](path)
+            read_seconds = time.perf_counter() - start
+
+            results.append({"format": output_format, "rows": len(rows), "write_seconds": round(write_seconds, 3),
+                            "read_seconds": round(read_seconds, 3),
+                            "file_kb": round(os.path.getsize(path) / 1024, 1)})
+    return results
+
+
+if __name__ == "__main__":
+    if sinks.pa is None:
+        print("pyarrow is not installed, the Parquet format is left out")
+    for result in bench_sinks():
+        print(f"{result['format']:<8} {result['rows']:>7} rows  write {result['write_seconds']:>7.3f} s  "
+              f"read back {result['read_seconds']:>7.3f} s  {result['file_kb']:>9.1f} KB")
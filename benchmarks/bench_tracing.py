@@ -0,0 +1,60 @@
+# Standard Python library imports
+import os
+import sys
+import time
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from news_browser import tracing
+
+
+def bare(a, b):
+    return a + b
+
+
+traced_function = tracing.traced("add")(bare)
+
+
+def with_span(a, b):
+    with tracing.span("add", page=a):
+        return a + b
+
+
+def ns_per_call(function, num_calls):
+    start = time.perf_counter_ns()
+    for i in range(num_calls):
+        function(i, 1)
+    return (time.perf_counter_ns() - start) / num_calls
+
+
+def bench_tracing(num_calls=200_000):
+    """
+    Measures the cost per call of a function without instrumentation, with the 'traced' decorator
+    and with a 'span' block, while tracing is disabled and while it is enabled.
+
+    Returns
+    -------
+    list of dict
+        One result per case, with the nanoseconds added to the bare call.
+    """
+    results = []
+    bare_ns = ns_per_call(bare, num_calls)
+    results.append({"case": "bare call", "ns_per_call": round(bare_ns, 1), "overhead_ns": 0.0})
+    for enabled in (False, True):
+        if enabled:
+            tracing.enable()
+        for case, function in (("traced", traced_function), ("span", with_span)):
+            ns = ns_per_call(function, num_calls)
+            results.append({"case": f"{case} ({'enabled' if enabled else 'disabled'})", "ns_per_call": round(ns, 1),
+                            "overhead_ns": round(ns - bare_ns, 1)})
+        tracing.disable()
+    return results
+
+
+if __name__ == "__main__":
+    for result in bench_tracing():
+        print(f"{result['case']:<20} {result['ns_per_call']:>8.1f} ns per call  (+{result['overhead_ns']:.1f} ns)")
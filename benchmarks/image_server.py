@@ -0,0 +1,72 @@
+# Standard Python library imports
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Server(ThreadingHTTPServer):
+    # The default backlog (5) drops connections when many workers connect at once
+    request_queue_size = 128
+
+
+class LocalImageServer:
+    """
+    A local stand-in for the image CDN of the news site, used by the benchmarks.
+
+    Every request to '/<anything>.jpg' answers with 'image_size' bytes after waiting 'latency' seconds,
+    which is what makes the difference between sequential and concurrent downloads visible.
+
+    Parameters
+    ----------
+    image_size : int
+        Number of bytes of every image.
+    latency : float
+        Seconds that the server waits before answering every request.
+    """
+
+    def __init__(self, image_size=50_000, latency=0.05):
+        self.image_size = image_size
+        self.latency = latency
+        self.requests_served = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def _make_handler(self):
+        server = self
+        payload = b"\xff\xd8" + b"\x00" * (self.image_size - 2)
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Needed to keep the connections alive
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                time.sleep(server.latency)
+                with server._lock:
+                    server.requests_served += 1
+                self.send_response(200)
+                self.send_header("Content-Type", "image/jpeg")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self._server = _Server(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._server.shutdown()
+        self._server.server_close()
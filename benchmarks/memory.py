@@ -0,0 +1,66 @@
+# Standard Python library imports
+import multiprocessing
+import resource
+import sys
+import tracemalloc
+
+
+def _reset_peak_rss():
+    # On Linux, writing "5" to clear_refs resets the peak RSS (VmHWM) to the current RSS,
+    # otherwise a forked child keeps the peak of its parent
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _peak_rss_kb():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    # ru_maxrss is in KB on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 if sys.platform == "darwin" else peak
+
+
+def _child(fn, args, conn):
+    _reset_peak_rss()
+    before = _peak_rss_kb()
+    fn(*args)
+    conn.send(_peak_rss_kb() - before)
+    conn.close()
+
+
+def peak_rss_growth_kb(fn, *args):
+    """
+    Runs 'fn(*args)' in a new child process and returns how much its peak RSS grew, in KB.
+
+    Unlike tracemalloc, this also counts the memory allocated by C libraries (lxml, openpyxl's XML writer).
+    The child is a fresh interpreter (not a fork, whose heap would already be grown by the parent),
+    so 'fn' and 'args' must be picklable.
+    """
+    context = multiprocessing.get_context("spawn")
+    parent_conn, child_conn = context.Pipe(duplex=False)
+    process = context.Process(target=_child, args=(fn, args, child_conn))
+    process.start()
+    growth = parent_conn.recv()
+    process.join()
+    return growth
+
+
+def traced_peak_kb(fn, *args):
+    """
+    Runs 'fn(*args)' and returns the peak of the Python heap it allocated, in KB (tracemalloc).
+    """
+    tracemalloc.start()
+    try:
+        fn(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
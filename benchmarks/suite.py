@@ -0,0 +1,229 @@
+# Standard Python library imports
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from benchmarks.image_server import LocalImageServer
+from benchmarks.synthetic import make_news_data, make_results_page, make_timestamps
+from news_browser.dates import parse_timestamp
+from news_browser.excel_creator import ExcelCreator
+from news_browser.image_downloader import ImageDownloader
+from news_browser.money import extract_money_many
+from news_browser.my_logger import logger
+from news_browser.promo_parser import parse_promos
+from news_browser.utils import (
+                    calculate_months_to_consider,
+                    convert_date_to_mm_aaaa,
+                    does_it_contain_money,
+                    word_counter
+)
+from testing.fixture_server import read_fixture
+
+
+class Case:
+    """
+    A benchmark of the suite: 'run()' does 'ops' operations of 'unit', and 'setup()' (not timed)
+    prepares every repetition.
+    """
+
+    def __init__(self, name, unit, ops, run, setup=None):
+        self.name = name
+        self.unit = unit
+        self.ops = ops
+        self.run = run
+        self.setup = setup
+
+    def measure(self, repeat):
+        """
+        Runs the case once to warm up and then 'repeat' times.
+
+        Returns
+        -------
+        dict
+            The median and minimum milliseconds per run, and the microseconds per operation of the fastest
+            run (the least disturbed by the rest of the machine, so the one compared between reports).
+        """
+        timings = []
+        for _ in range(repeat + 1):
+            if self.setup:
+                self.setup()
+            # As 'timeit' does, the garbage collector does not run in the middle of a timing
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                self.run()
+                timings.append(time.perf_counter() - start)
+            finally:
+                gc.enable()
+        timings = timings[1:]  # The warm up run is left out
+        fastest = min(timings)
+        return {"name": self.name, "unit": self.unit, "ops": self.ops, "repeat": repeat,
+                "median_ms": round(statistics.median(timings) * 1000, 3), "min_ms": round(fastest * 1000, 3),
+                "us_per_op": round(fastest * 1e6 / self.ops, 3), "ops_per_second": round(self.ops / fastest, 1)}
+
+
+def text_cases(num_items):
+    """
+    The cases of the functions that are called once per news, on the texts of synthetic news.
+    """
+    texts = [item["title"] + item["description"] for item in make_news_data(num_items)]
+    # Most real news have no money at all, the pattern has to give up on them quickly
+    texts_without_money = [text.replace("$", "") * 4 for text in texts]
+    timestamps = make_timestamps(num_items)
+    return [
+        Case("convert_date_to_mm_aaaa", "timestamp", len(timestamps),
+             lambda: [convert_date_to_mm_aaaa(timestamp) for timestamp in timestamps],
+             setup=parse_timestamp.cache_clear),
+        Case("word_counter", "news", len(texts), lambda: [word_counter(text, "Messi") for text in texts]),
+        Case("does_it_contain_money", "news", len(texts), lambda: [does_it_contain_money(text) for text in texts]),
+        Case("does_it_contain_money_no_money", "news", len(texts),
+             lambda: [does_it_contain_money(text) for text in texts_without_money]),
+        Case("extract_money_many", "news", len(texts),
+             lambda: [extract_money_many(texts[start:start + 10]) for start in range(0, len(texts), 10)]),
+        Case("calculate_months_to_consider", "call", 1_000,
+             lambda: [calculate_months_to_consider(num_months % 24 + 1) for num_months in range(1_000)]),
+    ]
+
+
+def promo_cases():
+    """
+    The extraction of the news of the saved result pages and of a synthetic page as big as a real one.
+    """
+    # Every run parses the pages 10 times, a single pass is too short to be timed reliably
+    pages = [read_fixture("search_page_1.html"), read_fixture("search_page_2.html"),
+             make_results_page(num_promos=10, padding_blocks=40)] * 10
+    return [
+        Case(f"promo_extraction_{engine}", "page", len(pages),
+             lambda engine=engine: [parse_promos(html, engine) for html in pages])
+        for engine in ("lxml", "soup")
+    ]
+
+
+def export_cases(output_dir, num_rows, num_images, image_server):
+    """
+    The Excel export of synthetic news and the download of their images from the local image server.
+    """
+    news_data = make_news_data(num_rows)
+    excel_creator = ExcelCreator(output_dir)
+    state = {}
+
+    def new_downloads():
+        state["news_data"] = make_news_data(num_images, image_server.base_url)
+        state["downloader"] = ImageDownloader(max_workers=8, output_dir=output_dir)
+
+    def download():
+        state["downloader"].download_images(state["news_data"])
+        state["downloader"].close()
+
+    return [
+        Case("create_excel", "row", num_rows,
+             lambda: excel_creator.create_excel(news_data, "Messi", "Sports", 1)),
+        Case("download_images", "image", num_images, download, setup=new_downloads),
+    ]
+
+
+def run_suite(repeat=5, num_items=10_000, num_rows=5_000, num_images=50, latency=0.01):
+    """
+    Runs every case of the suite, offline: the pages are the saved fixtures and the images come
+    from a local server.
+
+    Returns
+    -------
+    dict
+        The environment of the run and the result of every case.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp, LocalImageServer(latency=latency) as image_server:
+        cases = promo_cases() + text_cases(num_items) + export_cases(tmp, num_rows, num_images, image_server)
+        for case in cases:
+            result = case.measure(repeat)
+            results.append(result)
+            print(f"{result['name']:<30} {result['median_ms']:>10.3f} ms  {result['us_per_op']:>10.3f} us/{result['unit']}")
+    return {"created": datetime.now(timezone.utc).isoformat(timespec="seconds"), "commit": git_commit(),
+            "python": platform.python_version(), "platform": platform.platform(), "results": results}
+
+
+def git_commit():
+    """
+    Returns the commit of the working tree, or None outside of a git repository.
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=project_dir, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(report, baseline, tolerance=0.25):
+    """
+    Compares the time per operation of every case with a previous report.
+
+    Parameters
+    ----------
+    report : dict
+        The report of this run.
+    baseline : dict
+        A report of an earlier run, for example of the last release.
+    tolerance : float
+        How much slower a case can be before it counts as a regression, 0.25 is 25%.
+
+    Returns
+    -------
+    list of dict
+        One comparison per case found in both reports, with its ratio and whether it regressed.
+    """
+    previous = {result["name"]: result for result in baseline["results"]}
+    comparisons = []
+    for result in report["results"]:
+        if result["name"] not in previous:
+            continue
+        ratio = result["us_per_op"] / previous[result["name"]]["us_per_op"]
+        comparisons.append({"name": result["name"], "baseline_us_per_op": previous[result["name"]]["us_per_op"],
+                            "us_per_op": result["us_per_op"], "ratio": round(ratio, 3),
+                            "regression": ratio > 1 + tolerance})
+    return comparisons
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Runs the offline benchmark suite and saves its results as JSON.")
+    parser.add_argument("--output", default="output/benchmark_results.json", help="Where the results are written.")
+    parser.add_argument("--baseline", help="A results file of an earlier run to compare with.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before a regression.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs of every case.")
+    args = parser.parse_args(argv)
+
+    # The export and the downloads log every call, which would bury the results
+    logger.setLevel(logging.WARNING)
+    report = run_suite(repeat=args.repeat)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            report["comparison"] = compare(report, json.load(f), args.tolerance)
+        for comparison in report["comparison"]:
+            flag = "REGRESSION" if comparison["regression"] else "ok"
+            print(f"{comparison['name']:<30} x{comparison['ratio']:<6.3f} {flag}")
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+    return 1 if any(comparison["regression"] for comparison in report.get("comparison", [])) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
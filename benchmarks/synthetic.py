@@ -0,0 +1,137 @@
+# Standard Python library imports
+import os
+import random
+import sys
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from testing.fixture_server import read_fixture
+
+PROMO_TEMPLATE = """
+      <li>
+        <ps-promo class="promo promo-position-large promo-medium-size">
+          <div class="promo-wrapper">
+            <div class="promo-media">
+              <a class="link promo-placeholder" href="https://www.latimes.com/sports/story/news-{index}">
+                <picture>
+                  <source type="image/webp" srcset="https://ca-times.brightspotcdn.com/dims4/default/{index}.webp 320w, https://ca-times.brightspotcdn.com/dims4/default/{index}-2x.webp 640w">
+                  <img class="image" alt="Picture of the news {index}" src="https://ca-times.brightspotcdn.com/dims4/default/{index}.jpg" width="840" height="560">
+                </picture>
+              </a>
+            </div>
+            <div class="promo-content">
+              <div class="promo-category"><a class="link" href="https://www.latimes.com/sports">Sports</a></div>
+              <div class="promo-title-container">
+                <h3 class="promo-title"><a class="link" href="https://www.latimes.com/sports/story/news-{index}">Messi and the news number {index} &amp; more</a></h3>
+              </div>
+              <p class="promo-description">A description of the news {index}, which cost $1{index}.5 million, with Messi in it.</p>
+              <p class="promo-timestamp" data-timestamp="1721000000000">{timestamp}</p>
+            </div>
+          </div>
+        </ps-promo>
+      </li>"""
+
+TIMESTAMPS = ["3 hours ago", "45 minutes ago", "1 day ago", "June 3, 2024", "Sept. 5, 2023", "Jan. 1, 2020"]
+
+PADDING_TEMPLATE = """
+  <nav class="nav-menu"><ul>{links}</ul></nav>
+  <script type="application/ld+json">{{"@context": "https://schema.org", "items": [{items}]}}</script>"""
+
+
+def make_results_page(num_promos=10, padding_blocks=40):
+    """
+    Builds a whole search results page in the shape of the real one: a results container with
+    'num_promos' news, plus 'padding_blocks' blocks of menus and scripts around it (the real page is
+    mostly markup we do not read).
+
+    Returns
+    -------
+    str
+        The HTML of the page.
+    """
+    promos = "".join(
+        PROMO_TEMPLATE.format(index=index, timestamp=TIMESTAMPS[index % len(TIMESTAMPS)])
+        for index in range(1, num_promos + 1)
+    )
+    links = "".join(f'<li><a class="link" href="https://www.latimes.com/section-{i}">Section {i}</a></li>' for i in range(40))
+    items = ",".join(f'{{"name": "item {i}", "url": "https://www.latimes.com/item-{i}"}}' for i in range(40))
+    padding = PADDING_TEMPLATE.format(links=links, items=items) * padding_blocks
+
+    # We take the real page structure (header, filters, pagination) from the saved fixture
+    page = read_fixture("search_page_1.html")
+    start = page.index('<ul class="search-results-module-results-menu">')
+    end = page.index("</ul>", start)
+    page = page[:start] + '<ul class="search-results-module-results-menu">' + promos + "\n    " + page[end:]
+    return page.replace("<body>", "<body>" + padding, 1).replace("</body>", padding + "</body>", 1)
+
+
+def make_news_data(num_items, base_url="https://ca-times.brightspotcdn.com/dims4/default/"):
+    """
+    Builds a synthetic 'news_data' list where every item is of interest and has an image.
+
+    Returns
+    -------
+    list of dict
+        The same dictionaries that the scrapers return.
+    """
+    return list(iter_news_data(num_items, base_url))
+
+
+def iter_news_data(num_items, base_url="https://ca-times.brightspotcdn.com/dims4/default/"):
+    """
+    Yields the news of 'make_news_data()' one by one, as a scraper produces them.
+
+    Yields
+    ------
+    dict
+        The same dictionaries that the scrapers return.
+    """
+    return (
+        {
+            "title": f"Messi and the news number {index}",
+            "date": TIMESTAMPS[index % 3],
+            "description": f"A description of the news {index}, which cost ${index}.5 million, with Messi in it.",
+            "image_url": f"{base_url}image{index}.jpg",
+            "image_alt": f"Picture of the news {index}",
+            "phrase_matches": 2,
+            "contain_money": True,
+            "money_amounts": [{"amount": index * 1e6 + 5e5, "text": f"${index}.5 million", "span": (0, 0)}],
+            "news_name": f"news{index}",
+            "image_path": f"output/news{index}.jpg",
+            "excel_filename": f"output/excel_files/news{index}.xlsx",
+            "bool": True,
+        }
+        for index in range(1, num_items + 1)
+    )
+
+
+MONTH_SPELLINGS = ["Jan.", "Feb.", "March", "April", "May", "June", "July", "Aug.", "Sept.", "Oct.", "Nov.", "Dec."]
+RELATIVE_UNITS = ["seconds", "minutes", "hours", "days", "1 hour", "1 day"]
+
+
+def make_timestamps(num_items, seed=0):
+    """
+    Builds a list of timestamps as the site writes them: relative ("3 hours ago"),
+    absolute ("Sept. 5, 2023") and a few that are not dates at all.
+
+    Returns
+    -------
+    list of str
+        The timestamps, the same seed always gives the same list.
+    """
+    rng = random.Random(seed)
+    timestamps = []
+    for _ in range(num_items):
+        kind = rng.random()
+        if kind < 0.45:
+            unit = rng.choice(RELATIVE_UNITS)
+            timestamps.append(f"{unit} ago" if unit[0].isdigit() else f"{rng.randint(2, 59)} {unit} ago")
+        elif kind < 0.97:
+            timestamps.append(f"{rng.choice(MONTH_SPELLINGS)} {rng.randint(1, 28)}, {rng.randint(2000, 2024)}")
+        else:
+            timestamps.append(rng.choice(["N/A", "Updated", ""]))
+    return timestamps
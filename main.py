@@ -4,6 +4,7 @@ from robocorp.tasks import task
 # Local module imports
 from news_browser.browser import NewsBrowser
 from news_browser.my_logger import logger
+from news_browser.sharding import ShardSupervisor
 
 @task
 def main():
@@ -15,5 +16,25 @@ def main():
     news_browser.run()
     logger.info("*" * 40)
 
+@task
+def batch():
+    logger.info("*" * 40)
+    logger.info("Starting the NewsBrowser Class")
+    news_browser = NewsBrowser()
+
+    logger.info("Running the process for every input work item")
+    news_browser.run_batch()
+    logger.info("*" * 40)
+
+@task
+def sharded():
+    logger.info("*" * 40)
+    logger.info("Starting the ShardSupervisor Class")
+    supervisor = ShardSupervisor()
+
+    logger.info("Running the process for every input work item in parallel browsers")
+    supervisor.run_work_items()
+    logger.info("*" * 40)
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,216 @@
+# Standard Python library imports
+import hashlib
+import os
+import sqlite3
+import time
+from datetime import date, datetime
+
+# Local module imports
+from .dates import parse_date, parse_timestamp
+from .my_logger import logger
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    search_phrase TEXT NOT NULL,
+    news_category TEXT NOT NULL,
+    article_key TEXT NOT NULL,
+    month_ordinal INTEGER NOT NULL,
+    published TEXT,
+    title TEXT,
+    date TEXT,
+    description TEXT,
+    image_url TEXT,
+    image_alt TEXT,
+    article_url TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (search_phrase, news_category, article_key)
+);
+CREATE INDEX IF NOT EXISTS articles_by_month ON articles (search_phrase, news_category, month_ordinal);
+"""
+
+# The raw fields of a news, as returned by 'iter_promos()'
+PROMO_FIELDS = ["title", "date", "description", "image_url", "image_alt", "article_url"]
+
+
+class ArticleStore:
+    """
+    A local SQLite store of the news found by every search, for incremental crawls.
+
+    Every news is stored once per search phrase and category, keyed by its article URL (or by a hash
+    of its title and date when it has no link), with its month ordinal so the news of the months of
+    interest of a search are read with the (search_phrase, news_category, month_ordinal) index.
+
+    Parameters
+    ----------
+    path : str
+        The SQLite database file.
+
+    Methods
+    -------
+    article_key(promo)
+        Returns the key of a news.
+    known_keys(search_phrase, news_category, keys)
+        Returns which keys are already stored for a search.
+    add(search_phrase, news_category, entries, now)
+        Stores (or refreshes) news of a search.
+    articles(search_phrase, news_category, window, exclude)
+        Returns the stored news of a search in the months of a window.
+    close()
+        Closes the database.
+    """
+
+    def __init__(self, path="cache/articles.sqlite3"):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # The workers of a sharded run may write at the same time, so we wait for the lock, and with the
+        # write-ahead log their reads are never blocked by a write
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+
+    @staticmethod
+    def _search(search_phrase, news_category):
+        # The site compares both case insensitively, so do we
+        return search_phrase.strip().lower(), news_category.strip().lower()
+
+    @staticmethod
+    def article_key(promo):
+        """
+        Returns the key of a news: its article URL, or a hash of its title and image if it has no link. The
+        date is left out, a relative date like "3 hours ago" changes from one run to the next.
+
+        Parameters
+        ----------
+        promo : dict
+            The raw fields of the news.
+
+        Returns
+        -------
+        str
+            The key.
+        """
+        article_url = promo.get("article_url")
+        if article_url and article_url != "N/A":
+            return article_url
+        digest = hashlib.sha1(f"{promo['title']}|{promo.get('image_url', 'N/A')}".encode("utf-8")).hexdigest()
+        return f"sha1:{digest}"
+
+    def known_keys(self, search_phrase, news_category, keys):
+        """
+        Returns which keys are already stored for a search.
+
+        Parameters
+        ----------
+        search_phrase : str
+            The search phrase.
+        news_category : str
+            The category of the search.
+        keys : list of str
+            The keys to look for, for example those of the news of a page.
+
+        Returns
+        -------
+        set of str
+            The keys found in the store.
+        """
+        if not keys:
+            return set()
+        placeholders = ",".join("?" * len(keys))
+        rows = self.connection.execute(
+            f"SELECT article_key FROM articles WHERE search_phrase = ? AND news_category = ? "
+            f"AND article_key IN ({placeholders})",
+            (*self._search(search_phrase, news_category), *keys),
+        )
+        return {row[0] for row in rows}
+
+    def add(self, search_phrase, news_category, entries, now=None):
+        """
+        Stores the news of a search, the news already stored are refreshed.
+
+        Parameters
+        ----------
+        search_phrase : str
+            The search phrase.
+        news_category : str
+            The category of the search.
+        entries : list of tuple of (str, dict, int)
+            The key, the raw fields and the month ordinal of every news.
+        now : datetime, optional
+            The time of the scraping, relative dates ("3 hours ago") are resolved with it.
+
+        Returns
+        -------
+        None
+        """
+        now = now or datetime.now()
+        seen = time.time()
+        phrase, category = self._search(search_phrase, news_category)
+        rows = []
+        for key, promo, ordinal in entries:
+            published = parse_date(promo["date"], now)
+            rows.append((phrase, category, key, ordinal, published.isoformat() if published else None,
+                         *(promo.get(field, "N/A") for field in PROMO_FIELDS), seen, seen))
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO articles (search_phrase, news_category, article_key, month_ordinal, published, title, "
+                "date, description, image_url, image_alt, article_url, first_seen, last_seen) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (search_phrase, news_category, article_key) DO UPDATE SET "
+                "month_ordinal = excluded.month_ordinal, published = excluded.published, title = excluded.title, "
+                "date = excluded.date, description = excluded.description, image_url = excluded.image_url, "
+                "image_alt = excluded.image_alt, article_url = excluded.article_url, last_seen = excluded.last_seen",
+                rows,
+            )
+
+    def articles(self, search_phrase, news_category, window, exclude=()):
+        """
+        Returns the stored news of a search whose month is in a window, the newest first.
+
+        Parameters
+        ----------
+        search_phrase : str
+            The search phrase.
+        news_category : str
+            The category of the search.
+        window : DateWindow
+            The months of interest.
+        exclude : collection of str
+            Keys left out, for example those of the news just scraped.
+
+        Returns
+        -------
+        list of tuple of (str, dict, int)
+            The key, the raw fields and the month ordinal of every news. A relative date stored by an
+            earlier run is replaced by the day it was resolved to.
+        """
+        rows = self.connection.execute(
+            "SELECT article_key, month_ordinal, published, title, date, description, image_url, image_alt, "
+            "article_url FROM articles WHERE search_phrase = ? AND news_category = ? "
+            "AND month_ordinal BETWEEN ? AND ? ORDER BY published DESC, first_seen, rowid",
+            (*self._search(search_phrase, news_category), window.first, window.last),
+        )
+        articles = []
+        for key, ordinal, published, *fields in rows:
+            if key in exclude:
+                continue
+            promo = dict(zip(PROMO_FIELDS, fields))
+            if published and not isinstance(parse_timestamp(promo["date"]), date):
+                day = date.fromisoformat(published)
+                promo["date"] = f"{day:%B} {day.day}, {day.year}"
+            articles.append((key, promo, ordinal))
+        return articles
+
+    def close(self):
+        """
+        Closes the database.
+
+        Returns
+        -------
+        None
+        """
+        self.connection.close()
+        logger.info(f"Article store {self.path} closed")
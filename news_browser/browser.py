@@ -3,6 +3,7 @@ import json
 import os
 import time
 from datetime import datetime
+from functools import partial
 
 # Third party libraries imports
 from dateutil.relativedelta import relativedelta
@@ -10,17 +11,29 @@ from RPA.Browser.Selenium import Selenium
 from RPA.Robocorp.WorkItems import WorkItems
 
 # Local module imports
+from . import tracing
+from .article_store import ArticleStore
+from .dates import DateWindow
 from .excel_creator import ExcelCreator
+from .http_scraper import HttpNewsScraper
+from .image_cache import ImageCache
 from .image_downloader import ImageDownloader
 from .my_logger import logger
 from .news_scraper import NewsScraper
+from .pipeline import NewsPipeline
+from .recording import ReplayImageDownloader, ReplayScraper, SessionArchive, SessionRecorder
+from .sinks import open_sinks, parse_formats
+from .topic_cache import TopicCache
+from .tracing import traced
+from .waits import PageWaiter
 from .utils import (
                     format_current_date,
                     convert_date_to_mm_aaaa,
                     word_counter,
                     does_it_contain_money,
                     calculate_months_to_consider,
-                    validate_input
+                    validate_input,
+                    clean_text
 )
 
 
@@ -34,18 +47,50 @@ class NewsBrowser:
         Opens the news site from a URL
     run()
         Initializes the web browser and runs the news scraper.
+    run_search(variables)
+        Scrapes and exports the search of the input work item.
+    run_batch()
+        Runs the news scraper for every input work item in a single browser session.
+    scrape_and_export(news_scraper, variables)
+        Scrapes a search while its images are downloaded and its files are written.
     """
 
-    def __init__(self):
+    # The home page of the news site, where every search starts
+    news_url = "https://www.latimes.com/"
+
+    def __init__(self, load_work_items=True, headless=False, profile_dir=None, cache_dir="cache/"):
         """
         Initializes the NewsBrowser with a headless Chrome WebDriver and configuration settings.
+
+        Parameters
+        ----------
+        load_work_items : bool
+            Whether the input work item is loaded, the workers of a sharded run receive their searches instead.
+        headless : bool
+            Whether Chrome runs without a window.
+        profile_dir : str, optional
+            A Chrome profile directory of its own, so several browsers can run at the same time.
+        cache_dir : str
+            Directory of the topic cache, the image cache and the article store. The workers of a sharded
+            run share it, the caches merge what every process saves.
         """
         self.browser = Selenium()
-        self.workitems = WorkItems()
-        self.workitems.get_input_work_item()  # Load the input work item
-        self.news_scraper = NewsScraper(self.browser, self.workitems)
+        self.waiter = PageWaiter(self.browser)
+        self.headless = headless
+        self.profile_dir = profile_dir
+        self.cache_dir = cache_dir
+        self.workitems = None
+        self.output_files = []
+        self.article_store = None
+        self.recorder = None  # The SessionRecorder of the current search, with 'record_session'
+        self.replay = None  # The SessionArchive replayed by the current search, with 'replay_session'
+        if load_work_items:
+            self.workitems = WorkItems()
+            self.workitems.get_input_work_item()  # Load the input work item
+        self.news_scraper = NewsScraper(self.browser, self.workitems, self.waiter)
         logger.info(f"Website Configurations Loaded")
 
+    @traced("open_news_site")
     def open_news_site(self, url):
         """
         Opens the news site with the specified URL and search phrase.
@@ -60,84 +105,577 @@ class NewsBrowser:
         None
         """
         logger.info("Starting 'open_news_site' function")
-        self.browser.open_available_browser(url, headless=False,
-                                            options={"--disable-gpu", "--disable-software-rasterizer"}
+        # Every browser of a sharded run has its own profile, so they do not lock each other's profile
+        profile = {"use_profile": True, "profile_path": self.profile_dir} if self.profile_dir else {}
+        self.browser.open_available_browser(url, headless=self.headless,
+                                            options={"--disable-gpu", "--disable-software-rasterizer"},
+                                            **profile
         )
         logger.info(f"Opening Website")
-        time.sleep(10)
 
-    def run(self):
+        # Instead of sleeping, we wait for the page to load and for the search button to be usable
+        self.waiter.page_ready("news site loaded")
+        self.waiter.element_visible('css:button[data-element="search-button"]', "search button visible")
+
+    def configure(self, variables, backend=None):
         """
-        Initializes the web browser, runs the news scraper, downloads images, and creates an Excel file.
+        Applies the optional settings of a work item to the scraper and chooses the backend.
+
+        Parameters
+        ----------
+        variables : dict
+            The variables of the work item.
+        backend : str, optional
+            "browser" or "http", by default the 'scraper_backend' of the work item.
+
+        Returns
+        -------
+        NewsScraper or HttpNewsScraper
+            The scraper of the chosen backend.
+        """
+        extraction_engine = variables.get("extraction_engine")
+        self.news_scraper.parallel_pages = variables.get("parallel_pages", 1)
+        self.news_scraper.engine = extraction_engine
+        self.news_scraper.extraction_mode = variables.get("extraction_mode", "html")
+        topic_cache = TopicCache(os.path.join(self.cache_dir, "topics.json"),
+                                 ttl=variables.get("topic_cache_ttl", 24 * 60 * 60)) \
+            if variables.get("topic_cache", True) else None
+        self.news_scraper.topic_cache = topic_cache
+
+        # The article store is opened once and shared by every work item of the session
+        incremental = variables.get("incremental", False)
+        if (incremental or variables.get("article_store", False)) and self.article_store is None:
+            self.article_store = ArticleStore(os.path.join(self.cache_dir, "articles.sqlite3"))
+        article_store = self.article_store if incremental or variables.get("article_store", False) else None
+        self.news_scraper.article_store = article_store
+        self.news_scraper.incremental = incremental
+
+        # With 'replay_session' the search is replayed from a recorded session, without browser nor network
+        if self.replay is not None:
+            self.replay.close()
+        self.replay = SessionArchive(variables["replay_session"]) if variables.get("replay_session") else None
+        if self.replay is not None:
+            logger.info(f"Replaying the session recorded in {self.replay.path}, no browser will be opened")
+            return ReplayScraper(self.replay, engine=extraction_engine)
+
+        # With the "http" backend there is no browser at all, the search pages are requested directly
+        backend = backend or variables.get("scraper_backend", "browser")
+        if backend == "http":
+            logger.info("Using the HTTP scraper backend, no browser will be opened")
+            return HttpNewsScraper(self.news_url, engine=extraction_engine, topic_cache=topic_cache,
+                                   article_store=article_store, incremental=incremental)
+        return self.news_scraper
+
+    @staticmethod
+    def close_scraper(news_scraper):
+        """
+        Closes the HTTP session of the scraper of a search, the browser scraper is kept for the whole session.
 
         Returns
         -------
         None
         """
-        logger.info("Starting 'run' function")
+        if isinstance(news_scraper, HttpNewsScraper):
+            news_scraper.close()
 
-        # Obtaining WorkItem Data
-        variables = self.workitems.get_work_item_variables()
+    def close_article_store(self):
+        """
+        Closes the article store of the session, if it was opened, so its journal is written to the database.
+
+        Returns
+        -------
+        None
+        """
+        if self.article_store is not None:
+            self.article_store.close()
+            self.article_store = None
+            self.news_scraper.article_store = None
+
+    def return_to_search(self):
+        """
+        Takes the browser back to the home page of the site, where a new search can start.
+
+        Returns
+        -------
+        None
+        """
+        self.browser.go_to(self.news_url)
+        self.waiter.page_ready("news site loaded")
+        self.waiter.element_visible('css:button[data-element="search-button"]', "search button visible")
+
+    def scrape(self, news_scraper, search_phrase, news_category, num_months):
+        """
+        Runs the scraper, retrying when something fails.
+
+        Returns
+        -------
+        list of dict or None
+            The news data, or None if every retry failed.
+        """
+        return self.with_retries(news_scraper.scrap_news, search_phrase, news_category, num_months)
+
+    def with_retries(self, function, *args):
+        """
+        Calls 'function(*args)', retrying when something fails.
+
+        Returns
+        -------
+        object or None
+            What the function returned, or None if every retry failed.
+        """
+        # We will have a maximum of 3 retries, in my experience when scraping, more than 5 retries
+        # is a bit too much, because something must be wrong in the code or in the site
+        # After the maximum tries it could be nice to send an email or any way of notification
+        max_retries = 5
+        retries = 0
+
+        # Here is where we try to open the site and make all the process
+        while retries < max_retries:
+            try:
+                return function(*args)
+            except Exception as e:  # Catch all exceptions for simplicity, you may want to handle specific ones
+                retries += 1
+                logger.warning(f"An exception occurred: {e}. Retry {retries}/{max_retries}")
+
+        logger.error("Max retries reached. Exiting.")
+        return None
+
+    def export(self, news_data, variables, output_dir="output/", create_excel=True):
+        """
+        Downloads the necessary images and creates the Excel file of the news data.
+
+        Parameters
+        ----------
+        news_data : list of dict
+            The news data returned by the scraper.
+        variables : dict
+            The variables of the work item.
+        output_dir : str
+            Directory of the images and the Excel file.
+        create_excel : bool
+            If False only the images are downloaded.
+
+        Returns
+        -------
+        str or None
+            The path of the Excel file, or None if there were no news of interest or no Excel was asked.
+            The files of the other output formats are left in 'self.output_files'.
+        """
+        self.output_files = []
+        image_downloader = self.image_downloader(variables, output_dir)
+
+        # The news to export are those whose month is in the months of interest
+        window = self.date_window(variables.get("num_months"))
+        image_downloader.download_images(news_data, window)
+        image_downloader.close()
+        if not create_excel:
+            return None
+
+        # The other output formats are written in the same pass as the Excel file
+        sinks = open_sinks(variables.get("output_formats"), output_dir, variables.get("search_phrase"),
+                           variables.get("news_category"), variables.get("num_months"))
+        excel_creator = ExcelCreator(output_dir)
+        excel_file = excel_creator.create_excel(news_data, variables.get("search_phrase"),
+                                                variables.get("news_category"), variables.get("num_months"), window,
+                                                thumbnails=variables.get("excel_thumbnails", False), sinks=sinks,
+                                                image_digests=image_downloader.digests)
+        self.output_files = [sink.path for sink in sinks if sink.path]
+        return excel_file
+
+    def image_downloader(self, variables, output_dir):
+        """
+        Creates the ImageDownloader (and its image cache) of a work item, the replayed sessions take
+        their images from their archive.
+        """
+        if self.replay is not None:
+            return ReplayImageDownloader(self.replay, max_workers=variables.get("download_workers", 8),
+                                         output_dir=output_dir)
+        image_cache = ImageCache(os.path.join(self.cache_dir, "images"),
+                                 max_bytes=variables.get("image_cache_max_bytes", 500 * 1024 * 1024)) \
+            if variables.get("image_cache", True) else None
+        return ImageDownloader(max_workers=variables.get("download_workers", 8),
+                               max_bytes=variables.get("image_max_bytes", 10 * 1024 * 1024),
+                               cache=image_cache, output_dir=output_dir, recorder=self.recorder)
+
+    def date_window(self, num_months):
+        """
+        Returns the months of interest of a search, those of the time of the recording for a replayed session.
+        """
+        return self.replay.window(num_months) if self.replay is not None else DateWindow(num_months)
+
+    def start_recording(self, news_scraper, variables, output_dir):
+        """
+        Gives the scraper a SessionRecorder if the work item has 'record_session', or takes it away.
+        The session is recorded in 'session.zip' of the output directory.
+
+        Returns
+        -------
+        None
+        """
+        record = variables.get("record_session", False) and self.replay is None
+        self.recorder = SessionRecorder(os.path.join(output_dir, "session.zip")) if record else None
+        news_scraper.recorder = self.recorder
+
+    def finish_recording(self):
+        """
+        Finishes the archive of the recorded session, if any.
+
+        Returns
+        -------
+        str or None
+            The path of the archive, or None if the search was not recorded.
+        """
+        recorder, self.recorder = self.recorder, None
+        return recorder.close() if recorder is not None else None
+
+    def scrape_and_export(self, news_scraper, variables, output_dir="output/", create_excel=True):
+        """
+        Scrapes a search while its images are downloaded and its files are written, with the NewsPipeline,
+        retrying when something fails.
+
+        Parameters
+        ----------
+        news_scraper : NewsScraper or HttpNewsScraper
+            The scraper of the search.
+        variables : dict
+            The variables of the work item.
+        output_dir : str
+            Directory of the images and the Excel file.
+        create_excel : bool
+            If False only the images are downloaded.
+
+        Returns
+        -------
+        tuple of (list of dict or None, str or None, float)
+            The news data (None if every retry failed), the path of the Excel file and the
+            'time.perf_counter()' when the last page was scraped.
+        """
+        result = self.with_retries(self.stream_search, news_scraper, variables, output_dir, create_excel)
+        return result if result is not None else (None, None, time.perf_counter())
+
+    def stream_search(self, news_scraper, variables, output_dir, create_excel):
+        """
+        A single try of 'scrape_and_export()'.
+        """
+        self.output_files = []
         search_phrase = variables.get("search_phrase")
         news_category = variables.get("news_category")
         num_months = variables.get("num_months")
+        window = self.date_window(num_months)
+        image_downloader = self.image_downloader(variables, output_dir)
+
+        # The Excel file and the other output formats are written by the export thread of the pipeline
+        export = None
+        sinks = []
+        if create_excel:
+            sinks = open_sinks(variables.get("output_formats"), output_dir, search_phrase, news_category, num_months)
+            export = partial(ExcelCreator(output_dir).create_excel, search_phrase=search_phrase,
+                             news_category=news_category, num_months=num_months, window=window,
+                             thumbnails=variables.get("excel_thumbnails", False), sinks=sinks,
+                             image_digests=image_downloader.digests)
+
+        pipeline = NewsPipeline(image_downloader, window, queue_size=variables.get("pipeline_queue_size", 64))
+        try:
+            news_data, excel_file = pipeline.run(news_scraper.iter_news(search_phrase, news_category, num_months),
+                                                 export)
+        finally:
+            image_downloader.close()
+        self.output_files = [sink.path for sink in sinks if sink.path]
+        return news_data, excel_file, pipeline.scraped_at
+
+    def read_input(self):
+        """
+        Reads and validates the search parameters of the current input work item.
+
+        Returns
+        -------
+        dict or None
+            The variables of the work item, or None if they are not valid.
+        """
+        # Obtaining WorkItem Data
+        variables = self.workitems.get_work_item_variables()
 
         # if os.name == "nt" or os.name =="posix":
-        #     search_phrase = "Trump/"
-        #     news_category = "World & Nation"
-        #     num_months = 1
+        #     variables = {"search_phrase": "Trump/", "news_category": "World & Nation", "num_months": 1}
+
+        return variables if self.check_input(variables) and self.check_output_formats(variables) else None
+
+    def check_input(self, variables):
+        """
+        Logs and validates the search parameters of a work item.
 
+        Returns
+        -------
+        bool
+            True if the search parameters are valid.
+        """
         input_data_to_print = {
-            "search_phrase": search_phrase,
-            "news_category": news_category,
-            "num_months": num_months
+            "search_phrase": variables.get("search_phrase"),
+            "news_category": variables.get("news_category"),
+            "num_months": variables.get("num_months")
         }
         logger.info(json.dumps(input_data_to_print, indent=4, sort_keys=False))
 
         # We validate the input data
-        is_input_correct = validate_input(input_data_to_print)
-        if is_input_correct:
+        num_months = input_data_to_print["num_months"]
+        if validate_input(input_data_to_print):
             logger.info(f"The value num_months:'{num_months}' is a correct input")
-        else:
-            logger.warning(f"The value num_months:'{num_months}' is NOT a correct input")
+            return True
+        logger.warning(f"The value num_months:'{num_months}' is NOT a correct input")
+        return False
+
+    def check_output_formats(self, variables):
+        """
+        Validates the optional 'output_formats' variable of a work item.
+
+        Returns
+        -------
+        bool
+            True if every format is known and can be written.
+        """
+        try:
+            parse_formats(variables.get("output_formats"))
+        except (ValueError, ImportError) as e:
+            logger.warning(f"The value output_formats:'{variables.get('output_formats')}' is NOT a correct input: {e}")
+            return False
+        return True
+
+    def run(self):
+        """
+        Initializes the web browser, runs the news scraper, downloads images, and creates an Excel file.
+
+        Returns
+        -------
+        None
+        """
+        logger.info("Starting 'run' function")
+
+        variables = self.read_input()
+        if variables is None:
             return
-        
+
+        # With 'trace', every stage of the run is timed and written to 'output/trace.json'
+        if variables.get("trace", False):
+            tracing.enable()
+        try:
+            self.run_search(variables)
+        finally:
+            self.close_article_store()
+            self.finish_trace()
+
+    def run_search(self, variables):
+        """
+        Scrapes the search of the input work item, downloads its images and creates its Excel file.
+
+        Parameters
+        ----------
+        variables : dict
+            The validated variables of the work item.
+
+        Returns
+        -------
+        None
+        """
         # Now, after input validation, we start the process
-        news_url = "https://www.latimes.com/"
-        self.open_news_site(news_url)
-        
-        # We will have a maximum of 3 retries, in my experience when scraping, more than 5 retries
-        # is a bit too much, because something must be wrong in the code or in the site
-        # After the maximum tries it could be nice to send an email or any way of notification
-        max_retries = 5
-        retries = 0
-        success = False
+        news_scraper = self.configure(variables)
+        use_browser = news_scraper is self.news_scraper
+        self.start_recording(news_scraper, variables, "output/")
+        if use_browser:
+            self.open_news_site(self.news_url)
 
-        # Here is where we try to open the site and make all the process
-        while retries < max_retries and not success:
-            try:
-                news_data = self.news_scraper.scrap_news(search_phrase, news_category, num_months)
-                success = True  # If no exception, mark success as True
-            except Exception as e:  # Catch all exceptions for simplicity, you may want to handle specific ones
-                retries += 1
-                logger.warning(f"An exception occurred: {e}. Retry {retries}/{max_retries}")
-                if retries == max_retries:
-                    logger.error("Max retries reached. Exiting.")
-                    self.browser.close_all_browsers()
-                    return  # Exit if max retries reached
+        # With 'streaming', the images are downloaded and the Excel file written while the pages are scraped
+        streaming = variables.get("streaming", False)
+        try:
+            if streaming:
+                news_data, _, _ = self.scrape_and_export(news_scraper, variables)
+            else:
+                news_data = self.scrape(news_scraper, variables.get("search_phrase"),
+                                        variables.get("news_category"), variables.get("num_months"))
+        finally:
+            self.close_scraper(news_scraper)
 
-        # Finally we quit the open browsers
-        self.browser.close_all_browsers()
+        # Finally we quit the open browsers and report how long we waited for the site
+        if use_browser:
+            self.browser.close_all_browsers()
+            self.waiter.log_report()
 
         # If we succeded opening the site and scraping all the data needed
         # Then based on the news_data list of diccionaries we:
         #   - Download the Necessary Images
         #   - Create the Necessary Excels
-        if success and news_data:
-            image_downloader = ImageDownloader()
-            image_downloader.download_images(news_data)
-            time.sleep(1)
-
-            excel_creator = ExcelCreator()
-            excel_creator.create_excel(news_data, search_phrase, news_category, num_months)
-            time.sleep(1)
+        if news_data and not streaming:
+            self.export(news_data, variables)
+        self.finish_recording()
+
+    def run_batch(self):
+        """
+        Processes every input work item in a single browser session.
+
+        The browser is opened once, and after every search it goes back to the home page for the next one.
+        The images and the Excel file of every work item are saved in their own directory of 'output/',
+        and an output work item is created for every input work item with its results and timings.
+
+        Returns
+        -------
+        list of dict
+            The report of every work item: search, status, number of news and seconds of every step.
+        """
+        logger.info("Starting 'run_batch' function")
+
+        # The backend (and the tracing) is chosen by the first work item, since all of them share the same session
+        variables = self.workitems.get_work_item_variables()
+        backend = variables.get("scraper_backend", "browser")
+        use_browser = backend != "http" and not variables.get("replay_session")
+        if variables.get("trace", False):
+            tracing.enable()
+        if use_browser:
+            self.open_news_site(self.news_url)
+
+        try:
+            report = self.workitems.for_each_input_work_item(self.process_work_item, backend)
+        finally:
+            if use_browser:
+                self.browser.close_all_browsers()
+                self.waiter.log_report()
+            self.close_article_store()
+            self.finish_trace()
+
+        self.log_batch_report(report)
+        return report
+
+    def process_work_item(self, backend):
+        """
+        Scrapes and exports the news of the current input work item, and creates its output work item.
+
+        Parameters
+        ----------
+        backend : str
+            The scraper backend of the session, with "browser" it goes back to the home page after the search.
+
+        Returns
+        -------
+        dict
+            The report of the work item.
+        """
+        item_report, _, files = self.process_query(self.workitems.get_work_item_variables(), backend)
+        self.workitems.create_output_work_item(variables=item_report, files=files, save=True)
+        return item_report
+
+    @staticmethod
+    def search_dir(output_root, search_phrase, news_category, num_months):
+        """
+        Returns the directory of the images and the Excel file of a search, for example 'output/Messi_Sports_1'.
+        """
+        return os.path.join(output_root, f"{clean_text(search_phrase)}_{clean_text(news_category)}_{num_months}")
+
+    def process_query(self, variables, backend, output_root="output", create_excel=True):
+        """
+        Scrapes and exports the news of a single search.
+
+        Parameters
+        ----------
+        variables : dict
+            The variables of the work item (search phrase, category, months and optional settings).
+        backend : str
+            The scraper backend of the session, with "browser" it goes back to the home page after the search.
+        output_root : str
+            Directory where the directory of the search is created.
+        create_excel : bool
+            If False only the images are downloaded, and the Excel file is left to the caller.
+
+        Returns
+        -------
+        tuple of (dict, list of dict or None, list of str)
+            The report of the search, its news data and the files created.
+        """
+        start = time.perf_counter()
+        valid = self.check_input(variables) and self.check_output_formats(variables)
+        search_phrase = variables.get("search_phrase")
+        news_category = variables.get("news_category")
+        num_months = variables.get("num_months")
+        item_report = {"search_phrase": search_phrase, "news_category": news_category, "num_months": num_months,
+                       "status": "invalid", "news": 0, "excel_file": None,
+                       "scrape_seconds": 0.0, "export_seconds": 0.0, "total_seconds": 0.0}
+        news_data = None
+        files = []
+
+        if valid:
+            # The optional settings of every work item are applied, the backend stays the one of the session
+            news_scraper = self.configure(variables, backend)
+
+            # Every search has its own directory, so the files of one search do not replace the others
+            output_dir = self.search_dir(output_root, search_phrase, news_category, num_months)
+            self.start_recording(news_scraper, variables, output_dir)
+            try:
+                if variables.get("streaming", False):
+                    # The export overlaps with the scraping, its seconds are those left after the last page
+                    news_data, excel_file, scraped = self.scrape_and_export(news_scraper, variables, output_dir,
+                                                                            create_excel)
+                else:
+                    news_data = self.scrape(news_scraper, search_phrase, news_category, num_months)
+                    scraped = time.perf_counter()
+                    excel_file = self.export(news_data, variables, output_dir, create_excel) if news_data else None
+            finally:
+                self.close_scraper(news_scraper)
+            item_report["scrape_seconds"] = scraped - start
+            item_report["status"] = "failed" if news_data is None else "done"
+            session_file = self.finish_recording()
+
+            if news_data:
+                item_report["news"] = sum(1 for item in news_data if item["bool"])
+                item_report["excel_file"] = excel_file
+                item_report["output_files"] = list(self.output_files)
+                files = [excel_file] if excel_file else []
+                files += self.output_files
+                # Only the images written in the directory of this search, never a file of another search
+                search_dir = os.path.abspath(output_dir)
+                files += [item["image_path"] for item in news_data if item["image_path"] != "N/A"
+                          and os.path.dirname(os.path.abspath(item["image_path"])) == search_dir
+                          and os.path.exists(item["image_path"])]
+                item_report["export_seconds"] = time.perf_counter() - scraped
+            if session_file:
+                item_report["session_file"] = session_file
+                files.append(session_file)
+
+            # The next search starts from the home page of the site
+            if news_scraper is self.news_scraper:
+                self.return_to_search()
+
+        item_report["total_seconds"] = time.perf_counter() - start
+        return item_report, news_data, files
+
+    @staticmethod
+    def finish_trace(path="output/trace.json"):
+        """
+        Stops tracing and, if it was enabled, logs the time of every stage and writes the trace.
+
+        Parameters
+        ----------
+        path : str
+            The Chrome trace-event file.
+
+        Returns
+        -------
+        str or None
+            The path of the trace, or None if tracing was disabled.
+        """
+        tracer = tracing.disable()
+        if tracer is None:
+            return None
+        tracer.log_report()
+        return tracer.write(path)
+
+    def log_batch_report(self, report):
+        """
+        Logs how long every work item of the batch took.
+
+        Returns
+        -------
+        None
+        """
+        total = sum(item["total_seconds"] for item in report)
+        logger.info(f"Batch report: {len(report)} work items in {total:.2f}s")
+        for item in report:
+            logger.info(f"  '{item['search_phrase']}' / '{item['news_category']}' / {item['num_months']}: "
+                        f"{item['status']}, {item['news']} news, scrape {item['scrape_seconds']:.2f}s, "
+                        f"export {item['export_seconds']:.2f}s, total {item['total_seconds']:.2f}s")
@@ -0,0 +1,282 @@
+# Standard Python library imports
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+import re
+
+# Third party libraries imports
+from dateutil.relativedelta import relativedelta
+
+
+# Every way the site writes a month, the abbreviations may or may not end with a dot
+MONTHS = {
+    "jan": 1, "january": 1,
+    "feb": 2, "february": 2,
+    "mar": 3, "march": 3,
+    "apr": 4, "april": 4,
+    "may": 5,
+    "jun": 6, "june": 6,
+    "jul": 7, "july": 7,
+    "aug": 8, "august": 8,
+    "sep": 9, "sept": 9, "september": 9,
+    "oct": 10, "october": 10,
+    "nov": 11, "november": 11,
+    "dec": 12, "december": 12,
+}
+
+# The offset of every unit of a relative date ("3 hours ago"), the units of variable length are relativedeltas
+UNITS = {
+    "sec": timedelta(seconds=1), "second": timedelta(seconds=1),
+    "min": timedelta(minutes=1), "minute": timedelta(minutes=1),
+    "hr": timedelta(hours=1), "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": relativedelta(months=1),
+    "year": relativedelta(years=1),
+}
+
+# A single pattern, compiled once, for the three kinds of timestamps of the site:
+#   - Relative: "3 hours ago", "1 day ago", "an hour ago"
+#   - Just published: "now", "just now"
+#   - Absolute: "Jan. 1, 2020", "Sept. 5, 2023", "June 3, 2024"
+TIMESTAMP_PATTERN = re.compile(
+    r"""^\s*(?:
+        (?P<amount>\d+|an?|one)\s*(?P<unit>sec|second|min|minute|hr|hour|day|week|month|year)s?\s+ago
+        |(?:just\s+)?(?P<now>now)
+        |(?P<month>[a-z]+)\.?\s+(?P<day>\d{1,2}),?\s+(?P<year>\d{4})
+    )\s*$""",
+    re.IGNORECASE | re.VERBOSE,
+)
+
+
+@lru_cache(maxsize=16384)
+def parse_timestamp(date_str):
+    """
+    Parses the text of a timestamp, without resolving the relative ones.
+
+    The result only depends on the text, so it is cached: a page (and a whole search) repeats
+    the same few timestamps many times.
+
+    Parameters
+    ----------
+    date_str : str
+        The timestamp, as shown by the site.
+
+    Returns
+    -------
+    date or timedelta or relativedelta or None
+        The date of an absolute timestamp, the offset to subtract from the current time for a relative one,
+        or None if the text is not a timestamp.
+    """
+    match = TIMESTAMP_PATTERN.match(date_str)
+    if match is None:
+        return None
+
+    if match["now"]:
+        return timedelta(0)
+
+    if match["unit"]:
+        amount = match["amount"].lower()
+        amount = 1 if amount in ("a", "an", "one") else int(amount)
+        return UNITS[match["unit"].lower()] * amount
+
+    month = MONTHS.get(match["month"].lower())
+    if month is None:
+        return None
+    try:
+        return date(int(match["year"]), month, int(match["day"]))
+    except ValueError:  # A day that does not exist, like "Feb. 30, 2024"
+        return None
+
+
+def parse_date(date_str, now=None):
+    """
+    Returns the date of a timestamp.
+
+    Parameters
+    ----------
+    date_str : str
+        The timestamp, as shown by the site.
+    now : datetime, optional
+        The current time, relative timestamps are counted back from it.
+
+    Returns
+    -------
+    date or None
+        The date, or None if the text is not a timestamp.
+    """
+    parsed = parse_timestamp(date_str)
+    if parsed is None or isinstance(parsed, date):
+        return parsed
+    return ((now or datetime.now()) - parsed).date()
+
+
+def parse_many(date_strs, now=None):
+    """
+    Returns the dates of many timestamps (for example, those of a whole page), counting
+    all the relative ones back from the same current time.
+
+    Parameters
+    ----------
+    date_strs : iterable of str
+        The timestamps.
+    now : datetime, optional
+        The current time, by default the time of the call.
+
+    Returns
+    -------
+    list of date or None
+        The date of every timestamp, None for those that could not be parsed.
+    """
+    now = now or datetime.now()
+    return [parse_date(date_str, now) for date_str in date_strs]
+
+
+def month_ordinal(value):
+    """
+    Returns the month ordinal (year * 12 + month) of a date, so consecutive months are consecutive integers.
+
+    Parameters
+    ----------
+    value : date or datetime
+        The date.
+
+    Returns
+    -------
+    int
+        The month ordinal, for example 24289 for January 2024.
+    """
+    return value.year * 12 + value.month
+
+
+class DateWindow:
+    """
+    The months of interest of a search, as a range of month ordinals (year * 12 + month).
+
+    Checking a month is two integer comparisons, whatever the number of months, and a news can also be
+    compared with the window: the results are sorted by 'Newest', so the first news older than the window
+    means that every news after it is older too.
+
+    Parameters
+    ----------
+    num_months : int
+        Number of months wanted, counting the current one (0 and 1 both mean only the current month).
+    today : date, optional
+        The current date, by default today.
+
+    Attributes
+    ----------
+    first : int
+        The month ordinal of the oldest month of the window.
+    last : int
+        The month ordinal of the current month.
+
+    Methods
+    -------
+    ordinal(value, now)
+        Returns the month ordinal of a timestamp, a date or an ordinal.
+    compare(value, now)
+        Tells whether a date is older than, inside or newer than the window.
+    labels()
+        Returns the months of the window in 'MM-YYYY' format.
+
+    Raises
+    ------
+    ValueError
+        If num_months is not a positive integer.
+    """
+
+    __slots__ = ("first", "last")
+
+    def __init__(self, num_months, today=None):
+        # We do not accept strings or negative numbers
+        if not isinstance(num_months, int) or num_months < 0:
+            raise ValueError("num_months can not be negative integer.")
+        self.last = month_ordinal(today or date.today())
+        self.first = self.last - max(num_months, 1) + 1
+
+    @staticmethod
+    def ordinal(value, now=None):
+        """
+        Returns the month ordinal of a timestamp ("3 hours ago", "Jan. 1, 2020"), a date or an ordinal.
+
+        Returns
+        -------
+        int or None
+            The month ordinal, or None if the timestamp could not be parsed.
+        """
+        if isinstance(value, int):
+            return value
+        if isinstance(value, str):
+            value = parse_date(value, now)
+            if value is None:
+                return None
+        return month_ordinal(value)
+
+    def compare(self, value, now=None):
+        """
+        Compares a date with the window.
+
+        Parameters
+        ----------
+        value : str or date or int
+            A timestamp, a date or a month ordinal.
+        now : datetime, optional
+            The current time, relative timestamps are counted back from it.
+
+        Returns
+        -------
+        int or None
+            -1 if it is older than the window, 0 if it is inside, 1 if it is newer,
+            or None if the timestamp could not be parsed.
+        """
+        ordinal = self.ordinal(value, now)
+        if ordinal is None:
+            return None
+        if ordinal < self.first:
+            return -1
+        return 0 if ordinal <= self.last else 1
+
+    def __contains__(self, value):
+        if value is None:
+            return False
+        ordinal = self.ordinal(value)
+        return ordinal is not None and self.first <= ordinal <= self.last
+
+    def __len__(self):
+        return self.last - self.first + 1
+
+    def labels(self):
+        """
+        Returns the months of the window in 'MM-YYYY' format, the current one first.
+
+        Returns
+        -------
+        list of str
+            For example ['03-2024', '02-2024', '01-2024'].
+        """
+        return [f"{(ordinal - 1) % 12 + 1:02d}-{(ordinal - 1) // 12}" for ordinal in range(self.last, self.first - 1, -1)]
+
+    def __repr__(self):
+        labels = self.labels()
+        return f"DateWindow({labels[-1]} to {labels[0]}, {len(self)} months)"
+
+
+def is_of_interest(item, window=None):
+    """
+    Tells whether a news of 'news_data' has to be exported.
+
+    Parameters
+    ----------
+    item : dict
+        The news data.
+    window : DateWindow, optional
+        If given, the news is selected by its month ordinal, otherwise by its "bool" flag.
+
+    Returns
+    -------
+    bool
+        True if the news is of interest.
+    """
+    if window is None:
+        return bool(item["bool"])
+    return item.get("month_ordinal") in window
@@ -7,10 +7,162 @@ import openpyxl
 from openpyxl.drawing.image import Image
 
 # Local module imports
+from .dates import is_of_interest
+from .money import format_amounts
 from .my_logger import logger
+from .sinks import SINKS
+from .thumbnails import ThumbnailMaker
+from .tracing import traced
 from .utils import clean_text
 
 
+# The columns of the Excel file
+HEADERS = ["Title", "Date", "Description", "Picture Filename",
+           "Count Search Phrases", "Contains Money", "Money Amounts"]
+
+# The column of the "Picture Filename", where the thumbnails are anchored, and its width in characters
+PICTURE_COLUMN = "D"
+THUMBNAIL_COLUMN_WIDTH = 20
+
+
+def excel_row(item):
+    """
+    Returns the row of a news in the Excel file, in the order of 'HEADERS'.
+
+    Parameters
+    ----------
+    item : dict
+        The news data.
+
+    Returns
+    -------
+    list
+        The values of the row.
+    """
+    return [item["title"], item["date"], item["description"], item["image_path"],
+            item["phrase_matches"], item["contain_money"], format_amounts(item.get("money_amounts", []))]
+
+
+class ExcelStream:
+    """
+    Writes an Excel file row by row, as the news are produced.
+
+    The workbook is in openpyxl's write-only mode: every row is serialized when it is appended instead of
+    being kept as cell objects, so the memory does not grow with the number of rows. The workbook is only
+    created with the first row, so no file is written if there are no rows.
+
+    Parameters
+    ----------
+    excel_filename : str
+        The path of the Excel file.
+    thumbnails : dict, optional
+        The thumbnail path of every image path, as returned by 'ThumbnailMaker.make_thumbnails()'.
+        The thumbnail of a news is anchored in its "Picture Filename" cell.
+
+    Attributes
+    ----------
+    rows : int
+        Number of news written so far.
+
+    Methods
+    -------
+    append(item)
+        Writes the row of a news.
+    close()
+        Saves the file.
+    discard()
+        Drops the file being written, for example after a row failed.
+    """
+
+    def __init__(self, excel_filename, thumbnails=None):
+        self.excel_filename = excel_filename
+        self.thumbnails = thumbnails or {}
+        self.rows = 0
+        self.wb = None
+        self.ws = None
+
+    def append(self, item):
+        """
+        Writes the row of a news.
+
+        Parameters
+        ----------
+        item : dict
+            The news data.
+
+        Returns
+        -------
+        None
+        """
+        if self.wb is None:
+            # Here we create the workbook and write the headers, with the first news
+            self.wb = openpyxl.Workbook(write_only=True)
+            self.ws = self.wb.create_sheet()
+            if self.thumbnails:
+                self.ws.column_dimensions[PICTURE_COLUMN].width = THUMBNAIL_COLUMN_WIDTH
+            self.ws.append(HEADERS)
+
+        row_num = self.rows + 2  # The headers are the first row
+        thumbnail_path = self.thumbnails.get(item["image_path"])
+        if thumbnail_path:
+            # The row is made as high as the thumbnail before it is written
+            thumbnail = Image(thumbnail_path)
+            thumbnail.anchor = f"{PICTURE_COLUMN}{row_num}"
+            self.ws.row_dimensions[row_num].height = thumbnail.height * 0.75 + 4  # Pixels to points
+            self.ws.add_image(thumbnail)
+        self.ws.append(excel_row(item))
+        self.rows += 1
+
+    def close(self):
+        """
+        Saves the file, if any row was written.
+
+        Returns
+        -------
+        str or None
+            The path of the Excel file, or None if there were no rows.
+        """
+        if self.wb is None:
+            return None
+        try:
+            self.wb.save(self.excel_filename)
+        finally:
+            self._release()
+        return self.excel_filename
+
+    def discard(self):
+        """
+        Drops the file being written, nothing is saved. It does nothing once the stream is closed.
+
+        Returns
+        -------
+        None
+        """
+        if self.wb is not None:
+            self._release()
+
+    def _release(self):
+        # The rows of a write-only sheet go through a generator and a temporary file. If the sheet was not
+        # saved (a row failed, or the save did not run) we end them here: a generator left open fails when
+        # it is garbage collected, and the temporary file would stay until the end of the process.
+        try:
+            self.ws.close()
+            self.ws._writer.cleanup()
+        except Exception:
+            pass  # Already saved, or the sheet broke on the failed row
+        self.wb = None
+        self.ws = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
 class ExcelCreator:
     """
     A class to create Excel files from news data.
@@ -21,22 +173,29 @@ class ExcelCreator:
         Clears all existing Excel files in the directory.
     create_excel(news_data)
         Creates an Excel file with the given news data.
+    open_stream(search_phrase, news_category, num_months)
+        Opens the Excel file of a search for writing its news one by one.
     """
 
-    def __init__(self):
+    def __init__(self, output_dir="output/"):
         """
         Initializes the ExcelCreator, sets the directory for Excel files, and clears existing files.
+
+        Parameters
+        ----------
+        output_dir : str
+            Directory where the Excel file is created.
         """
         # Here we provide a directory to the code, this directory will or may have some previous documents
         # Those documents are not of our interest right now, so we delete them
         # The function "clear_excel_files()" stablish how we delete the files
-        self.excel_files_dir = 'output/'
+        self.excel_files_dir = os.path.join(output_dir, "")
         os.makedirs(self.excel_files_dir, exist_ok=True)
         self.clear_excel_files()
 
     def clear_excel_files(self):
         """
-        Clears all existing Excel files in the directory.
+        Clears all existing Excel files in the directory, and the files of the other output formats.
 
         Returns
         -------
@@ -44,72 +203,104 @@ class ExcelCreator:
         """
         logger.info("Starting 'clear_excel_files' function")
         # Here is how we delete all the files
-        files = glob.glob(f"{self.excel_files_dir}*.xlsx")
-        for f in files:
-            os.remove(f)
+        for extension in [".xlsx"] + [sink.extension for sink in SINKS.values()]:
+            files = glob.glob(f"{self.excel_files_dir}*{extension}")
+            for f in files:
+                os.remove(f)
         logger.info(f"All previous Excel Files from {self.excel_files_dir} directory cleared")
 
-    def create_excel(self, news_data, search_phrase, news_category, num_months):
+    @traced("create_excel")
+    def create_excel(self, news_data, search_phrase, news_category, num_months, window=None, thumbnails=False,
+                     sinks=(), image_digests=None):
         """
         Creates a single Excel file containing all the news data.
 
         Parameters
         ----------
-        news_data : list of dict
-            List of dictionaries containing the news data.
+        news_data : iterable of dict
+            List (or generator) of dictionaries containing the news data.
         search_phrase : list of dict
             Text with the search phrase.
         news_category : list of dict
             The desired category of the search.
         num_months : list of dict
             Number of months wanted, counting the current one.
+        window : DateWindow, optional
+            The months of interest, if given the news are selected by their month instead of their "bool" flag.
+        thumbnails : bool or ThumbnailMaker
+            Whether to embed a thumbnail of every downloaded image, made by the given ThumbnailMaker
+            or by a default one.
+        sinks : list of Sink
+            Other outputs (see the 'sinks' module) that receive the same news of interest as the Excel file,
+            in the same pass. They are closed at the end.
+        image_digests : dict, optional
+            The SHA-256 of the downloaded images, by image path (see 'ImageDownloader.digests'), so the
+            thumbnails do not hash them again.
 
         Returns
         -------
-        None
+        str or None
+            The path of the Excel file, or None if there were no news of interest.
         """
         logger.info("Starting 'create_excel' function")
 
+        # The rows are streamed to the file, news_data can be a list or a generator of news
+        thumbnail_paths = None
+        if thumbnails:
+            # The thumbnails are made all at once, so we need the news of interest in a list
+            news_data = [item for item in news_data if is_of_interest(item, window)]
+            thumbnail_maker = thumbnails if isinstance(thumbnails, ThumbnailMaker) else ThumbnailMaker()
+            thumbnail_paths = thumbnail_maker.make_thumbnails((item["image_path"] for item in news_data
+                                                               if item["image_path"] != "N/A"), image_digests)
+        excel_stream = self.open_stream(search_phrase, news_category, num_months, thumbnail_paths)
+        try:
+            for item in news_data:
+                # Verify if current new is of interest for me
+                if is_of_interest(item, window):
+                    excel_stream.append(item)
+                    for sink in sinks:
+                        sink.write(item)
+            excel_filename = excel_stream.close()
+            for sink in sinks:
+                sink.close()
+        except BaseException:
+            # The other outputs of a failed export are deleted, none of them would have every news
+            for sink in sinks:
+                sink.discard()
+            raise
+        finally:
+            # After an error the half written workbook is dropped, after 'close()' there is nothing left to do
+            excel_stream.discard()
+
         # Check if there are any news items of interest
-        if not any(item["bool"] for item in news_data):
+        if excel_filename is None:
             logger.warning("No news items of interest. No Excel file created.")
-            return
-
-        # Creating a new Excel Workbook
-        wb = openpyxl.Workbook()
-        ws = wb.active
-
-        # Stablishing the Headers
-        headers = ["Title", "Date", "Description", "Picture Filename",
-                    "Count Search Phrases", "Contains Money"]
-        for col, header in enumerate(headers, start=1):
-            ws.cell(row=1, column=col, value=header)
-
-        # Initialize row number
-        row_num = 2
-
-        # Iterar sobre los datos de las noticias y escribir en el archivo Excel
-        for item in news_data:
-            # Verify if current new is of interest for me
-            if item["bool"]:
-                # Write the data in the corresponding cells
-                ws.cell(row=row_num, column=1, value=item["title"])
-                ws.cell(row=row_num, column=2, value=item["date"])
-                ws.cell(row=row_num, column=3, value=item["description"])
-                ws.cell(row=row_num, column=4, value=item["image_path"])
-                ws.cell(row=row_num, column=5, value=item["phrase_matches"])
-                ws.cell(row=row_num, column=6, value=item["contain_money"])
+            return None
 
-                # Increase the row number for the next news
-                row_num += 1
+        logger.info(f"Single Excel file named {excel_filename} created with all news data")
+        return excel_filename
 
+    def excel_filename(self, search_phrase, news_category, num_months):
+        """
+        Returns the path of the Excel file of a search.
 
+        Returns
+        -------
+        str
+            The path, named after the cleaned search phrase and category and the number of months.
+        """
         # Cleaning the search_phrase and the news_category so we can name the file properly
         search_phrase = clean_text(search_phrase)
         news_category = clean_text(news_category)
+        return f"{self.excel_files_dir}{search_phrase}_{news_category}_{num_months}.xlsx"
 
-        # Saving the Excel File
-        excel_filename = f"{self.excel_files_dir}{search_phrase}_{news_category}_{num_months}.xlsx"
-        wb.save(excel_filename)
+    def open_stream(self, search_phrase, news_category, num_months, thumbnails=None):
+        """
+        Opens the Excel file of a search for writing its news one by one, as they are scraped.
 
-        logger.info(f"Single Excel file named {excel_filename} created with all news data")
\ No newline at end of file
+        Returns
+        -------
+        ExcelStream
+            The stream, whose 'close()' saves the file.
+        """
+        return ExcelStream(self.excel_filename(search_phrase, news_category, num_months), thumbnails)
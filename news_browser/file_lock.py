@@ -0,0 +1,86 @@
+# Standard Python library imports
+import json
+import os
+import tempfile
+try:
+    import fcntl
+except ImportError:  # Windows has no 'fcntl', its files are locked with 'msvcrt'
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """
+    A lock shared by the processes that use the same file, for example the workers of a sharded run
+    that read and write the same cache. It is held while the 'with' block runs.
+
+    The lock is taken on a separate '<path>.lock' file, so the file it protects can be replaced
+    (written to a temporary file and renamed) while the lock is held.
+
+    Parameters
+    ----------
+    path : str
+        The file protected by the lock.
+    """
+
+    def __init__(self, path):
+        self.lock_path = f"{path}.lock"
+        self._fd = None
+
+    def __enter__(self):
+        directory = os.path.dirname(self.lock_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        else:
+            # 'LK_LOCK' gives up after 10 seconds, so we keep trying
+            while True:
+                try:
+                    msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+
+def write_json(path, data):
+    """
+    Writes a JSON file through a temporary file of its own in the same directory, renamed over the
+    file at the end: a crash never leaves a half written file, and two processes never write to the
+    same temporary file.
+
+    Parameters
+    ----------
+    path : str
+        The JSON file.
+    data : object
+        What is written.
+
+    Returns
+    -------
+    None
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f"{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
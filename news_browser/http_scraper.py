@@ -0,0 +1,235 @@
+# Standard Python library imports
+from urllib.parse import urlencode, urljoin
+
+# Third party libraries imports
+import requests
+
+# Local module imports
+from .my_logger import logger
+from .news_collector import NewsCollector
+from .promo_parser import find_topic, parse_page
+from .tracing import span, traced
+
+
+class HttpNewsScraper:
+    """
+    A class to scrape news articles from the search pages over plain HTTP, without a browser.
+
+    It builds the same search the NewsScraper makes by clicking (search phrase, 'Newest' sort,
+    topic filter and page) as a URL, and feeds every page to the same 'promo-wrapper' extraction,
+    so it returns the same 'news_data'.
+
+    Parameters
+    ----------
+    base_url : str
+        The URL of the news site.
+    session : requests.Session, optional
+        The HTTP session, a new one is created if not given.
+    timeout : float or tuple
+        Timeout in seconds for every request (connect, read).
+    engine : str, optional
+        The HTML extraction engine ("lxml" or "soup"), see 'promo_parser.parse_page()'.
+    topic_cache : TopicCache, optional
+        If given, the facet of a category found for a search phrase is reused without requesting the search.
+    article_store : ArticleStore, optional
+        If given, the news found are recorded in it.
+    incremental : bool
+        If True, the crawl stops at the first page whose news are all in the article store.
+    recorder : SessionRecorder, optional
+        If given, the pages requested are recorded, to be replayed without the site.
+
+    Methods
+    -------
+    search_url(search_phrase, topic_id, page)
+        Builds the URL of a search results page.
+    search_news(search_phrase, news_category)
+        Finds the facet id of the news category for the search.
+    iter_news(search_phrase, news_category, num_months)
+        Yields the news of interest page by page, as they are scraped.
+    scrap_news(search_phrase, news_category, num_months)
+        Scrapes the news articles from the search results.
+    close()
+        Closes the HTTP session.
+    """
+
+    # There is a subscription limit (I guess) which limits us to only 10 pages
+    max_pages = 10
+
+    # The sort option of the search, "1" is 'Newest'
+    newest_sort = "1"
+
+    def __init__(self, base_url="https://www.latimes.com/", session=None, timeout=(5, 20), engine=None,
+                 topic_cache=None, article_store=None, incremental=False, recorder=None):
+        self.base_url = base_url
+        self.session = session or requests.Session()
+        self.timeout = timeout
+        self.engine = engine
+        self.topic_cache = topic_cache
+        self.article_store = article_store
+        self.incremental = incremental
+        self.recorder = recorder
+        self.collector = None  # The NewsCollector of the last scraping, it has the crawl statistics
+
+    def search_url(self, search_phrase, topic_id=None, page=1):
+        """
+        Builds the URL of a search results page.
+
+        Parameters
+        ----------
+        search_phrase : str
+            The text to search.
+        topic_id : str, optional
+            The facet id of the topic, taken from the value of its checkbox.
+        page : int
+            The number of the results page.
+
+        Returns
+        -------
+        str
+            The URL, for example 'https://www.latimes.com/search?q=Messi&s=1&f0=0000-...&p=2'.
+        """
+        params = {"q": search_phrase, "s": self.newest_sort}
+        if topic_id:
+            params["f0"] = topic_id
+        if page > 1:
+            params["p"] = page
+        return urljoin(self.base_url, "search") + "?" + urlencode(params)
+
+    def fetch(self, url):
+        """
+        Downloads a page and returns its HTML.
+        """
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.text
+
+    def close(self):
+        """
+        Closes the HTTP session and its keep-alive connections.
+
+        Returns
+        -------
+        None
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @traced("search_news")
+    def search_news(self, search_phrase, news_category):
+        """
+        Makes the search and finds the facet id of the news category.
+
+        Parameters
+        ----------
+        search_phrase : str
+            The text to search.
+        news_category : str
+            The desired category of the search.
+
+        Returns
+        -------
+        str or None
+            The facet id of the category, or None if there were no results or the category was not found.
+        """
+        logger.info("Starting 'search_news' function (HTTP)")
+        facet_id = self.topic_cache.get(search_phrase, news_category) if self.topic_cache else None
+        if facet_id:
+            if self.recorder:
+                self.recorder.session["facet_id"] = facet_id
+            return facet_id
+
+        html = self.fetch(self.search_url(search_phrase))
+        page = parse_page(html, self.engine)
+
+        # Some searches may find nothing and that needs to be catched
+        no_results = page.no_results_text()
+        if no_results and "There are not any results that match" in no_results:
+            logger.warning(f"No results found for search: {search_phrase}")
+            if self.recorder:
+                self.recorder.session["no_results"] = True
+            return None
+
+        # The topics are read from the whole search page, which is recorded as the topic box
+        if self.recorder:
+            self.recorder.add_topics(html)
+
+        match = find_topic(page.topics(), news_category)
+        if match is None or not match[1]["value"]:
+            logger.warning(f"No '{news_category}' category found for search '{search_phrase}'")
+            return None
+
+        logger.info(f"Found a matching category which is {news_category}")
+        facet_id = match[1]["value"]
+        if self.topic_cache:
+            self.topic_cache.put(search_phrase, news_category, facet_id)
+            self.topic_cache.save()
+        return facet_id
+
+    def scrap_news(self, search_phrase, news_category, num_months):
+        """
+        Scrapes the news articles from the search results.
+
+        Returns
+        -------
+        list of dict
+            A list of dictionaries containing the scraped news data.
+        """
+        logger.info("Starting scrap_news function (HTTP)")
+        return [item for items in self.iter_news(search_phrase, news_category, num_months) for item in items]
+
+    def iter_news(self, search_phrase, news_category, num_months):
+        """
+        Scrapes the news articles from the search results, yielding the news of every page as soon as it is read.
+        The next page is only requested when the caller asks for more.
+
+        Yields
+        ------
+        list of NewsItem
+            The news of interest of a page. The older news taken from the article store come last.
+        """
+        self.collector = None
+        if self.recorder:
+            self.recorder.begin(search_phrase, news_category, num_months)
+        topic_id = self.search_news(search_phrase, news_category)
+        if not topic_id:
+            return
+
+        # The collector knows what months and years will be considered for the scraping
+        collector = NewsCollector(search_phrase, num_months, news_category, self.article_store, self.incremental)
+        self.collector = collector
+
+        url = self.search_url(search_phrase, topic_id)
+        for page_number in range(1, self.max_pages + 1):
+            with span("page", page=page_number):
+                html = self.fetch(url)
+            if self.recorder:
+                self.recorder.add_page(html)
+            with span("parse", page=page_number):
+                page = parse_page(html, self.engine)
+                keep_going = collector.add_page(page.iter_promos())
+            logger.info(f"We succesfully obtained the news of the page {page_number}")
+            yield collector.new_items()
+
+            # Same rule as the browser, we only go to the next page if every news so far is of interest
+            if not keep_going:
+                break
+
+            # We follow the 'Next Page' link of the page, if there is none this was the last page
+            next_href = page.next_page_href()
+            if not next_href:
+                break
+            url = urljoin(url, next_href)
+        else:
+            logger.warning("Reached the maximum number of pages for non-subscription users.")
+
+        news_data = collector.finish()
+        logger.info(f"Read {collector.pages_read} pages and {collector.items_parsed} news, {len(news_data)} of interest")
+        logger.debug(f"Collected news data: {news_data}")
+        from_store = collector.new_items()
+        if from_store:
+            yield from_store
@@ -0,0 +1,285 @@
+# Standard Python library imports
+import json
+import os
+import shutil
+import threading
+import time
+
+# Local module imports
+from .file_lock import FileLock, write_json
+from .my_logger import logger
+
+
+class ImageCache:
+    """
+    An on-disk cache of the news images that survives between runs.
+
+    The images are stored once by the SHA-256 of their content (so the same picture published under
+    different URLs is stored only once) and an index maps every image URL to its content hash and to
+    the validators (ETag / Last-Modified) sent by the server.
+
+    Several processes (the workers of a sharded run) can share the same cache: the index is saved under
+    a file lock, merged with what the other processes saved, and the size limit is enforced over every
+    image of the directory, whoever stored it.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory where the index and the images are stored.
+    max_bytes : int
+        Maximum size of all the cached images, the least recently used ones are evicted first.
+    max_age : float
+        Seconds an image is used without asking the server again, after that it is revalidated.
+
+    Methods
+    -------
+    lookup(url)
+        Returns the cache entry of an URL, if any.
+    is_fresh(entry)
+        Tells whether an entry can be used without revalidation.
+    validators(entry)
+        Returns the conditional headers to revalidate an entry.
+    revalidated(url)
+        Marks an entry as confirmed by the server (HTTP 304).
+    store(url, tmp_path, digest, headers)
+        Moves a downloaded image into the cache.
+    materialize(url, dest_path)
+        Hardlinks (or copies) a cached image to 'dest_path'.
+    evict()
+        Removes the least recently used images until the cache fits in 'max_bytes'.
+    save()
+        Writes the index to disk.
+    """
+
+    def __init__(self, cache_dir="cache/images/", max_bytes=500 * 1024 * 1024, max_age=24 * 60 * 60):
+        self.cache_dir = cache_dir
+        self.blobs_dir = os.path.join(cache_dir, "blobs")
+        self.tmp_dir = os.path.join(cache_dir, "tmp")
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        os.makedirs(self.blobs_dir, exist_ok=True)
+        os.makedirs(self.tmp_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(self.index_path)  # Shared with the other processes using the cache
+        self._entries = self._load_index()
+
+    def _load_index(self):
+        """
+        Loads the index from disk, an unreadable index just means an empty cache.
+        """
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _blob_path(self, digest):
+        return os.path.join(self.blobs_dir, f"{digest}.jpg")
+
+    def _merge_index(self):
+        """
+        Merges the index saved by the other processes into ours, it must be called with both locks held.
+        The entries whose image was evicted (by any process) are dropped.
+        """
+        merged = {url: entry for url, entry in self._load_index().items()
+                  if os.path.exists(self._blob_path(entry["sha256"]))}
+        for url, entry in self._entries.items():
+            if not os.path.exists(self._blob_path(entry["sha256"])):
+                continue
+            saved = merged.get(url)
+            if saved is None or entry["fetched_at"] >= saved["fetched_at"]:
+                merged[url] = dict(entry, last_used=max(entry["last_used"], saved["last_used"] if saved else 0))
+            else:
+                merged[url] = dict(saved, last_used=max(entry["last_used"], saved["last_used"]))
+        self._entries = merged
+
+    def lookup(self, url):
+        """
+        Returns the cache entry of an URL, if any.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the image.
+
+        Returns
+        -------
+        dict or None
+            The entry, or None if the URL is not cached or its image was deleted.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry and os.path.exists(self._blob_path(entry["sha256"])):
+                return dict(entry)
+        return None
+
+    def is_fresh(self, entry):
+        """
+        Tells whether an entry can be used without revalidation.
+        """
+        return time.time() - entry["fetched_at"] < self.max_age
+
+    def validators(self, entry):
+        """
+        Returns the conditional request headers to revalidate an entry.
+
+        Parameters
+        ----------
+        entry : dict or None
+            The cache entry returned by 'lookup()'.
+
+        Returns
+        -------
+        dict
+            'If-None-Match' and/or 'If-Modified-Since' headers, empty if there is nothing to revalidate.
+        """
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def revalidated(self, url):
+        """
+        Marks an entry as confirmed by the server (HTTP 304 Not Modified).
+        """
+        with self._lock:
+            if url in self._entries:
+                self._entries[url]["fetched_at"] = time.time()
+
+    def forget(self, url):
+        """
+        Drops the entry of an URL, for example when its image was evicted by another process after
+        'lookup()', so the image is downloaded again.
+        """
+        with self._lock:
+            self._entries.pop(url, None)
+
+    def store(self, url, tmp_path, digest, headers):
+        """
+        Moves a downloaded image into the cache.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the image.
+        tmp_path : str
+            The downloaded file, it is moved (or deleted if the content is already cached).
+        digest : str
+            SHA-256 of the content of the file.
+        headers : Mapping
+            The response headers, from which the validators are taken.
+
+        Returns
+        -------
+        None
+        """
+        blob_path = self._blob_path(digest)
+        with self._lock:
+            if os.path.exists(blob_path):
+                os.remove(tmp_path)  # Same picture under another URL, we keep only one copy
+            else:
+                os.replace(tmp_path, blob_path)
+            now = time.time()
+            self._entries[url] = {
+                "sha256": digest,
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "fetched_at": now,
+                "last_used": now,
+            }
+
+    def materialize(self, url, dest_path):
+        """
+        Hardlinks the cached image of an URL to 'dest_path', or copies it if linking is not possible.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the image, it must be cached.
+        dest_path : str
+            Where the image is needed, for example 'output/news1.jpg'.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            entry = self._entries[url]
+            entry["last_used"] = time.time()
+            blob_path = self._blob_path(entry["sha256"])
+
+            if os.path.exists(dest_path):
+                os.remove(dest_path)
+            try:
+                os.link(blob_path, dest_path)
+            except OSError:
+                # Different file systems or no hardlink support
+                shutil.copyfile(blob_path, dest_path)
+
+    def evict(self):
+        """
+        Removes the least recently used images until the cache fits in 'max_bytes'.
+
+        Every image of the blobs directory counts, also those stored by other processes. An image that
+        no index knows is as recent as its file.
+
+        Returns
+        -------
+        int
+            Number of images removed.
+        """
+        with self._lock, self._file_lock:
+            self._merge_index()
+
+            # An image is as recent as the most recent URL that uses it
+            last_used = {}
+            for entry in self._entries.values():
+                digest = entry["sha256"]
+                last_used[digest] = max(last_used.get(digest, 0), entry["last_used"])
+
+            blobs = {}
+            for name in os.listdir(self.blobs_dir):
+                digest, extension = os.path.splitext(name)
+                if extension != ".jpg":
+                    continue
+                try:
+                    stat = os.stat(self._blob_path(digest))
+                except OSError:
+                    continue  # Evicted by another process in the meantime
+                blobs[digest] = (last_used.get(digest, stat.st_mtime), stat.st_size)
+            total = sum(size for _, size in blobs.values())
+
+            evicted = set()
+            for digest in sorted(blobs, key=lambda digest: blobs[digest][0]):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(self._blob_path(digest))
+                except OSError:
+                    pass
+                total -= blobs[digest][1]
+                evicted.add(digest)
+
+            self._entries = {url: entry for url, entry in self._entries.items() if entry["sha256"] not in evicted}
+            write_json(self.index_path, self._entries)
+
+        if evicted:
+            logger.info(f"Evicted {len(evicted)} images from the image cache")
+        return len(evicted)
+
+    def save(self):
+        """
+        Writes the index to disk, merged with the entries saved by the other processes (to a temporary
+        file first, so a crash never corrupts it).
+
+        Returns
+        -------
+        None
+        """
+        with self._lock, self._file_lock:
+            self._merge_index()
+            write_json(self.index_path, self._entries)
@@ -1,25 +1,70 @@
 # Standard Python library imports
 import glob
+import hashlib
 import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 
 # Third party libraries imports
 import requests
+from requests.adapters import HTTPAdapter
 
 # Local module imports
+from .dates import is_of_interest
 from .my_logger import logger
+from .news_item import has_image
+from .tracing import traced
+
+class ImageTooLarge(Exception):
+    """
+    Raised when an image is bigger than the maximum size allowed.
+    """
+
 
 class ImageDownloader:
     """
     A class to download images from URLs.
 
+    Parameters
+    ----------
+    max_workers : int
+        Number of threads used to download the images concurrently.
+    timeout : float or tuple
+        Timeout in seconds for every request (connect, read).
+    max_bytes : int
+        Maximum size of an image, bigger downloads are aborted.
+    chunk_size : int
+        Number of bytes read from the network and written to disk at a time.
+    cache : ImageCache, optional
+        Persistent cache of the images, the downloaded images are linked from it.
+    output_dir : str
+        Directory where the images are saved.
+    recorder : SessionRecorder, optional
+        If given, every image downloaded (or taken from the cache) is recorded, to be replayed without the site.
+
+    Attributes
+    ----------
+    digests : dict
+        The SHA-256 of the content of every image written, by image path, so the thumbnails do not
+        hash the images again.
+
     Methods
     -------
     clear_images()
         Clears all existing images in the directory.
+    download_image(item)
+        Downloads the image of a single news item.
     download_images(data)
         Downloads images from the provided data.
+    save_cache()
+        Keeps the image cache inside its size limit and saves its index.
+    close()
+        Closes every HTTP session opened by the downloader.
     """
-    def __init__(self):
+    def __init__(self, max_workers=8, timeout=(5, 20), max_bytes=10 * 1024 * 1024, chunk_size=64 * 1024,
+                 cache=None, output_dir="output/", recorder=None):
         """
         Initializes the ImageDownloader, sets the directory for images,
         and clears existing images.
@@ -27,10 +72,21 @@ class ImageDownloader:
         # Here we provide a directory to the code, this directory will or may have some previous documents
         # Those documents are not of our interest right now, so we delete them
         # The function "clear_images()" stablish how we delete the files
-        self.imgs_dir = 'output/'
+        self.imgs_dir = os.path.join(output_dir, "")
         os.makedirs(self.imgs_dir, exist_ok=True)
         self.clear_images()
 
+        # Download settings, the sessions are created on demand, one per host
+        self.max_workers = max(1, int(max_workers))
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.cache = cache
+        self.recorder = recorder
+        self.digests = {}
+        self._sessions = {}
+        self._sessions_lock = threading.Lock()
+
     def clear_images(self):
         """
         Clears all existing images in the directory.
@@ -47,7 +103,216 @@ class ImageDownloader:
             os.remove(f)
         logger.info(f"All previous Image Files from {self.imgs_dir} directory cleared")
 
-    def download_images(self, news_data):
+    def _get_session(self, image_url):
+        """
+        Returns the keep-alive session for the host of the given URL.
+
+        Parameters
+        ----------
+        image_url : str
+            The URL of the image that will be downloaded.
+
+        Returns
+        -------
+        requests.Session
+            The session shared by every download for that host.
+        """
+        host = urlsplit(image_url).netloc
+        with self._sessions_lock:
+            session = self._sessions.get(host)
+            if session is None:
+                # The connection pool is as big as the number of workers,
+                # so no thread has to open a new connection while another one is idle
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+        return session
+
+    def close(self):
+        """
+        Closes every HTTP session opened by the downloader.
+
+        Returns
+        -------
+        None
+        """
+        with self._sessions_lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    @traced("download_image")
+    def download_image(self, item):
+        """
+        Downloads the image of a single news item and updates its "image_path".
+
+        The body is streamed to a temporary file in chunks and renamed into place once it is complete,
+        so the memory used does not depend on the size of the image. When there is an image cache,
+        fresh images are taken from it without any request and the others are revalidated.
+
+        Parameters
+        ----------
+        item : dict
+            Dictionary containing the image URL and other related information.
+
+        Returns
+        -------
+        bool
+            True if the image was downloaded (or taken from the cache), False otherwise.
+        """
+        image_url = item.get("image_url")
+        image_path = os.path.join(self.imgs_dir, f"{item['news_name']}.jpg")
+
+        # First we check if we already have the image from a previous run
+        entry = self.cache.lookup(image_url) if self.cache else None
+        if entry and self.cache.is_fresh(entry):
+            if self._from_cache(image_url, image_path):
+                self._downloaded(item, image_url, image_path, entry["sha256"])
+                return True
+            entry = None  # Its image is gone, so there is nothing to revalidate either
+
+        try:
+            headers = self.cache.validators(entry) if self.cache else {}
+            with self._get_session(image_url).get(image_url, headers=headers, timeout=self.timeout,
+                                                  stream=True) as response:
+                if response.status_code == 304 and entry:
+                    # The server confirmed that our copy is still valid
+                    self.cache.revalidated(image_url)
+                    if not self._from_cache(image_url, image_path):
+                        # The entry was dropped, so this time the image is requested without validators
+                        return self.download_image(item)
+                    digest = entry["sha256"]
+                elif response.status_code != 200:
+                    logger.error(f"Failed to download image from {image_url}")
+                    return False
+                elif not self._is_acceptable(response, image_url):
+                    return False
+                elif self.cache:
+                    tmp_path, digest = self._stream_to_temp(response, self.cache.tmp_dir)
+                    self.cache.store(image_url, tmp_path, digest, response.headers)
+                    self.cache.materialize(image_url, image_path)
+                else:
+                    tmp_path, digest = self._stream_to_temp(response, self.imgs_dir)
+                    os.replace(tmp_path, image_path)
+        except ImageTooLarge as e:
+            logger.error(f"Aborted the download of {image_url}: {e}")
+            return False
+        except (requests.RequestException, OSError) as e:
+            logger.error(f"Failed to download image from {image_url}: {e}")
+            return False
+
+        self._downloaded(item, image_url, image_path, digest)
+        return True
+
+    def _from_cache(self, image_url, image_path):
+        """
+        Copies the cached image of an URL to 'image_path'. The image can be evicted by another process
+        between the lookup and the copy, in which case its entry is dropped.
+
+        Returns
+        -------
+        bool
+            True if the image was taken from the cache, False if it has to be downloaded again.
+        """
+        try:
+            self.cache.materialize(image_url, image_path)
+            return True
+        except (OSError, KeyError) as e:
+            logger.warning(f"The cached image of {image_url} could not be used ({e!r}), we download it again")
+            self.cache.forget(image_url)
+            return False
+
+    def _downloaded(self, item, image_url, image_path, digest):
+        # The news points to its image, which is recorded if the session is being recorded
+        item["image_path"] = image_path
+        self.digests[image_path] = digest
+        if self.recorder:
+            self.recorder.add_image(image_url, image_path)
+
+    def _is_acceptable(self, response, image_url):
+        """
+        Checks the headers of a response before reading its body.
+
+        Parameters
+        ----------
+        response : requests.Response
+            The streamed response of the image request.
+        image_url : str
+            The URL of the image, only used for the logs.
+
+        Returns
+        -------
+        bool
+            True if the response looks like an image that is not bigger than 'max_bytes'.
+        """
+        # Some CDNs do not send the Content-Type, we only reject it when it says it is not an image
+        content_type = response.headers.get("Content-Type", "")
+        if content_type and not content_type.lower().startswith("image/"):
+            logger.error(f"Skipped {image_url}: unexpected Content-Type '{content_type}'")
+            return False
+
+        # If the server tells us the size, we can abort before downloading anything
+        content_length = response.headers.get("Content-Length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_bytes:
+            logger.error(f"Skipped {image_url}: {content_length} bytes is more than the {self.max_bytes} allowed")
+            return False
+        return True
+
+    def _stream_to_temp(self, response, directory):
+        """
+        Writes the body of a response chunk by chunk to a temporary file in 'directory'.
+
+        The caller renames the temporary file into place once it is complete, so a failed download
+        never leaves a half written image behind.
+
+        Parameters
+        ----------
+        response : requests.Response
+            The streamed response of the image request.
+        directory : str
+            Directory of the temporary file, it must be in the same file system as the final path.
+
+        Returns
+        -------
+        tuple of (str, str)
+            The path of the temporary file and the SHA-256 of its content.
+
+        Raises
+        ------
+        ImageTooLarge
+            If the body is bigger than 'max_bytes' (the Content-Length may be missing or lie).
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".part")
+        digest = hashlib.sha256()
+        try:
+            written = 0
+            with os.fdopen(fd, "wb") as f:
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    written += len(chunk)
+                    if written > self.max_bytes:
+                        raise ImageTooLarge(f"more than {self.max_bytes} bytes received")
+                    digest.update(chunk)
+                    f.write(chunk)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return tmp_path, digest.hexdigest()
+
+    def save_cache(self):
+        """
+        Keeps the image cache inside its size limit and saves its index for the next run.
+
+        Returns
+        -------
+        None
+        """
+        if self.cache:
+            self.cache.evict()
+            self.cache.save()
+
+    def download_images(self, news_data, window=None):
         """
         Downloads images from the provided data and saves them to the directory.
 
@@ -55,6 +320,8 @@ class ImageDownloader:
         ----------
         news_data : list of dict
             List of dictionaries containing the image URLs and other related information.
+        window : DateWindow, optional
+            The months of interest, if given the news are selected by their month instead of their "bool" flag.
 
         Returns
         -------
@@ -63,35 +330,30 @@ class ImageDownloader:
         logger.info("Starting 'download_images' function")
 
         # Check if there are any news items of interest
-        if not any(item["bool"] for item in news_data):
+        if not any(is_of_interest(item, window) for item in news_data):
             logger.info("No news items of interest. No images downloaded.")
             return
-        
+
         # Check if all image paths are "N/A"
-        if all(item.get("image_path") == "N/A" for item in news_data):
+        if not any(has_image(item) for item in news_data):
             logger.info("All image paths are 'N/A'. No images downloaded.")
             return
 
         logger.info("Creating the necessary Image Files")
-        # Once we have the "news_data" list of dictionaries, we iterate over it
-        for item in news_data:
-            # Here we obtain the "bool" value of our current dictionay as well as its url
-            image_url = item.get("image_url")
-            news_boolean = item.get("bool")
-            # If the key "bool" is True, then we proceed, also if the url is not "N/A"
-            # What this Boolean value means is that the new that it contains is or is not of our interest.
-            #   - {"bool": True} Means that we will create an Excel for this news
-            #   - {"bool": False} Means that we will NOT create an Excel for this news
-            # And the URL may be "N/A" because the site news did not post any pic for it
-            if image_url and image_url != "N/A" and news_boolean:
-                response = requests.get(image_url)
-                if response.status_code == 200:
-                    image_path = os.path.join(self.imgs_dir, f"{item['news_name']}.jpg")
-                    with open(image_path, "wb") as f:
-                        f.write(response.content)
-                    item["image_path"] = image_path
-                else:
-                    logger.error(f"Failed to download image from {image_url}")
+        # Once we have the "news_data" list of dictionaries, we keep only the items we need
+        # What the "bool" value means is that the new that it contains is or is not of our interest.
+        #   - {"bool": True} Means that we will create an Excel for this news
+        #   - {"bool": False} Means that we will NOT create an Excel for this news
+        # And the URL may be "N/A" because the site news did not post any pic for it
+        pending = [
+            item for item in news_data
+            if item.get("image_url") and item.get("image_url") != "N/A" and is_of_interest(item, window)
+        ]
 
+        # Then we download them concurrently, every thread writes its own file and
+        # its own dictionary, so there is nothing else to synchronize
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            downloaded = sum(executor.map(self.download_image, pending))
 
-        logger.info(f"All necessary Image Files created")
+        self.save_cache()
+        logger.info(f"All necessary Image Files created ({downloaded}/{len(pending)} downloaded)")
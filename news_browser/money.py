@@ -0,0 +1,155 @@
+# Standard Python library imports
+import bisect
+import re
+
+
+# The multiplier of every scale word written after an amount ("$1.2 million", "$5k")
+SCALES = {
+    "thousand": 1e3, "k": 1e3,
+    "million": 1e6, "mn": 1e6, "m": 1e6,
+    "billion": 1e9, "bn": 1e9,
+    "trillion": 1e12, "tn": 1e12,
+}
+
+# A number with thousands separators ("111,111.11") or a plain one with optional decimals ("11.1", "100,00")
+_NUMBER = r"\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:[.,]\d+)?"
+# A number written before "dollars" without a scale word: a bare integer from 1900 to 2099 is read as a
+# year ("the 2020 dollars"), so it needs thousands separators or decimals ("2,020 dollars", "2020.50 USD")
+_PLAIN_NUMBER = r"\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+[.,]\d+|(?!(?:19|20)\d{2}\b)\d+"
+_SCALE = r"thousand|million|billion|trillion|mn|bn|tn|k|m"
+_THOUSANDS_NUMBER = re.compile(r"\d{1,3}(?:,\d{3})+(?:\.\d+)?")
+
+# A single pattern, compiled once, for every way of writing an amount of dollars:
+#   - Prefixed: "$11.1", "$111,111.11", "$1.2 million", "$100 USD", "USD 500", "US$ 20"
+#   - Suffixed: "11 dollars", "11 USD", "3 million dollars"
+MONEY_PATTERN = re.compile(
+    rf"""(?:
+        (?:\$|\bUS\$|\bUSD)\s?(?P<prefixed>{_NUMBER})(?:\s?(?P<prefixed_scale>{_SCALE})\b)?(?:\s+(?:dollars?|usd)\b)?
+        |\b(?:(?P<suffixed>{_NUMBER})\s(?P<suffixed_scale>{_SCALE})|(?P<plain>{_PLAIN_NUMBER}))\s+(?:dollars?|usd)\b
+    )""",
+    re.IGNORECASE | re.VERBOSE,
+)
+
+# The texts given to 'extract_money_many()' are joined with a character no amount can span
+_SEPARATOR = "\x00"
+
+
+def may_contain_money(text):
+    """
+    Tells, with plain substring searches, whether a text can have an amount of money at all: every
+    amount has a "$", a "dollar" or a "USD". Most news have none, and the full pattern (which tries its
+    numbers at every word) is only run on the others.
+
+    Returns
+    -------
+    bool
+        False if the text surely has no amount of money.
+    """
+    if "$" in text:
+        return True
+    lowered = text.lower()
+    return "dollar" in lowered or "usd" in lowered
+
+
+def _parse_amount(number, scale):
+    # A comma followed by three digits separates thousands, any other comma is a decimal point ("100,00")
+    if _THOUSANDS_NUMBER.fullmatch(number):
+        number = number.replace(",", "")
+    else:
+        number = number.replace(",", ".")
+    return float(number) * SCALES.get(scale.lower(), 1) if scale else float(number)
+
+
+def extract_money(text):
+    """
+    Finds every amount of money in a text, in a single scan.
+
+    Parameters
+    ----------
+    text : str
+        The text to search within, for example the title and the description of a news.
+
+    Returns
+    -------
+    list of dict
+        One dictionary per amount, in the order of the text, with the keys:
+            - amount: the value in dollars, for example 1200000.0 for "$1.2 million"
+            - text: the amount as written in the text
+            - span: the (start, end) positions of the amount in the text
+    """
+    if not may_contain_money(text):
+        return []
+    return [_amount(match, match.start(), match.end()) for match in MONEY_PATTERN.finditer(text)]
+
+
+def _amount(match, start, end):
+    if match["prefixed"] is not None:
+        amount = _parse_amount(match["prefixed"], match["prefixed_scale"])
+    elif match["suffixed"] is not None:
+        amount = _parse_amount(match["suffixed"], match["suffixed_scale"])
+    else:
+        amount = _parse_amount(match["plain"], None)
+    return {"amount": amount, "text": match.group(), "span": (start, end)}
+
+
+def extract_money_many(texts):
+    """
+    Finds the amounts of money of many texts, for example those of all the news of a page, with a
+    single scan of the pattern over the joined texts.
+
+    Parameters
+    ----------
+    texts : iterable of str
+        The texts.
+
+    Returns
+    -------
+    list of list of dict
+        The amounts of every text, as returned by 'extract_money()', in the order of 'texts'.
+    """
+    texts = list(texts)
+    amounts = [[] for _ in texts]
+    joined = _SEPARATOR.join(texts)
+    if not may_contain_money(joined):
+        return amounts
+
+    # Here we take the position of every text in the joined one, to give every amount to its text
+    starts = []
+    position = 0
+    for text in texts:
+        starts.append(position)
+        position += len(text) + 1
+    for match in MONEY_PATTERN.finditer(joined):
+        index = bisect.bisect_right(starts, match.start()) - 1
+        offset = starts[index]
+        amounts[index].append(_amount(match, match.start() - offset, match.end() - offset))
+    return amounts
+
+
+def contains_money(text):
+    """
+    Tells whether a text has any amount of money, stopping at the first one.
+
+    Returns
+    -------
+    bool
+        True if the text has an amount of money.
+    """
+    return may_contain_money(text) and MONEY_PATTERN.search(text) is not None
+
+
+def format_amounts(amounts):
+    """
+    Formats the amounts of a news for the reports, for example "$1,200,000.00; $20.00".
+
+    Parameters
+    ----------
+    amounts : list of dict
+        The amounts returned by 'extract_money()'.
+
+    Returns
+    -------
+    str
+        The amounts separated by '; ', an empty string if there are none.
+    """
+    return "; ".join(f"${amount['amount']:,.2f}" for amount in amounts)
@@ -0,0 +1,172 @@
+# Standard Python library imports
+from datetime import datetime
+
+# Local module imports
+from .dates import DateWindow
+from .my_logger import logger
+from .promo_parser import build_news_items
+
+
+class NewsCollector:
+    """
+    A class that accumulates the news of the result pages and knows when the crawl can stop.
+
+    The results are sorted by 'Newest', so the first news older than the months of interest means
+    that every news after it (in this page and in the next ones) is older too. From that news on,
+    nothing else is parsed and no other page needs to be loaded.
+
+    Parameters
+    ----------
+    search_phrase : str
+        The search phrase, its occurrences are counted in the title and description.
+    num_months : int
+        Number of months wanted, counting the current one.
+    news_category : str, optional
+        The category of the search, the news are stored by search phrase and category.
+    store : ArticleStore, optional
+        If given, every news of interest is recorded in it.
+    incremental : bool
+        If True (and there is a store), the crawl also stops after a page whose news of interest were all
+        stored by an earlier run, and the older news of the months of interest are taken from the store.
+    now : datetime, optional
+        The time the pages were read, by default the time every page is added. A replayed session
+        uses the time it was recorded, so its relative dates and its months of interest do not move.
+    stop_at_cutoff : bool
+        If False (the results could not be sorted by 'Newest'), the news older than the months of interest
+        are skipped but the crawl goes on, and an incremental crawl does not stop at a known page either.
+
+    Attributes
+    ----------
+    window : DateWindow
+        The months of interest.
+    news_data : list of dict
+        The news of interest collected so far.
+    reached_cutoff : bool
+        True once a news older than the months of interest was found.
+    pages_read : int
+        Number of result pages given to 'add_page()'.
+    items_parsed : int
+        Number of news whose date was checked.
+    items_skipped : int
+        Number of news whose date could not be parsed, they are left out without stopping the crawl.
+    reached_known : bool
+        True once an incremental crawl found a page of news that were all already stored.
+    items_from_store : int
+        Number of news taken from the store by 'finish()'.
+
+    Methods
+    -------
+    add_page(promos)
+        Adds the news of a result page and tells whether the next page is needed.
+    new_items()
+        Returns the news collected since the last call, so they can be streamed page by page.
+    finish()
+        Returns the news data, completed with the stored news if the crawl stopped at a known page.
+    """
+
+    def __init__(self, search_phrase, num_months, news_category=None, store=None, incremental=False, now=None,
+                 stop_at_cutoff=True):
+        self.search_phrase = search_phrase
+        self.news_category = news_category
+        self.store = store
+        self.incremental = incremental and store is not None and stop_at_cutoff
+        self.now = now
+        self.stop_at_cutoff = stop_at_cutoff
+        self.window = DateWindow(num_months, today=now.date() if now else None)
+        self.news_data = []
+        self.reached_cutoff = False
+        self.pages_read = 0
+        self.items_parsed = 0
+        self.items_skipped = 0
+        self.reached_known = False
+        self.items_from_store = 0
+        self.keys = set()  # The store keys of the news collected
+        self._taken = 0  # The news already returned by 'new_items()'
+        logger.info(self.window)
+
+    def add_page(self, promos):
+        """
+        Adds the news of a result page, stopping at the first one out of the months of interest.
+
+        Parameters
+        ----------
+        promos : iterable of dict
+            The raw fields of the news of the page, as yielded by 'iter_promos()'.
+
+        Returns
+        -------
+        bool
+            True if the next page is needed, False once the cutoff (or a known page) was reached.
+        """
+        self.pages_read += 1
+        now = self.now or datetime.now()  # Every relative date of the page is counted back from the same time
+        kept = []
+        for promo in promos:
+            self.items_parsed += 1
+            ordinal = self.window.ordinal(promo["date"], now)
+            position = self.window.compare(ordinal)
+
+            # Only a news older than the window stops the crawl, a date we can not read is just left out
+            if position == -1 and self.stop_at_cutoff:
+                logger.info(f"The news dated '{promo['date']}' is older than the months of interest, we stop here")
+                self.reached_cutoff = True
+                break
+            if position != 0:
+                logger.warning(f"The news dated '{promo['date']}' is not in the months of interest, we skip it")
+                self.items_skipped += 1
+                continue
+            kept.append((promo, ordinal))
+
+        # Here we build the news of interest of the whole page at once, their money is found in a single scan
+        self.news_data.extend(build_news_items(kept, len(self.news_data) + 1, self.search_phrase))
+        if kept and self.store is not None:
+            self.record_page([(self.store.article_key(promo), promo, ordinal) for promo, ordinal in kept], now)
+        return not (self.reached_cutoff or self.reached_known)
+
+    def record_page(self, entries, now):
+        """
+        Stores the news of interest of a page and, in an incremental crawl, stops if all were already stored.
+
+        Returns
+        -------
+        None
+        """
+        keys = {key for key, _, _ in entries}
+        known = self.store.known_keys(self.search_phrase, self.news_category, list(keys))
+        self.store.add(self.search_phrase, self.news_category, entries, now)
+        self.keys |= keys
+        if self.incremental and known == keys:
+            logger.info(f"Every news of the page {self.pages_read} was found by an earlier run, we stop here")
+            self.reached_known = True
+
+    def new_items(self):
+        """
+        Returns the news collected since the last call, for example those of the page just added.
+
+        Returns
+        -------
+        list of NewsItem
+            The new news, in order.
+        """
+        items = self.news_data[self._taken:]
+        self._taken = len(self.news_data)
+        return items
+
+    def finish(self):
+        """
+        Returns the news data. If an incremental crawl stopped at a known page, the older news of the months
+        of interest are taken from the store, so the export has the same news as a full crawl.
+
+        Returns
+        -------
+        list of dict
+            The news data.
+        """
+        if self.reached_known and not self.reached_cutoff:
+            stored = self.store.articles(self.search_phrase, self.news_category, self.window, exclude=self.keys)
+            kept = [(promo, ordinal) for _, promo, ordinal in stored]
+            self.news_data.extend(build_news_items(kept, len(self.news_data) + 1, self.search_phrase))
+            self.keys.update(key for key, _, _ in stored)
+            self.items_from_store += len(stored)
+            logger.info(f"{self.items_from_store} older news of interest taken from the article store")
+        return self.news_data
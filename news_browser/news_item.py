@@ -0,0 +1,159 @@
+# The keys of the 'news_data' dictionaries, all of them can still be read from a NewsItem
+KEYS = ("title", "date", "description", "image_url", "image_alt", "article_url", "phrase_matches",
+        "contain_money", "money_amounts", "news_name", "image_path", "excel_filename", "bool", "month_ordinal")
+
+# The keys whose missing value was written as "N/A" in the dictionaries
+TEXT_KEYS = frozenset(("title", "date", "description", "image_url", "image_alt", "article_url", "image_path"))
+
+# The keys that are derived from other fields, so they can not be set
+DERIVED_KEYS = frozenset(("contain_money", "news_name", "excel_filename"))
+
+# The keys whose attribute has another name
+ATTRIBUTES = {"bool": "in_window"}
+
+
+def none_if_missing(value):
+    """
+    Returns None for the "N/A" placeholder of a missing value, the value otherwise.
+    """
+    return None if value == "N/A" else value
+
+
+def has_image(item):
+    """
+    Tells whether a news has a picture: a NewsItem has no image path until its image is downloaded, so
+    its picture is its image URL, an old dictionary without picture has "N/A" as its image path.
+    """
+    if isinstance(item, NewsItem):
+        return item.image_url is not None
+    return item.get("image_path") != "N/A"
+
+
+class NewsItem:
+    """
+    A news of a search, the compact replacement of the 'news_data' dictionaries.
+
+    The fields are slots (no per instance dictionary), a missing value is None instead of "N/A", and the
+    names and paths that only depend on the position of the news are derived when they are read. The
+    image path is only known once the image is downloaded, until then it is "N/A".
+
+    The news can still be read (and its image path written) like the old dictionary, item["image_path"],
+    item.get("image_url"), "N/A" included, so every consumer of 'news_data' works with both.
+
+    Parameters
+    ----------
+    index : int
+        Position of the news in the whole search, starting at 1.
+    title, date, description : str or None
+        The texts of the news.
+    image_url, image_alt, article_url : str or None
+        The picture and the link of the news.
+    phrase_matches : int
+        Occurrences of the search phrase in the title and description.
+    money_amounts : list of dict, optional
+        The amounts of money of the title and description, see 'money.extract_money()'.
+    in_window : bool
+        Whether the date of the news is in the months of interest.
+    month_ordinal : int, optional
+        The month of the news as year * 12 + month.
+
+    Attributes
+    ----------
+    downloaded_path : str or None
+        The path of the downloaded image, set by the ImageDownloader.
+
+    Methods
+    -------
+    to_dict()
+        Returns the news as the old 'news_data' dictionary.
+    """
+
+    __slots__ = ("index", "title", "date", "description", "image_url", "image_alt", "article_url",
+                 "phrase_matches", "money_amounts", "in_window", "month_ordinal", "downloaded_path")
+
+    def __init__(self, index, title=None, date=None, description=None, image_url=None, image_alt=None,
+                 article_url=None, phrase_matches=0, money_amounts=None, in_window=True, month_ordinal=None):
+        self.index = index
+        self.title = title
+        self.date = date
+        self.description = description
+        self.image_url = image_url
+        self.image_alt = image_alt
+        self.article_url = article_url
+        self.phrase_matches = phrase_matches
+        self.money_amounts = money_amounts or []
+        self.in_window = in_window
+        self.month_ordinal = month_ordinal
+        self.downloaded_path = None
+
+    @property
+    def contain_money(self):
+        return bool(self.money_amounts)
+
+    @property
+    def news_name(self):
+        return f"news{self.index}"
+
+    @property
+    def image_path(self):
+        # The directory of the images depends on the search, so there is no path until the download
+        return self.downloaded_path
+
+    @property
+    def excel_filename(self):
+        return f"output/excel_files/news{self.index}.xlsx"
+
+    def __getitem__(self, key):
+        if key not in KEYS:
+            raise KeyError(key)
+        value = getattr(self, ATTRIBUTES.get(key, key))
+        return "N/A" if value is None and key in TEXT_KEYS else value
+
+    def __setitem__(self, key, value):
+        if key not in KEYS or key in DERIVED_KEYS:
+            raise KeyError(key)
+        if key in TEXT_KEYS:
+            value = none_if_missing(value)
+        setattr(self, "downloaded_path" if key == "image_path" else ATTRIBUTES.get(key, key), value)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        return key in KEYS
+
+    def __iter__(self):
+        return iter(KEYS)
+
+    def __len__(self):
+        return len(KEYS)
+
+    def keys(self):
+        return KEYS
+
+    def items(self):
+        return [(key, self[key]) for key in KEYS]
+
+    def to_dict(self):
+        """
+        Returns the news as the old 'news_data' dictionary, with "N/A" for the missing values.
+
+        Returns
+        -------
+        dict
+            The news data.
+        """
+        return dict(self.items())
+
+    def __eq__(self, other):
+        if not isinstance(other, NewsItem):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None  # The image path changes when it is downloaded
+
+    def __repr__(self):
+        return f"NewsItem({self.index}, {self.title!r}, {self.date!r})"
@@ -1,8 +1,9 @@
 # Standard Python library imports
-import time
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 # Third party libraries imports
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import StaleElementReferenceException
 from RPA.Browser.Selenium import Selenium
 # from RPA.Browser.Selenium import exec_javascript
 # from RPA.Excel.Files import ExcelFile
@@ -10,13 +11,30 @@ from RPA.Robocorp.WorkItems import WorkItems
 
 # Local module imports
 from .my_logger import logger
-from .utils import (
-    format_current_date,
-    convert_date_to_mm_aaaa,
-    word_counter,
-    does_it_contain_money,
-    calculate_months_to_consider
-)
+from .news_collector import NewsCollector
+from .promo_parser import find_topic, iter_promos, parse_topics
+from .tracing import span, traced
+from .waits import PageWaiter
+
+
+# Extracts the news of the results in the browser, with the same rules as 'promo_parser.iter_promos()',
+# so a single call per page returns a compact list instead of the whole HTML
+PROMOS_SCRIPT = """
+var container = document.querySelector('.search-results-module-results-menu') || document;
+var text = function (element) { return element ? element.textContent.trim() : 'N/A'; };
+return Array.prototype.map.call(container.querySelectorAll('div.promo-wrapper'), function (item) {
+    var image = item.querySelector('img.image');
+    var link = item.querySelector('h3.promo-title a[href]');
+    return {
+        title: text(item.querySelector('h3.promo-title')),
+        description: text(item.querySelector('p.promo-description')),
+        date: text(item.querySelector('p.promo-timestamp')),
+        image_url: image ? image.getAttribute('src') : 'N/A',
+        image_alt: image ? image.getAttribute('alt') : 'N/A',
+        article_url: link ? link.getAttribute('href') : 'N/A'
+    };
+});
+"""
 
 
 class NewsScraper:
@@ -29,6 +47,16 @@ class NewsScraper:
         The Selenium Browser instance used to interact with the website.
     workitems : dict
         Configuration dictionary containing search parameters and other settings.
+    waiter : PageWaiter, optional
+        The wait layer shared with the NewsBrowser, a new one is created if not given.
+    parallel_pages : int
+        Number of result pages loaded at the same time in parallel tabs.
+    engine : str, optional
+        The HTML extraction engine ("lxml" or "soup").
+    extraction_mode : str
+        "html" (parse the results HTML in Python) or "js" (extract the news in the browser).
+    topic_cache : TopicCache, optional
+        The facet id of every category already found, per search phrase.
 
     Methods
     -------
@@ -36,11 +64,28 @@ class NewsScraper:
         Checks if the search query returned no results.
     search_news()
         Performs a search on the website based on the provided configuration.
+    select_topic(news_category)
+        Finds the topic of the category in the topic box and clicks it.
+    open_facet(facet_id)
+        Loads the results of a topic directly from its facet id.
     scrap_news()
         Scrapes the news articles from the search results.
     """
 
-    def __init__(self, browser, workitems):
+    # Locators shared by several steps
+    results_locator = "class:search-results-module-results-menu"
+    no_results_locator = "class:search-results-module-no-results"
+    promo_locator = "css:div.promo-wrapper"
+    sort_locator = "css:select.select-input"
+
+    # Seconds we wait for the results to be rendered again after sorting by 'Newest'. Results that were
+    # already sorted are not rendered again, so this wait is kept short and the sort is checked afterwards
+    sort_timeout = 2
+    # The value of the 's' parameter of the search URL once the results are sorted by 'Newest'
+    newest_sort = "1"
+
+    def __init__(self, browser, workitems, waiter=None, parallel_pages=1, engine=None, extraction_mode="html",
+                 topic_cache=None, article_store=None, incremental=False, recorder=None):
         """
         Initializes the NewsScraper with a WebDriver and configuration.
 
@@ -50,9 +95,49 @@ class NewsScraper:
             The Selenium Browser instance used to interact with the website.
         workitems : json
             Workitems json containing search parameters and other settings.
+        waiter : PageWaiter, optional
+            The wait layer shared with the NewsBrowser.
+        parallel_pages : int
+            Number of result pages loaded at the same time in parallel tabs, 1 to read them one by one.
+        engine : str, optional
+            The HTML extraction engine ("lxml" or "soup"), see 'promo_parser.parse_page()'.
+        extraction_mode : str
+            "html" to parse the results HTML in Python, "js" to extract the news in the browser.
+        topic_cache : TopicCache, optional
+            If given, the facet of a category found for a search phrase is reused by the next searches.
+        article_store : ArticleStore, optional
+            If given, the news found are recorded in it.
+        incremental : bool
+            If True, the crawl stops at the first page whose news are all in the article store.
+        recorder : SessionRecorder, optional
+            If given, the results pages and the topic box read are recorded, to be replayed without the site.
         """
         self.browser = browser
         self.workitems = workitems
+        self.waiter = waiter or PageWaiter(browser)
+        self.parallel_pages = parallel_pages
+        self.engine = engine
+        self.extraction_mode = extraction_mode
+        self.topic_cache = topic_cache
+        self.article_store = article_store
+        self.incremental = incremental
+        self.recorder = recorder
+        self.collector = None  # The NewsCollector of the last scraping, it has the crawl statistics
+        self.sorted_by_newest = True  # Whether the last search could be sorted by 'Newest'
+
+    def first_promo(self):
+        """
+        Returns the first news element of the current results, or None if there is none.
+
+        We keep it before any action that reloads the results, once it is stale we know
+        the old results are gone, so we do not need to sleep.
+
+        Returns
+        -------
+        selenium.webdriver.remote.webelement.WebElement or None
+        """
+        promos = self.browser.find_elements(self.promo_locator)
+        return promos[0] if promos else None
 
     def no_results_search(self):
         """
@@ -65,19 +150,75 @@ class NewsScraper:
         """
         logger.info("Starting 'no_results_search' function")
 
-        # Here we try to obtain the element that contains 'There are not any results that match ...'
-        # This is because some searches may find nothing and that needs to be catched
+        # Here we wait for whichever comes first, the results or the element that contains
+        # 'There are not any results that match ...', because some searches may find nothing and that needs to be catched
         try:
-            no_results_locator = "class:search-results-module-no-results"
-            self.browser.wait_until_element_is_visible(no_results_locator, timeout = 20)
-            inner_text = self.browser.get_text(no_results_locator)
+            found = self.waiter.any_visible([self.results_locator, self.no_results_locator], "search results loaded")
+        except TimeoutError:
+            logger.info("Neither the results nor the 'no results' message were found")
+            return False
+
+        if found == self.no_results_locator:
+            inner_text = self.browser.get_text(self.no_results_locator)
             logger.info(inner_text)
-            time.sleep(1)
             return "There are not any results that match" in inner_text
-        except:
-            logger.info("There are results that match")
+
+        logger.info("There are results that match")
+        return False
+
+    def is_sorted_by_newest(self):
+        """
+        Tells whether the current results are sorted by 'Newest': the 'Sort By' select shows it and the
+        search URL has its 's' parameter.
+
+        Returns
+        -------
+        bool
+            True if the results are sorted by 'Newest'.
+        """
+        try:
+            label = self.browser.get_selected_list_label(self.sort_locator)
+            query = dict(parse_qsl(urlsplit(self.browser.get_location()).query))
+        except Exception:
             return False
+        return label == "Newest" and query.get("s") == self.newest_sort
+
+    def sort_by_newest(self, attempts=2):
+        """
+        Selects the 'Newest' option of the 'Sort By' dropdown and waits for the results to be rendered again.
+
+        Results that were already sorted are not rendered again, so after a short wait we check the sort
+        itself, and select it again if it was not applied.
 
+        Parameters
+        ----------
+        attempts : int
+            How many times the 'Newest' option is selected before giving up.
+
+        Returns
+        -------
+        bool
+            True once the results are sorted by 'Newest', False if they could not be sorted.
+        """
+        for attempt in range(1, attempts + 1):
+            # Sorting renders the results again, so we wait for the first news to be replaced or to change
+            old_promo = self.first_promo()
+            self.browser.select_from_list_by_label(self.sort_locator, 'Newest')
+            try:
+                self.waiter.select_value(self.sort_locator, 'Newest', "sort by newest applied")
+                self.waiter.rerendered(old_promo, self.first_promo, "results sorted by newest",
+                                       timeout=self.sort_timeout)
+                logger.info("We succesfully selected the 'Newest' option")
+                return True
+            except TimeoutError:
+                pass
+            if self.is_sorted_by_newest():
+                logger.info("The results did not change after sorting by 'Newest', they were already sorted")
+                return True
+            logger.warning(f"The results are not sorted by 'Newest' yet (attempt {attempt} of {attempts})")
+        return False
+
+    @traced("search_news")
     def search_news(self, search_phrase, news_category):
         """
         Performs a search on the website based on the provided configuration.
@@ -91,29 +232,69 @@ class NewsScraper:
 
         # We try to locate the search button and input
         search_button = 'css:button[data-element="search-button"]'
-        self.browser.wait_until_element_is_visible(search_button, timeout=20)
+        self.waiter.element_visible(search_button, "search button visible")
         self.browser.click_element(search_button)
         logger.info("We found the search locator and we clicked on it")
-        time.sleep(1)
 
         search_input = 'css:input[data-element="search-form-input"]'
-        self.browser.wait_until_element_is_visible(search_input, timeout=20)
+        self.waiter.element_visible(search_input, "search input visible")
         self.browser.click_element(search_input)
         self.browser.press_keys(search_input, search_phrase + "\n")
         logger.info(f"We found the input locator and we searched '{search_phrase}'")
-        time.sleep(2)
 
         # Here we call the 'no_results_search()' function to see if there were not results
         if self.no_results_search():
             logger.warning(f"No results found for search: {search_phrase}")
+            if self.recorder:
+                self.recorder.session["no_results"] = True
             return False
 
-        # We directly select the 'Newest' option from 'Sort By' dropdown button
-        newest = "css:select.select-input"
-        self.browser.select_from_list_by_label(newest, 'Newest')
-        logger.info("We succesfully selected the 'Newest' option")
-        time.sleep(1)
+        # The crawl stops at the first news older than the months of interest, which is only right if the
+        # results are sorted by 'Newest'. If we can not sort them, every page is read instead
+        self.sorted_by_newest = self.sort_by_newest()
+        if not self.sorted_by_newest:
+            logger.warning("The results could not be sorted by 'Newest', the crawl will not stop at the first "
+                           "old news for this search")
+
+        # If we already know the facet of the category for this search phrase,
+        # we skip the filters and the topic box and load the filtered results directly
+        facet_id = self.topic_cache.get(search_phrase, news_category) if self.topic_cache else None
+        if facet_id:
+            if self.recorder:
+                self.recorder.session["facet_id"] = facet_id
+            self.open_facet(facet_id)
+            return True
+
+        topic = self.select_topic(news_category)
+
+        # If there is not a Topic found to click, then the Topic does not exist or we could not find it
+        if topic is None:
+            logger.warning(f"No '{news_category}' category found for search '{search_phrase}'")
+            return False
 
+        # We remember the facet of the category, so the next search of the same phrase skips all this
+        if self.topic_cache and topic["value"]:
+            self.topic_cache.put(search_phrase, news_category, topic["value"])
+            self.topic_cache.save()
+        return True
+
+    def select_topic(self, news_category):
+        """
+        Opens the topic box, finds the topic of the news category and clicks its checkbox.
+
+        The labels of every topic are read from a single outerHTML of the topic box, and the checkbox
+        clicked is located by its value (the facet id of the topic), so it always belongs to the matching topic.
+
+        Parameters
+        ----------
+        news_category : str
+            The desired category of the search.
+
+        Returns
+        -------
+        dict or None
+            The topic clicked (its labels and facet id), or None if no topic matches the category.
+        """
         # We locate the Filter Button and click on it
         # If the site opens maximized there is no need to do this but there is
         # not any error clicking on it on that case so we dont overcode here if not needed
@@ -122,99 +303,298 @@ class NewsScraper:
         if filter_visible:
             self.browser.click_element(filter_button)
             logger.info("We succesfully clicked the 'Filters' button")
-            time.sleep(1)
-
-        logger.info("There was not a 'Filters' button visible") # This is the case that 'Filters' button is not found
+        else:
+            logger.info("There was not a 'Filters' button visible") # This is the case that 'Filters' button is not found
 
         # The topics are hidden by an element, so we click on 'See All' button to see all topics
         see_all_button = "css:span.see-all-text"
-        self.browser.wait_until_element_is_visible(see_all_button, timeout=20)
+        self.waiter.element_visible(see_all_button, "'See all' button visible")
         self.browser.click_element(see_all_button)
         logger.info("We succesfully clicked the 'See all' button")
-        time.sleep(1)
 
         # Here we obtain all data contained on the 'topic box'.
         # Thats how I called it, a box that contains all topics
         topics_box = "css:ul.search-filter-menu"
-        self.browser.wait_until_element_is_visible(topics_box, timeout=20)
+        self.waiter.element_visible(topics_box, "topics box visible")
         topics_box = self.browser.get_webelement(topics_box)
         logger.info("We succesfully found the box with all the topics")
         logger.debug(f"topics_box = {topics_box}")
 
-
-        # Here, we obtain the topic click-box element for every topic on the website
-        # This needs some revision because later we will iterate over it
-        # Since I dont dominate RPA.Browser.Selenium, I dont really know how to get some info from web elements
-        # As I do from pure Selenium, you will see later on the next cycle why this needs revision
-        topic_element = "css:div.search-filter-input.SearchFilterInput div.checkbox-input input.checkbox-input-element"
-        # topics_elements = self.browser.get_webelements("css:ul.search-filter-menu > li") ## This is in case we knew how to handle list info correctly
-        topics_elements = self.browser.get_webelements(topic_element)
-        logger.info("And now from the topic box, we have all topic names")
-        logger.info(f"Number of topic found {len(topics_elements)}")
-        logger.debug(f"topics_elements = {topics_elements}")
-
-        # Here we declare a 'soup' variable that gets all HTML info from the topic box
-        # So we later iterate over it to find the inner text which contains the topic names
-        soup = BeautifulSoup(topics_box.get_attribute("outerHTML"), "html.parser")
-        topics_list = soup.find_all('li')
-        logger.info("And now from the topic box, we have all topic names")
+        # Here we parse all HTML info from the topic box, every topic (li) with the texts of its spans
+        # and the value of its checkbox, and we look for the category among them in a single pass
+        topics_html = topics_box.get_attribute("outerHTML")
+        if self.recorder:
+            self.recorder.add_topics(topics_html)
+        topics_list = parse_topics(topics_html, self.engine)
+        logger.info(f"Number of topic found {len(topics_list)}")
         logger.debug(f"topics_list = {topics_list}")
 
-        # Ok, lets find out what this cycle does
-        #   - topics_list: Contains all list (li) values from the topic box
-        #   - topics_elements: Contains all box input elements for all the topics
-        # Why we iterate with zip? I tried many different ways to obtain the input element from a current element
-        # And I tried many things:
-        #   - JavaScript Executions
-        #   - Beautiful Soup Find by Tag, Class, etc
-        # But could not find any wat to find the box element, so I directly found all input elements previously to keep it going
-        # Why do I say it needs revision? Because this is not clean, if the elements found are not in the same order as the
-        # topic list, then I will click another input box, so I will find news from a different Topic than asked.
-        for topic, topic_element in zip(topics_list, topics_elements):
-            # logger.debug(f"topic = {topic}")
-            all_span = topic.find_all('span')
-            for span in all_span:
-                topic_text = span.get_text(strip=True)
-                logger.debug(f"We compare {topic_text} with {news_category}")
-                if topic_text.lower() == news_category.lower():
-                    logger.info(f"Found a matching category which is {topic_text}")
-                    logger.debug(f"topic = {topic}")
-                    logger.debug(f"topic_element = {topic_element}")
-                    self.browser.click_element(topic_element)
-                    # Just for debug we could take some screenshots of the element(s) we are getting
-                    # filename = self.browser.capture_element_screenshot(topic_element, "element_screenshot.png")
-                    # logger.info(self.browser.capture_element_screenshot(topic_element, "element_screenshot.png"))
-
-                    time.sleep(2)
-                    logger.info("We clicked the topic")
-
-                    # We try to click the apply button, if we cant its mostly because it was not needed
-                    # Sometimes the site, when clicking the topic box, starts the search automatically
-                    # Some other times, it does not, so we click the apply button if it is visible.
-                    try:
-                        apply_button = "css:button.button.apply-button"
-                        self.browser.click_element(apply_button)
-                        logger.info("We succesfully clicked the 'apply' button")
-                        time.sleep(3)
-                    except Exception as e:
-                        logger.warning("Maybe we could not find the 'Apply' button")
-                        logger.warning("Or the Search was done previously when clicking the topic")
-                        logger.warning(f"Did not find the 'Apply' button: {e}")
-
-                    # Here, we return True because we found a match for the topic
-                    #So, there is no reason to keep looking for topic matches.
-                    return True
-            
-            # We declare the variable 'topic_element' as False, because if the procces did not previously returned
-            # a True value, then it is because there was not match found for the topic
-            topic_element = False
-
-        # If there is not a Topic Element found to click, then the Topic does not exist or we could not find it
-        if not topic_element:
-            logger.warning(f"No '{news_category}' category found for search '{search_phrase}'")
-            return False
+        match = find_topic(topics_list, news_category)
+        if match is None:
+            return None
+        position, topic = match
+        logger.info(f"Found a matching category which is {news_category}")
+        logger.debug(f"topic = {topic}")
+
+        # The checkbox is located by its value, which is unique for every topic.
+        # If it had no value, we take the checkbox of the topic (li) at the same position of the box
+        if topic["value"]:
+            topic_element = f'css:ul.search-filter-menu input.checkbox-input-element[value="{topic["value"]}"]'
+        else:
+            topic_item = self.browser.find_elements("tag:li", parent=topics_box)[position]
+            topic_element = self.browser.find_element("css:input.checkbox-input-element", parent=topic_item)
+        logger.debug(f"topic_element = {topic_element}")
+
+        old_promo = self.first_promo()
+        self.browser.click_element(topic_element)
+        logger.info("We clicked the topic")
+
+        # Sometimes the site, when clicking the topic box, starts the search automatically
+        # Some other times, it does not, so we wait for whichever happens first:
+        # the old results go away or the apply button shows up (and then we click it)
+        self.apply_topic_filter(old_promo)
+        return topic
+
+    def open_facet(self, facet_id):
+        """
+        Loads the current search filtered by a topic, without going through the topic box.
+
+        Parameters
+        ----------
+        facet_id : str
+            The facet id of the topic, as found in the value of its checkbox.
+
+        Returns
+        -------
+        None
+        """
+        url = self.facet_url(self.browser.get_location(), facet_id)
+        logger.info(f"Going directly to the results of the topic: {url}")
+        self.browser.go_to(url)
+        self.waiter.page_ready("topic results loaded")
+        self.waiter.any_visible([self.results_locator, self.no_results_locator], "topic results visible")
+
+    def apply_topic_filter(self, old_promo):
+        """
+        Makes sure the topic filter is applied after clicking a topic box.
+
+        Parameters
+        ----------
+        old_promo : selenium.webdriver.remote.webelement.WebElement or None
+            The first news element before clicking the topic.
+
+        Returns
+        -------
+        None
+        """
+        apply_button = "css:button.button.apply-button"
+
+        def stale_or_apply_visible():
+            try:
+                if old_promo is not None:
+                    old_promo.is_enabled()
+            except StaleElementReferenceException:
+                return "stale"
+            return "apply" if self.browser.is_element_visible(apply_button) else None
+
+        try:
+            state = self.waiter.until(stale_or_apply_visible, "topic search started or apply button visible")
+        except TimeoutError as e:
+            logger.warning("Maybe we could not find the 'Apply' button")
+            logger.warning("Or the Search was done previously when clicking the topic")
+            logger.warning(f"Did not find the 'Apply' button: {e}")
+            return
+
+        if state == "apply":
+            self.browser.click_element(apply_button)
+            logger.info("We succesfully clicked the 'apply' button")
+            self.waiter.staleness(old_promo, "topic filter applied")
+
+    def read_results_html(self):
+        """
+        Waits for the results of the current tab and returns their HTML.
+
+        Returns
+        -------
+        str
+            The outerHTML of the box that contains the news.
+        """
+        # Here we obtain all the news info whic is contained in some kind of box (I say it is kind of a box)
+        news_box = self.results_locator
+        self.waiter.element_visible(news_box, "results visible")
+        news_box = self.browser.get_webelement(news_box)
+        logger.info("Succesfully obtained the WebElement that contains the news")
+        logger.debug(f"news_box = {news_box}")
+        html = news_box.get_attribute("outerHTML")
+        if self.recorder:
+            self.recorder.add_page(html)
+        return html
+
+    def read_results(self):
+        """
+        Reads the raw fields of the news of the current tab.
 
-        # return True
+        With the "html" extraction mode, the results HTML is sent over the WebDriver and parsed in Python.
+        With the "js" mode, the news are extracted by the browser itself in a single JavaScript call,
+        which only sends back the fields we need.
+
+        Returns
+        -------
+        iterable of dict
+            The raw fields of every news, as yielded by 'promo_parser.iter_promos()'.
+        """
+        # A recorded session needs the HTML of the pages, so it is always read with the "html" mode
+        if self.extraction_mode == "js" and self.recorder is None:
+            self.waiter.element_visible(self.results_locator, "results visible")
+            promos = self.browser.execute_javascript(PROMOS_SCRIPT)
+            logger.info(f"Extracted {len(promos)} news in the browser")
+            return promos
+        return iter_promos(self.read_results_html(), self.engine)
+
+    def read_page_counts(self):
+        """
+        Reads the page counter of the results (for example '1 of 17').
+
+        Returns
+        -------
+        int or None
+            The total number of pages, or None if the counter was not found.
+        """
+        number_of_pages = "css:div.search-results-module-page-counts"
+        self.waiter.element_visible(number_of_pages, "page counts visible")
+        text = self.browser.get_text(number_of_pages)
+        logger.info(f"Number of pages: {text}")
+        match = re.search(r"of\s+([\d,]+)", text)
+        return int(match.group(1).replace(",", "")) if match else None
+
+    @staticmethod
+    def facet_url(url, facet_id):
+        """
+        Returns the URL of the first results page of a search filtered by a topic.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the current results (search and sort already applied).
+        facet_id : str
+            The facet id of the topic.
+
+        Returns
+        -------
+        str
+            The same URL with the topic parameter ('f0') set and without page parameter ('p').
+        """
+        parts = urlsplit(url)
+        query = [(key, value) for key, value in parse_qsl(parts.query) if key not in ("f0", "p")]
+        query.append(("f0", facet_id))
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    @staticmethod
+    def page_url(url, page_number):
+        """
+        Returns the URL of a results page, based on the URL of the first one.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the current results (search, sort and topic already applied).
+        page_number : int
+            The number of the page.
+
+        Returns
+        -------
+        str
+            The same URL with the page parameter ('p') set.
+        """
+        parts = urlsplit(url)
+        query = [(key, value) for key, value in parse_qsl(parts.query) if key != "p"]
+        query.append(("p", str(page_number)))
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    def iter_pages_sequential(self, last_page):
+        """
+        Yields the news of every page, clicking 'Next Page' only when the next one is asked for.
+
+        Parameters
+        ----------
+        last_page : int
+            The last page that can be read.
+
+        Yields
+        ------
+        tuple of (int, iterable of dict)
+            The page number and the raw fields of its news.
+        """
+        for page_number in range(1, last_page + 1):
+            with span("page", page=page_number):
+                promos = self.read_results()
+            yield page_number, promos
+
+            # If we are here, the caller wants the next page
+            if page_number < last_page:
+                with span("next_page", page=page_number + 1):
+                    next_page = "class:search-results-module-next-page"
+                    self.waiter.element_visible(next_page, "'Next Page' button visible")
+                    old_promo = self.first_promo()
+                    self.browser.click_element(next_page)
+                    logger.info("Succesfully clicked the 'Next Page' button")
+                    self.waiter.staleness(old_promo, "next page loaded")
+
+    def iter_pages_in_tabs(self, last_page):
+        """
+        Yields the news of every page, loading the next 'parallel_pages' pages at the same time
+        in new tabs of the same browser, so their loading time overlaps.
+
+        The pages are still yielded in page order, and no more tabs are opened once the caller stops asking.
+
+        Parameters
+        ----------
+        last_page : int
+            The last page that can be read.
+
+        Yields
+        ------
+        tuple of (int, iterable of dict)
+            The page number and the raw fields of its news.
+        """
+        driver = self.browser.driver
+        main_tab = driver.current_window_handle
+        first_url = self.browser.get_location()
+
+        # The first page is the one we already have
+        with span("page", page=1):
+            promos = self.read_results()
+        yield 1, promos
+
+        next_page = 2
+        while next_page <= last_page:
+            batch = range(next_page, min(next_page + self.parallel_pages, last_page + 1))
+            next_page = batch.stop
+
+            # We open every page of the batch, Chrome loads all of them at the same time
+            tabs = []
+            for page_number in batch:
+                handles = set(driver.window_handles)
+                driver.execute_script("window.open(arguments[0], '_blank');", self.page_url(first_url, page_number))
+                tabs.append((page_number, (set(driver.window_handles) - handles).pop()))
+            logger.info(f"Opened the pages {batch.start} to {batch.stop - 1} in parallel tabs")
+
+            # And then we read them in order, closing every tab once it is read
+            try:
+                for page_number, tab in tabs:
+                    with span("page", page=page_number):
+                        driver.switch_to.window(tab)
+                        promos = self.read_results()
+                        driver.close()
+                        driver.switch_to.window(main_tab)
+                    yield page_number, promos
+            finally:
+                # If the caller stopped before the end of the batch, we close the tabs left
+                for _, tab in tabs:
+                    if tab in driver.window_handles:
+                        driver.switch_to.window(tab)
+                        driver.close()
+                driver.switch_to.window(main_tab)
 
     def scrap_news(self, search_phrase, news_category, num_months):
         """
@@ -226,117 +606,75 @@ class NewsScraper:
             A list of dictionaries containing the scraped news data.
         """
         logger.info("Starting scrap_news function")
+        return [item for items in self.iter_news(search_phrase, news_category, num_months) for item in items]
+
+    def iter_news(self, search_phrase, news_category, num_months):
+        """
+        Scrapes the news articles from the search results, yielding the news of every page as soon as it is read,
+        so they can be downloaded and exported while the next page loads.
+
+        Yields
+        ------
+        list of NewsItem
+            The news of interest of a page. The older news taken from the article store come last.
+        """
+        self.collector = None
+        if self.recorder:
+            self.recorder.begin(search_phrase, news_category, num_months)
 
         # Here we call the 'search_news' function
         if not self.search_news(search_phrase, news_category):
-            return []
+            return
 
         # There is a subscription limit (I guess) which limits us to only 10 pages
         subscription, max_pages = False, 10
 
-        # We initialize the news_data list which will contain all news info in dictionaries
-        news_data = []
-        index = 1
+        # The collector keeps the news_data list and knows the months and years that will be considered,
+        # so it tells us as soon as a news is too old and there is no reason to keep reading
+        collector = NewsCollector(search_phrase, num_months, news_category, self.article_store, self.incremental,
+                                  stop_at_cutoff=self.sorted_by_newest)
+        self.collector = collector
 
-        # We call the function to return us what months and years will be considered for the scraping
-        months_to_consider = calculate_months_to_consider(num_months)
-        logger.info(months_to_consider)
-
-        # For kind of debug, we obtain the number of pages that the search returns
+        # We obtain the number of pages that the search returns, so we know where to stop
         try:
-            number_of_pages = "css:div.search-results-module-page-counts"
-            self.browser.wait_until_element_is_visible(number_of_pages, timeout=20)
-            number_of_pages = self.browser.get_webelement(number_of_pages)
-            number_of_pages = self.browser.get_text(number_of_pages)
-            logger.info(f"Number of pages for searching '{search_phrase}' with the topic '{news_category}': {number_of_pages}")
+            total_pages = self.read_page_counts()
         except Exception as e:
+            total_pages = None
             logger.warning(f"Maybe searching for '{search_phrase} on the topic '{news_category}' found only one page")
             logger.warning(f"Did not find the 'Number of pages' text: {e}")
-        #return True
-
-        # We initialize the index in 1 because is easer to debug and find the news in the files later manually
-        # (At least it is easier for me)
-        for page_number in range(1, max_pages + 1):
-            # logger.info(f"Currently on the page number {number_of_pages}")
-
-            # Here we obtain all the news info whic is contained in some kind of box (I say it is kind of a box)
-            news_box = "class:search-results-module-results-menu"
-            self.browser.wait_until_element_is_visible(news_box, timeout=20)
-            news_box = self.browser.get_webelement(news_box)
-            logger.info("Succesfully obtained the WebElement that contains the news")
-            logger.debug(f"news_box = {news_box}")
-
-            # We declare a 'soup' variable from which we will obtain all the data needed
-            soup = BeautifulSoup(news_box.get_attribute("outerHTML"), "html.parser")
-            news_items = soup.find_all('div', class_='promo-wrapper')
-            logger.info("We obtained as well the 'promo-wrapper' info, which contains everything we need")
-            logger.debug(f"news_items = {news_items}")
-
-            # Now we iterate for every item in the list of dictionaries
-            # We find for every item:
-            #   - Title
-            #   - Description
-            #   - Date
-            #   - Image TAG (Not used for next steps)
-            #   - Image URL
-            for item in news_items:
-                title_tag = item.find('h3', class_='promo-title')
-                title = title_tag.text.strip() if title_tag else 'N/A'
-                
-                desc_tag = item.find('p', class_='promo-description')
-                desc = desc_tag.text.strip() if desc_tag else 'N/A'
-
-                text_to_match = title + desc
-                match_count = word_counter(text_to_match, search_phrase)
-                contain_money = does_it_contain_money(text_to_match)
-
-                time_tag = item.find('p', class_='promo-timestamp')
-                my_date = time_tag.text.strip() if time_tag else 'N/A'
-
-                image_tag = item.find('img', class_='image')
-                image_url = image_tag.get("src") if image_tag else "N/A"
-                image_alt = image_tag.get("alt") if image_tag else "N/A"
-                image_path = f"output/news{index}.jpg" if image_tag else "N/A"
-
-                formatted_date = convert_date_to_mm_aaaa(my_date)
-                boolean = formatted_date in months_to_consider
-
-                news_data.append({
-                    "title": title,
-                    "date": my_date,
-                    "description": desc, 
-                    'image_url': image_url,
-                    'image_alt': image_alt,
-                    "phrase_matches": match_count,
-                    "contain_money": contain_money,
-                    "news_name": f"news{index}",
-                    "image_path": image_path,
-                    "excel_filename": f"output/excel_files/news{index}.xlsx",
-                    "bool": boolean 
-                })
-
-                index += 1
-
-            logger.info("We succesfully obtained the title, description and url of all the news")
-            logger.debug(f"news_data = {news_data}")
-
-            # Then, if every item in my list of dictionaries is True and we have not reached the maximum number of pages
-            # We proceed to click the next page element, so we clearly go to the next page.
-            if all(item['bool'] for item in news_data) and page_number < max_pages:
-                next_page = "class:search-results-module-next-page"
-                self.browser.wait_until_element_is_visible(next_page, timeout=20)
-                self.browser.click_element(next_page)
-                logger.info("Succesfully clicked the 'Next Page' button")
-                time.sleep(5)
-            else:
-                if subscription:
-                    logger.warning("Subscription is enabled, but scraping beyond page 10 is not yet implemented.")
-                    break
-                if not subscription and page_number == max_pages:
-                    logger.warning("Reached the maximum number of pages for non-subscription users.")
-                    break
-                else:
-                    break
+        last_page = min(max_pages, total_pages) if total_pages else max_pages
 
+        # The pages are read lazily, the next page is only loaded if we ask for it
+        if self.parallel_pages > 1 and total_pages:
+            pages = self.iter_pages_in_tabs(last_page)
+        else:
+            pages = self.iter_pages_sequential(last_page)
+
+        try:
+            for page_number, promos in pages:
+                # We have the data of every 'promo-wrapper', which contains everything we need,
+                # and we build the dictionary of every news, with its date, phrase matches, money, etc.
+                with span("parse", page=page_number):
+                    keep_going = collector.add_page(promos)
+                logger.info(f"We succesfully obtained the title, description and url of the news of page {page_number}")
+                yield collector.new_items()
+
+                # Then, if every news so far is of interest we proceed to the next page,
+                # otherwise we do not even load it
+                if not keep_going:
+                    break
+                if page_number == max_pages:
+                    if subscription:
+                        logger.warning("Subscription is enabled, but scraping beyond page 10 is not yet implemented.")
+                    else:
+                        logger.warning("Reached the maximum number of pages for non-subscription users.")
+        finally:
+            # The tabs left open are closed even if the caller stops asking for pages
+            pages.close()
+
+        news_data = collector.finish()
+        logger.info(f"Read {collector.pages_read} pages and {collector.items_parsed} news, {len(news_data)} of interest")
         logger.debug(f"Collected news data: {news_data}")
-        return news_data
+        from_store = collector.new_items()
+        if from_store:
+            yield from_store
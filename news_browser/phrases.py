@@ -0,0 +1,144 @@
+# Standard Python library imports
+from collections import deque
+import re
+
+
+# The rest of the word after a match, compiled once
+_WORD_TAIL = re.compile(r"\w*")
+
+
+def _is_word_char(char):
+    # Same as the '\w' of a regular expression
+    return char.isalnum() or char == "_"
+
+
+class PhraseMatcher:
+    """
+    Counts the occurrences of several search phrases in a text with a single scan of the text.
+
+    A phrase counts once per word (or group of words) that contains it, like the original 'word_counter':
+    "test" is found twice in "This is a test sentence for testing.". The matching is case insensitive.
+
+    The phrases are compiled once into an Aho-Corasick automaton, so the cost of a text grows with its
+    length and with the number of matches, not with the number of phrases. A phrase that starts or ends
+    with a non word character (like "Trump/") is counted with its own regular expression, because its
+    matches depend on the word boundaries around it, and so is a phrase that is alone in the matcher.
+
+    Parameters
+    ----------
+    phrases : iterable of str
+        The search phrases, duplicates are counted once.
+
+    Attributes
+    ----------
+    phrases : tuple of str
+        The phrases, in their original order and case.
+
+    Methods
+    -------
+    count(text)
+        Returns the number of occurrences of every phrase in a text.
+    count_many(texts)
+        Returns the counts of every text.
+    """
+
+    def __init__(self, phrases):
+        self.phrases = tuple(dict.fromkeys(phrases))
+        self._keys = [phrase.lower() for phrase in self.phrases]
+
+        # The phrases of the automaton, and the regular expressions of the others
+        self._lengths = {}
+        self._patterns = {}
+        automaton_keys = []
+        for position, key in enumerate(self._keys):
+            # A single phrase is faster with its compiled regular expression than with the automaton
+            if len(self._keys) > 1 and key and _is_word_char(key[0]) and _is_word_char(key[-1]):
+                self._lengths[position] = len(key)
+                automaton_keys.append((position, key))
+            else:
+                self._patterns[position] = re.compile(r'\b\w*' + re.escape(key) + r'\w*\b')
+        self._delta, self._outputs = self._build(automaton_keys)
+
+    @staticmethod
+    def _build(keys):
+        """
+        Builds the automaton as a table of transitions: one dict per state, with the transitions of its
+        failure states already merged, so every character of the text is a single dict lookup.
+        A character missing from the table goes back to the root (state 0).
+        """
+        goto = [{}]
+        outputs = [[]]
+        for position, key in keys:
+            state = 0
+            for char in key:
+                if char not in goto[state]:
+                    goto.append({})
+                    outputs.append([])
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            outputs[state].append(position)
+
+        # Here we go breadth first, so the failure state of a state is always complete before it
+        delta = [None] * len(goto)
+        fail = [0] * len(goto)
+        delta[0] = dict(goto[0])
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            for char, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(char, 0) if state else 0
+                queue.append(child)
+        return delta, [tuple(output) for output in outputs]
+
+    def _count_keys(self, text):
+        counts = [0] * len(self._keys)
+        if self._lengths:
+            delta = self._delta
+            outputs = self._outputs
+            ends = [0] * len(self._keys)  # Where the last counted match of every phrase ends
+            state = 0
+            for end, char in enumerate(text):
+                state = delta[state].get(char, 0)
+                if outputs[state]:
+                    for position in outputs[state]:
+                        # A match inside the word of the previous match is the same match
+                        if end + 1 - self._lengths[position] >= ends[position]:
+                            counts[position] += 1
+                            ends[position] = _WORD_TAIL.match(text, end + 1).end()
+        for position, pattern in self._patterns.items():
+            counts[position] = len(pattern.findall(text))
+        return counts
+
+    def count(self, text):
+        """
+        Returns the number of occurrences of every phrase in a text.
+
+        Parameters
+        ----------
+        text : str
+            The text to search within, for example the title and the description of a news.
+
+        Returns
+        -------
+        dict
+            The number of occurrences of every phrase, by phrase.
+        """
+        return dict(zip(self.phrases, self._count_keys(text.lower())))
+
+    def count_many(self, texts):
+        """
+        Returns the number of occurrences of every phrase in every text.
+
+        Parameters
+        ----------
+        texts : iterable of str
+            The texts, for example those of all the news of a page.
+
+        Returns
+        -------
+        list of dict
+            The counts of every text, in the order of 'texts'.
+        """
+        return [self.count(text) for text in texts]
@@ -0,0 +1,174 @@
+# Standard Python library imports
+import queue
+import threading
+import time
+
+# Local module imports
+from .dates import is_of_interest
+from .my_logger import logger
+
+
+def has_image(item):
+    """
+    Tells whether a news has an image to download.
+    """
+    image_url = item.get("image_url")
+    return bool(image_url) and image_url != "N/A"
+
+
+class NewsPipeline:
+    """
+    A class that downloads the images and exports the news of a search while it is being scraped.
+
+    The scraper runs in the calling thread (the browser can only be driven from one thread) and every page
+    of news it yields is handed to two bounded queues:
+        - the download queue, read by 'max_workers' threads that download the images with the ImageDownloader
+        - the export queue, read by a single thread that writes the news in order, every one once its
+          image was downloaded
+    So the downloads and the file writes overlap with the navigation, and when the last page is read only
+    its own images and rows are left. The queues are bounded, so if the downloads or the export fall behind,
+    the scraping waits for them instead of piling up news in memory.
+
+    Parameters
+    ----------
+    image_downloader : ImageDownloader
+        Downloads the images, its 'max_workers' is the number of download threads.
+    window : DateWindow, optional
+        The months of interest, if given the news are selected by their month instead of their "bool" flag.
+    queue_size : int
+        Maximum number of news waiting in every queue.
+
+    Attributes
+    ----------
+    downloaded : int
+        Number of images downloaded (or taken from the cache) by the last run.
+    scraped_at : float or None
+        The 'time.perf_counter()' when the scraper yielded its last page.
+
+    Methods
+    -------
+    run(pages, export)
+        Scrapes, downloads and exports the news of a search.
+    """
+
+    def __init__(self, image_downloader, window=None, queue_size=64):
+        self.image_downloader = image_downloader
+        self.window = window
+        self.queue_size = max(1, int(queue_size))
+        self.downloaded = 0
+        self.scraped_at = None
+        self._lock = threading.Lock()
+        self._export_result = None
+        self._export_error = None
+
+    def run(self, pages, export=None):
+        """
+        Scrapes, downloads and exports the news of a search, all at the same time.
+
+        Parameters
+        ----------
+        pages : iterable of list of dict
+            The news of every page, as yielded by the 'iter_news()' of the scrapers.
+        export : callable, optional
+            Called in the export thread with an iterator of the news of interest, in order and with their
+            images downloaded, for example 'ExcelCreator.create_excel()'. If None, only the images are downloaded.
+
+        Returns
+        -------
+        tuple of (list of dict, object)
+            Every news yielded by the scraper, and what 'export' returned.
+
+        Raises
+        ------
+        Exception
+            What the scraper or 'export' raised, once every thread has stopped.
+        """
+        logger.info("Starting the streaming pipeline")
+        self.downloaded = 0
+        self.scraped_at = None
+        self._export_result = None
+        self._export_error = None
+
+        download_queue = queue.Queue(self.queue_size)
+        export_queue = queue.Queue(self.queue_size) if export else None
+        threads = [threading.Thread(target=self._download, args=(download_queue,), name=f"pipeline-download-{n}",
+                                    daemon=True)
+                   for n in range(self.image_downloader.max_workers)]
+        if export_queue is not None:
+            threads.append(threading.Thread(target=self._export, args=(export, export_queue),
+                                            name="pipeline-export", daemon=True))
+        for thread in threads:
+            thread.start()
+
+        news_data = []
+        pending = 0
+        try:
+            for items in pages:
+                for item in items:
+                    news_data.append(item)
+                    if not is_of_interest(item, self.window):
+                        continue
+                    # The export waits for this event before writing the news, so its image path is the final one
+                    done = threading.Event()
+                    if has_image(item):
+                        download_queue.put((item, done))
+                        pending += 1
+                    else:
+                        done.set()
+                    if export_queue is not None:
+                        export_queue.put((item, done))
+            self.scraped_at = time.perf_counter()
+        finally:
+            # Here we tell every thread that there is nothing else to do, and we wait for them to finish
+            for _ in range(self.image_downloader.max_workers):
+                download_queue.put(None)
+            if export_queue is not None:
+                export_queue.put(None)
+            for thread in threads:
+                thread.join()
+            self.image_downloader.save_cache()
+
+        logger.info(f"Streaming pipeline finished: {len(news_data)} news, "
+                    f"{self.downloaded}/{pending} images downloaded")
+        if self._export_error is not None:
+            raise self._export_error
+        return news_data, self._export_result
+
+    def _download(self, download_queue):
+        # A download thread: it downloads images until it receives None
+        while True:
+            task = download_queue.get()
+            if task is None:
+                return
+            item, done = task
+            try:
+                if self.image_downloader.download_image(item):
+                    with self._lock:
+                        self.downloaded += 1
+            except Exception as e:
+                logger.error(f"Failed to download image from {item.get('image_url')}: {e}")
+            finally:
+                done.set()
+
+    def _exported(self, export_queue):
+        # The news of the export queue, in order, each one once its image is downloaded
+        while True:
+            task = export_queue.get()
+            if task is None:
+                return
+            item, done = task
+            done.wait()
+            yield item
+
+    def _export(self, export, export_queue):
+        # The export thread
+        items = self._exported(export_queue)
+        try:
+            self._export_result = export(items)
+        except Exception as e:
+            logger.error(f"The export of the streaming pipeline failed: {e}")
+            self._export_error = e
+        finally:
+            # If the export stopped early, we keep emptying its queue so the scraping is never blocked
+            for _ in items:
+                pass
@@ -0,0 +1,331 @@
+# Third party libraries imports
+from bs4 import BeautifulSoup, SoupStrainer
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:  # lxml comes with rpaframework, but the BeautifulSoup engine works without it
+    lxml_html = None
+
+# Local module imports
+from .money import extract_money, extract_money_many
+from .news_item import NewsItem, none_if_missing
+from .utils import word_counter
+
+
+# The classes of the only parts of a search page that we read
+RESULTS_CLASS = "search-results-module-results-menu"
+TOPICS_CLASS = "search-filter-menu"
+NEXT_PAGE_CLASS = "search-results-module-next-page"
+NO_RESULTS_CLASS = "search-results-module-no-results"
+
+# The engine used when none is given: "lxml" if it is installed, "soup" otherwise
+DEFAULT_ENGINE = "lxml" if lxml_html is not None else "soup"
+
+
+def _has_class(name, tag="*"):
+    # XPath equivalent of BeautifulSoup's class_=name (one of the classes of the element)
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {name} ')]"
+
+
+if lxml_html is not None:
+    # The selectors are compiled once, at import time
+    _RESULTS_XPATH = etree.XPath(f"//{_has_class(RESULTS_CLASS)}")
+    _PROMOS_XPATH = etree.XPath(f".//{_has_class('promo-wrapper', 'div')}")
+    _TITLE_XPATH = etree.XPath(f".//{_has_class('promo-title', 'h3')}")
+    _DESCRIPTION_XPATH = etree.XPath(f".//{_has_class('promo-description', 'p')}")
+    _TIMESTAMP_XPATH = etree.XPath(f".//{_has_class('promo-timestamp', 'p')}")
+    _IMAGE_XPATH = etree.XPath(f".//{_has_class('image', 'img')}")
+    _LINK_XPATH = etree.XPath(f".//{_has_class('promo-title', 'h3')}//a[@href]/@href")
+    _TOPICS_XPATH = etree.XPath(f"//{_has_class(TOPICS_CLASS, 'ul')}")
+    _TOPIC_ITEMS_XPATH = etree.XPath(".//li")
+    _CHECKBOX_XPATH = etree.XPath(f".//{_has_class('checkbox-input-element', 'input')}")
+    _SPANS_XPATH = etree.XPath(".//span")
+    _NEXT_PAGE_XPATH = etree.XPath(f"//{_has_class(NEXT_PAGE_CLASS, 'div')}//a[@href]/@href")
+    _NO_RESULTS_XPATH = etree.XPath(f"//{_has_class(NO_RESULTS_CLASS)}")
+
+# With BeautifulSoup we only build the tree of the parts we read, not of the whole page
+_SOUP_STRAINER = SoupStrainer(class_=lambda value: value in (RESULTS_CLASS, TOPICS_CLASS, NEXT_PAGE_CLASS,
+                                                                 NO_RESULTS_CLASS))
+
+
+class _LxmlPage:
+    """
+    A search page parsed with lxml and read with precompiled XPath selectors.
+    """
+
+    def __init__(self, html):
+        self.root = lxml_html.fromstring(html)
+
+    @staticmethod
+    def _first(xpath, element):
+        found = xpath(element)
+        return found[0] if found else None
+
+    @staticmethod
+    def _text(element):
+        # Same as BeautifulSoup's 'element.text.strip()'
+        return element.text_content().strip() if element is not None else 'N/A'
+
+    def iter_promos(self):
+        results = self._first(_RESULTS_XPATH, self.root)
+        for item in _PROMOS_XPATH(results if results is not None else self.root):
+            image_tag = self._first(_IMAGE_XPATH, item)
+            yield {
+                "title": self._text(self._first(_TITLE_XPATH, item)),
+                "description": self._text(self._first(_DESCRIPTION_XPATH, item)),
+                "date": self._text(self._first(_TIMESTAMP_XPATH, item)),
+                "image_url": image_tag.get("src") if image_tag is not None else "N/A",
+                "image_alt": image_tag.get("alt") if image_tag is not None else "N/A",
+                "article_url": self._first(_LINK_XPATH, item) or "N/A",
+            }
+
+    def topics(self):
+        menu = self._first(_TOPICS_XPATH, self.root)
+        topics = []
+        for topic in _TOPIC_ITEMS_XPATH(menu if menu is not None else self.root):
+            checkbox = self._first(_CHECKBOX_XPATH, topic)
+            topics.append({
+                # Same as BeautifulSoup's 'span.get_text(strip=True)'
+                "labels": ["".join(text.strip() for text in span.itertext()) for span in _SPANS_XPATH(topic)],
+                "value": checkbox.get("value") if checkbox is not None else None,
+            })
+        return topics
+
+    def next_page_href(self):
+        return self._first(_NEXT_PAGE_XPATH, self.root)
+
+    def no_results_text(self):
+        element = self._first(_NO_RESULTS_XPATH, self.root)
+        return element.text_content() if element is not None else None
+
+
+class _SoupPage:
+    """
+    A search page parsed with BeautifulSoup, limited by a SoupStrainer to the parts we read.
+    """
+
+    def __init__(self, html):
+        self.soup = BeautifulSoup(html, "html.parser", parse_only=_SOUP_STRAINER)
+
+    def iter_promos(self):
+        # If we received the whole page, we only look inside the results container
+        container = self.soup.find(class_=RESULTS_CLASS) or self.soup
+
+        # We find for every item:
+        #   - Title
+        #   - Description
+        #   - Date
+        #   - Image TAG (Not used for next steps)
+        #   - Image URL
+        #   - Article URL
+        for item in container.find_all('div', class_='promo-wrapper'):
+            title_tag = item.find('h3', class_='promo-title')
+            desc_tag = item.find('p', class_='promo-description')
+            time_tag = item.find('p', class_='promo-timestamp')
+            image_tag = item.find('img', class_='image')
+            link_tag = item.select_one('h3.promo-title a[href]')
+            yield {
+                "title": title_tag.text.strip() if title_tag else 'N/A',
+                "description": desc_tag.text.strip() if desc_tag else 'N/A',
+                "date": time_tag.text.strip() if time_tag else 'N/A',
+                "image_url": image_tag.get("src") if image_tag else "N/A",
+                "image_alt": image_tag.get("alt") if image_tag else "N/A",
+                "article_url": link_tag["href"] if link_tag else "N/A",
+            }
+
+    def topics(self):
+        container = self.soup.find('ul', class_=TOPICS_CLASS) or self.soup
+        topics = []
+        for topic in container.find_all('li'):
+            checkbox = topic.find('input', class_='checkbox-input-element')
+            topics.append({
+                "labels": [span.get_text(strip=True) for span in topic.find_all('span')],
+                "value": checkbox.get("value") if checkbox else None,
+            })
+        return topics
+
+    def next_page_href(self):
+        link = self.soup.select_one(f"div.{NEXT_PAGE_CLASS} a[href]")
+        return link["href"] if link else None
+
+    def no_results_text(self):
+        element = self.soup.find(class_=NO_RESULTS_CLASS)
+        return element.get_text() if element else None
+
+
+def parse_page(html, engine=None):
+    """
+    Parses a search page (or a part of it, like the outerHTML of the results container) once,
+    so all its data can be read from the same tree.
+
+    Parameters
+    ----------
+    html : str
+        The HTML to parse.
+    engine : str, optional
+        "lxml" (fast, precompiled selectors) or "soup" (BeautifulSoup limited by a SoupStrainer).
+        By default lxml if it is installed.
+
+    Returns
+    -------
+    object
+        A parsed page with the methods 'iter_promos()', 'topics()', 'next_page_href()' and 'no_results_text()'.
+    """
+    engine = engine or DEFAULT_ENGINE
+    if engine == "lxml":
+        if lxml_html is None:
+            raise ImportError("The 'lxml' extraction engine needs the lxml package")
+        return _LxmlPage(html)
+    if engine == "soup":
+        return _SoupPage(html)
+    raise ValueError(f"Unknown extraction engine '{engine}', it must be 'lxml' or 'soup'")
+
+
+def iter_promos(html, engine=None):
+    """
+    Extracts the raw fields of every news ('promo-wrapper') of a search results page, one by one,
+    so the caller can stop as soon as it does not need more news.
+
+    Parameters
+    ----------
+    html : str
+        The outerHTML of the results container, or a whole search results page.
+    engine : str, optional
+        The extraction engine, see 'parse_page()'.
+
+    Yields
+    ------
+    dict
+        One dictionary per news with the keys: title, description, date, image_url, image_alt and article_url.
+        Missing values are 'N/A'.
+    """
+    return parse_page(html, engine).iter_promos()
+
+
+def parse_promos(html, engine=None):
+    """
+    Extracts the raw fields of every news ('promo-wrapper') of a search results page.
+
+    Parameters
+    ----------
+    html : str
+        The outerHTML of the results container, or a whole search results page.
+    engine : str, optional
+        The extraction engine, see 'parse_page()'.
+
+    Returns
+    -------
+    list of dict
+        The dictionaries yielded by 'iter_promos()'.
+    """
+    return list(iter_promos(html, engine))
+
+
+def parse_topics(html, engine=None):
+    """
+    Extracts the topics of the 'topic box' (the filter menu of the search page).
+
+    Parameters
+    ----------
+    html : str
+        The outerHTML of the topic box, or a whole search results page.
+    engine : str, optional
+        The extraction engine, see 'parse_page()'.
+
+    Returns
+    -------
+    list of dict
+        One dictionary per topic (li) with the keys:
+            - labels: the texts of all its spans
+            - value: the value of its checkbox, which is the facet id used in the search URL
+    """
+    return parse_page(html, engine).topics()
+
+
+def find_topic(topics, news_category):
+    """
+    Finds the topic of a news category, comparing every label of every topic once.
+
+    Parameters
+    ----------
+    topics : list of dict
+        The topics returned by 'parse_topics()', in the order of the topic box.
+    news_category : str
+        The desired category, compared case insensitively.
+
+    Returns
+    -------
+    tuple of (int, dict) or None
+        The position of the topic in the topic box and the topic itself, or None if no label matches.
+    """
+    category = news_category.strip().lower()
+    for position, topic in enumerate(topics):
+        if any(label.lower() == category for label in topic["labels"]):
+            return position, topic
+    return None
+
+
+def build_news_item(promo, index, search_phrase, in_window, month_ordinal=None, money_amounts=None):
+    """
+    Builds the NewsItem of a news from its raw fields.
+
+    Parameters
+    ----------
+    promo : dict
+        The raw fields returned by 'parse_promos()'.
+    index : int
+        Position of the news in the whole search, starting at 1.
+    search_phrase : str
+        The search phrase, its occurrences are counted in the title and description.
+    in_window : bool
+        Whether the date of the news is in the months of interest.
+    month_ordinal : int, optional
+        The month of the news as year * 12 + month, see 'dates.DateWindow'.
+    money_amounts : list of dict, optional
+        The amounts of money of the title and description, when they were already extracted for the whole
+        page (see 'build_news_items()').
+
+    Returns
+    -------
+    NewsItem
+        The news data, it can be read like the old dictionary: the "bool" key tells whether the news
+        is in the months of interest.
+    """
+    text_to_match = promo["title"] + promo["description"]
+    return NewsItem(
+        index,
+        title=none_if_missing(promo["title"]),
+        date=none_if_missing(promo["date"]),
+        description=none_if_missing(promo["description"]),
+        image_url=none_if_missing(promo["image_url"]),
+        image_alt=none_if_missing(promo["image_alt"]),
+        article_url=none_if_missing(promo.get("article_url")),
+        phrase_matches=word_counter(text_to_match, search_phrase),
+        money_amounts=extract_money(text_to_match) if money_amounts is None else money_amounts,
+        in_window=in_window,
+        month_ordinal=month_ordinal,
+    )
+
+
+def build_news_items(entries, first_index, search_phrase):
+    """
+    Builds the NewsItems of the news of interest of a page, extracting their amounts of money in a
+    single scan ('money.extract_money_many()').
+
+    Parameters
+    ----------
+    entries : list of tuple of (dict, int)
+        The raw fields of every news and its month ordinal.
+    first_index : int
+        Position of the first news in the whole search, starting at 1.
+    search_phrase : str
+        The search phrase, its occurrences are counted in the title and description.
+
+    Returns
+    -------
+    list of NewsItem
+        The news data, in the order of 'entries'.
+    """
+    amounts = extract_money_many(promo["title"] + promo["description"] for promo, _ in entries)
+    return [build_news_item(promo, first_index + position, search_phrase, True, ordinal, money_amounts)
+            for position, ((promo, ordinal), money_amounts) in enumerate(zip(entries, amounts))]
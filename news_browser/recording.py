@@ -0,0 +1,391 @@
+# Standard Python library imports
+import hashlib
+import json
+import os
+import threading
+import zipfile
+from datetime import datetime
+
+# Local module imports
+from .dates import DateWindow
+from .excel_creator import ExcelCreator
+from .image_downloader import ImageDownloader
+from .my_logger import logger
+from .news_collector import NewsCollector
+from .promo_parser import find_topic, iter_promos, parse_topics
+from .tracing import span
+
+
+# The version of the archive format, written in its 'session.json'
+ARCHIVE_VERSION = 1
+
+
+def image_entry(image_url):
+    """
+    Returns the name of the image of a URL inside the archive.
+    """
+    return f"images/{hashlib.sha256(image_url.encode('utf-8')).hexdigest()}"
+
+
+class SessionRecorder:
+    """
+    A class that records what a scraping session read from the site into a compressed (zip) archive:
+    the HTML of every results page, the HTML of the topic box and the body of every image.
+
+    The entries are written to the archive as soon as they are recorded, so the memory does not grow
+    with the session. The HTML is deflated, the images are stored as they are (they are already compressed).
+    The archive only takes its final name once it is closed, a session that fails leaves nothing behind.
+
+    Parameters
+    ----------
+    path : str
+        The path of the archive, for example 'output/session.zip'.
+
+    Methods
+    -------
+    begin(search_phrase, news_category, num_months)
+        Starts the recording of a search, dropping what a failed try recorded.
+    add_topics(html)
+        Records the topic box.
+    add_page(html)
+        Records a results page.
+    add_image(image_url, image_path)
+        Records an image.
+    close()
+        Finishes the archive.
+    """
+
+    def __init__(self, path="output/session.zip"):
+        self.path = path
+        self.session = None
+        self._zip = None
+        self._tmp_path = f"{path}.part"
+        self._lock = threading.Lock()  # The images are recorded by the download threads
+
+    def begin(self, search_phrase, news_category, num_months):
+        """
+        Starts the recording of a search. A retry of the scraping begins again, so the archive only has
+        the pages of the last try.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            if self._zip is not None:
+                self._zip.close()
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._zip = zipfile.ZipFile(self._tmp_path, "w", compression=zipfile.ZIP_DEFLATED)
+            self.session = {"version": ARCHIVE_VERSION, "recorded_at": datetime.now().isoformat(),
+                            "search_phrase": search_phrase, "news_category": news_category, "num_months": num_months,
+                            "no_results": False, "facet_id": None, "topics": None, "pages": [], "images": {}}
+
+    def add_topics(self, html):
+        """
+        Records the HTML of the topic box.
+        """
+        with self._lock:
+            self._zip.writestr("topics.html", html)
+            self.session["topics"] = "topics.html"
+
+    def add_page(self, html):
+        """
+        Records the HTML of a results page, the pages are replayed in the order they are recorded.
+        """
+        with self._lock:
+            name = f"pages/{len(self.session['pages']) + 1:03d}.html"
+            self._zip.writestr(name, html)
+            self.session["pages"].append(name)
+
+    def add_image(self, image_url, image_path):
+        """
+        Records a downloaded image.
+
+        Parameters
+        ----------
+        image_url : str
+            The URL of the image.
+        image_path : str
+            The file where it was downloaded.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            if self._zip is None or image_url in self.session["images"]:
+                return
+            name = image_entry(image_url)
+            self._zip.write(image_path, name, compress_type=zipfile.ZIP_STORED)
+            self.session["images"][image_url] = name
+
+    def close(self):
+        """
+        Writes the description of the session and gives the archive its final name.
+
+        Returns
+        -------
+        str or None
+            The path of the archive, or None if nothing was recorded.
+        """
+        with self._lock:
+            if self._zip is None:
+                return None
+            self._zip.writestr("session.json", json.dumps(self.session, indent=2))
+            self._zip.close()
+            self._zip = None
+            os.replace(self._tmp_path, self.path)
+        logger.info(f"Session recorded in {self.path}: {len(self.session['pages'])} pages "
+                    f"and {len(self.session['images'])} images")
+        return self.path
+
+
+class SessionArchive:
+    """
+    A class that reads an archive written by the SessionRecorder.
+
+    Parameters
+    ----------
+    path : str
+        The path of the archive.
+
+    Attributes
+    ----------
+    session : dict
+        The description of the session: search, time of the recording, pages and images.
+    recorded_at : datetime
+        When the session was recorded, the relative dates of its pages are counted back from it.
+
+    Methods
+    -------
+    pages()
+        Yields the HTML of every results page.
+    topics_html()
+        Returns the HTML of the topic box.
+    image(image_url)
+        Returns the body of an image.
+    window(num_months)
+        Returns the months of interest as they were when the session was recorded.
+    close()
+        Closes the archive.
+
+    Raises
+    ------
+    ValueError
+        If the file is not an archive of a session.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._zip = zipfile.ZipFile(path)
+        try:
+            self.session = json.loads(self._zip.read("session.json"))
+        except KeyError:
+            self._zip.close()
+            raise ValueError(f"{path} is not a recorded session, it has no 'session.json'")
+        self.recorded_at = datetime.fromisoformat(self.session["recorded_at"])
+        self._lock = threading.Lock()  # The images are read by the download threads
+
+    def _read(self, name):
+        with self._lock:
+            return self._zip.read(name)
+
+    def pages(self):
+        """
+        Yields the HTML of every results page, in the order they were read.
+        """
+        for name in self.session["pages"]:
+            yield self._read(name).decode("utf-8")
+
+    def topics_html(self):
+        """
+        Returns the HTML of the topic box, or None if it was not read (the facet was in the topic cache).
+        """
+        return self._read(self.session["topics"]).decode("utf-8") if self.session["topics"] else None
+
+    def image(self, image_url):
+        """
+        Returns the body of an image, or None if it was not recorded.
+        """
+        name = self.session["images"].get(image_url)
+        return self._read(name) if name else None
+
+    def window(self, num_months):
+        """
+        Returns the months of interest of 'num_months' as they were when the session was recorded.
+        """
+        return DateWindow(num_months, today=self.recorded_at.date())
+
+    def close(self):
+        self._zip.close()
+
+
+class ReplayScraper:
+    """
+    A scraper that replays a recorded session: the recorded pages go through the same extraction and
+    the same NewsCollector as a live crawl, without a browser and without any request. So a past crawl
+    can be parsed again after the extraction changes.
+
+    Parameters
+    ----------
+    archive : SessionArchive
+        The recorded session.
+    engine : str, optional
+        The HTML extraction engine ("lxml" or "soup"), see 'promo_parser.parse_page()'.
+
+    Methods
+    -------
+    search_news(search_phrase, news_category)
+        Finds the news category in the recorded topic box.
+    iter_news(search_phrase, news_category, num_months)
+        Yields the news of interest of every recorded page.
+    scrap_news(search_phrase, news_category, num_months)
+        Returns the news of interest of the recorded pages.
+    """
+
+    def __init__(self, archive, engine=None):
+        self.archive = archive
+        self.engine = engine
+        self.collector = None  # The NewsCollector of the last replay, it has the crawl statistics
+
+    def search_news(self, search_phrase, news_category):
+        """
+        Replays the search: it fails if the recorded one found nothing, or if the category is not in the
+        recorded topic box.
+
+        Returns
+        -------
+        bool
+            True if the search was successful.
+        """
+        session = self.archive.session
+        if (search_phrase, news_category) != (session["search_phrase"], session["news_category"]):
+            logger.warning(f"Replaying the search '{session['search_phrase']}' / '{session['news_category']}' "
+                           f"as '{search_phrase}' / '{news_category}'")
+        if session["no_results"]:
+            logger.warning(f"No results found for search: {search_phrase}")
+            return False
+
+        topics_html = self.archive.topics_html()
+        if topics_html is None:
+            return bool(session["facet_id"])
+        if find_topic(parse_topics(topics_html, self.engine), news_category) is None:
+            logger.warning(f"No '{news_category}' category found for search '{search_phrase}'")
+            return False
+        return True
+
+    def iter_news(self, search_phrase, news_category, num_months):
+        """
+        Yields the news of interest of every recorded page, stopping where a live crawl would stop.
+        The relative dates are counted back from the time of the recording.
+
+        Yields
+        ------
+        list of NewsItem
+            The news of interest of a page.
+        """
+        self.collector = None
+        if not self.search_news(search_phrase, news_category):
+            return
+        if num_months > self.archive.session["num_months"]:
+            logger.warning(f"The session was recorded for {self.archive.session['num_months']} months, "
+                           f"the older news of the {num_months} months may be missing")
+
+        collector = NewsCollector(search_phrase, num_months, news_category, now=self.archive.recorded_at)
+        self.collector = collector
+        for page_number, html in enumerate(self.archive.pages(), start=1):
+            with span("parse", page=page_number):
+                keep_going = collector.add_page(iter_promos(html, self.engine))
+            yield collector.new_items()
+            if not keep_going:
+                break
+
+        news_data = collector.finish()
+        logger.info(f"Replayed {collector.pages_read} pages and {collector.items_parsed} news, "
+                    f"{len(news_data)} of interest")
+
+    def scrap_news(self, search_phrase, news_category, num_months):
+        """
+        Returns the news of interest of the recorded pages.
+
+        Returns
+        -------
+        list of NewsItem
+            The news data.
+        """
+        logger.info("Starting scrap_news function (replay)")
+        return [item for items in self.iter_news(search_phrase, news_category, num_months) for item in items]
+
+
+class ReplayImageDownloader(ImageDownloader):
+    """
+    An ImageDownloader that takes the images from a recorded session instead of the network.
+
+    Parameters
+    ----------
+    archive : SessionArchive
+        The recorded session.
+    **kwargs
+        The parameters of the ImageDownloader (output_dir, max_workers...).
+    """
+
+    def __init__(self, archive, **kwargs):
+        super().__init__(**kwargs)
+        self.archive = archive
+
+    def download_image(self, item):
+        """
+        Writes the recorded image of a news and updates its "image_path".
+
+        Returns
+        -------
+        bool
+            True if the image was recorded, False otherwise.
+        """
+        image_url = item.get("image_url")
+        body = self.archive.image(image_url)
+        if body is None:
+            logger.error(f"The image {image_url} is not in the recorded session")
+            return False
+        image_path = os.path.join(self.imgs_dir, f"{item['news_name']}.jpg")
+        with open(image_path, "wb") as f:
+            f.write(body)
+        item["image_path"] = image_path
+        return True
+
+
+def replay_session(path, output_dir="output/replay/", engine=None, num_months=None):
+    """
+    Replays a recorded session from end to end: the extraction of its pages, its images and its Excel file,
+    without a browser and without any request.
+
+    Parameters
+    ----------
+    path : str
+        The path of the archive.
+    output_dir : str
+        Directory of the images and the Excel file.
+    engine : str, optional
+        The HTML extraction engine ("lxml" or "soup").
+    num_months : int, optional
+        Number of months wanted, by default those of the recorded search.
+
+    Returns
+    -------
+    tuple of (list of NewsItem, str or None)
+        The news data and the path of the Excel file.
+    """
+    archive = SessionArchive(path)
+    try:
+        session = archive.session
+        search_phrase, news_category = session["search_phrase"], session["news_category"]
+        num_months = session["num_months"] if num_months is None else num_months
+        news_data = ReplayScraper(archive, engine).scrap_news(search_phrase, news_category, num_months)
+
+        window = archive.window(num_months)
+        image_downloader = ReplayImageDownloader(archive, output_dir=output_dir)
+        image_downloader.download_images(news_data, window)
+        excel_file = ExcelCreator(output_dir).create_excel(news_data, search_phrase, news_category, num_months, window)
+    finally:
+        archive.close()
+    return news_data, excel_file
@@ -0,0 +1,341 @@
+# Standard Python library imports
+import json
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import wait
+
+# Third party libraries imports
+from RPA.Robocorp.WorkItems import WorkItems
+
+# Local module imports
+from .browser import NewsBrowser
+from .dates import DateWindow
+from .excel_creator import ExcelCreator
+from .my_logger import logger
+from .sinks import open_sinks
+
+
+def empty_report(variables, status):
+    """
+    Returns the report of a search that was not processed by a worker.
+    """
+    return {"search_phrase": variables.get("search_phrase"), "news_category": variables.get("news_category"),
+            "num_months": variables.get("num_months"), "status": status, "news": 0, "excel_file": None,
+            "scrape_seconds": 0.0, "export_seconds": 0.0, "total_seconds": 0.0, "worker": None}
+
+
+def shard_worker(worker_id, tasks, connection, options):
+    """
+    The main function of a worker process.
+
+    It opens its own browser (with its own profile), takes searches from 'tasks' until it receives None,
+    and sends back through 'connection' the report and the news data of every search:
+        - ("started", worker_id, index) before a search
+        - ("finished", worker_id, index, report, news_data) after it
+        - ("exited", worker_id, stats) when the worker stops
+
+    Parameters
+    ----------
+    worker_id : int
+        The number of the worker.
+    tasks : multiprocessing.Queue
+        The queue of (index, variables) searches, shared by all the workers.
+    connection : multiprocessing.connection.Connection
+        The sending end of the pipe to the supervisor. Sending is synchronous,
+        so every message sent before a crash reaches the supervisor.
+    options : dict
+        backend, headless, profile_dir, cache_dir and output_dir of the worker.
+
+    Returns
+    -------
+    None
+    """
+    start = time.perf_counter()
+    stats = {"worker": worker_id, "pid": os.getpid(), "items": 0, "news": 0, "busy_seconds": 0.0, "error": None}
+    use_browser = options["backend"] != "http"
+    news_browser = None
+    try:
+        news_browser = NewsBrowser(load_work_items=False, headless=options["headless"],
+                                   profile_dir=options["profile_dir"], cache_dir=options["cache_dir"])
+        if use_browser:
+            news_browser.open_news_site(news_browser.news_url)
+
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            index, variables = task
+            connection.send(("started", worker_id, index))
+
+            # An error in a search is reported and the worker goes on with the next one
+            task_start = time.perf_counter()
+            try:
+                report, news_data, _ = news_browser.process_query(variables, options["backend"],
+                                                                  options["output_dir"], create_excel=False)
+            except Exception as e:
+                logger.error(f"Worker {worker_id} failed on the search {index}: {e}")
+                report, news_data = empty_report(variables, "failed"), None
+
+            stats["items"] += 1
+            stats["news"] += report["news"]
+            stats["busy_seconds"] += time.perf_counter() - task_start
+            connection.send(("finished", worker_id, index, report, news_data))
+    except Exception as e:
+        # The browser could not be opened, the searches are left for the other workers
+        logger.error(f"Worker {worker_id} stopped: {e}")
+        stats["error"] = str(e)
+    finally:
+        if news_browser is not None:
+            news_browser.close_article_store()
+        if news_browser is not None and use_browser:
+            news_browser.browser.close_all_browsers()
+        stats["wall_seconds"] = time.perf_counter() - start
+        connection.send(("exited", worker_id, stats))
+        connection.close()
+
+
+class ShardSupervisor:
+    """
+    A class that spreads the searches of many work items over a pool of worker processes,
+    each one with its own headless browser, browser profile and output subdirectory.
+
+    A worker that crashes only loses the search it was doing, the other searches are taken by
+    the workers still alive. The news data of every worker is sent back to the supervisor, which
+    creates the Excel files and writes a report with the throughput of every worker.
+
+    Parameters
+    ----------
+    num_workers : int, optional
+        Number of worker processes, by default the number of CPUs.
+    output_dir : str
+        Directory where every worker has its 'workerN' subdirectory and where the report is written.
+    profiles_dir : str
+        Directory where every worker has its browser profile.
+    cache_dir : str
+        Directory of the caches and the article store, shared by all the workers (they are safe to use
+        from several processes at the same time).
+    headless : bool
+        Whether the browsers run without a window.
+    mp_context : str
+        The multiprocessing start method, "spawn" so that no browser state is inherited.
+    thumbnails : bool
+        Whether the Excel files embed a thumbnail of every image.
+    output_formats : list of str, optional
+        The other output formats written next to the Excel files, see the 'sinks' module.
+
+    Methods
+    -------
+    run(searches, backend)
+        Processes a list of searches in the worker processes.
+    run_work_items()
+        Processes every input work item.
+    """
+
+    def __init__(self, num_workers=None, output_dir="output/", profiles_dir="cache/profiles/", headless=True,
+                 mp_context="spawn", thumbnails=False, output_formats=None, cache_dir="cache/"):
+        self.num_workers = max(1, int(num_workers or os.cpu_count() or 1))
+        self.output_dir = output_dir
+        self.profiles_dir = profiles_dir
+        self.cache_dir = cache_dir
+        self.headless = headless
+        self.mp_context = mp_context
+        self.thumbnails = thumbnails
+        self.output_formats = output_formats
+        self.worker_stats = {}
+
+    def worker_options(self, worker_id, backend):
+        """
+        Returns the options of a worker: its own browser profile and output subdirectory, and the shared caches.
+        """
+        return {
+            "backend": backend,
+            "headless": self.headless,
+            "profile_dir": os.path.abspath(os.path.join(self.profiles_dir, f"worker{worker_id}")),
+            "cache_dir": os.path.abspath(self.cache_dir),
+            "output_dir": os.path.join(self.output_dir, f"worker{worker_id}"),
+        }
+
+    def run(self, searches, backend="browser"):
+        """
+        Processes a list of searches in the worker processes.
+
+        Parameters
+        ----------
+        searches : list of dict
+            The variables of every work item.
+        backend : str
+            The scraper backend of all the workers, "browser" or "http".
+
+        Returns
+        -------
+        tuple of (list of dict, list of list)
+            The report and the news data (None if not scraped) of every search, in the order of 'searches'.
+        """
+        logger.info("Starting 'run' function of the ShardSupervisor")
+        if not searches:
+            return [], []
+
+        context = multiprocessing.get_context(self.mp_context)
+        tasks = context.Queue()
+        for index, variables in enumerate(searches):
+            tasks.put((index, variables))
+        num_workers = min(self.num_workers, len(searches))
+        for _ in range(num_workers):
+            tasks.put(None)  # One stop signal per worker
+
+        # Every worker has its own pipe to the supervisor
+        processes = {}
+        connections = {}
+        for worker_id in range(num_workers):
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(target=shard_worker, name=f"news-worker-{worker_id}",
+                                      args=(worker_id, tasks, sender, self.worker_options(worker_id, backend)))
+            process.start()
+            sender.close()  # Only the worker keeps the sending end, so we see the end of the pipe when it dies
+            processes[worker_id] = process
+            connections[receiver] = worker_id
+        logger.info(f"Started {num_workers} workers for {len(searches)} searches")
+
+        reports = [None] * len(searches)
+        news_data = [None] * len(searches)
+        in_progress = {}
+        self.worker_stats = {}
+
+        def handle(message):
+            kind, worker_id = message[0], message[1]
+            if kind == "started":
+                in_progress[worker_id] = message[2]
+            elif kind == "finished":
+                index = message[2]
+                reports[index], news_data[index] = message[3], message[4]
+                reports[index]["worker"] = worker_id
+                in_progress.pop(worker_id, None)
+            elif kind == "exited":
+                self.worker_stats[worker_id] = message[2]
+
+        # We read the messages of every worker until its pipe is closed, because it exited or crashed
+        while connections:
+            for receiver in wait(list(connections)):
+                try:
+                    handle(receiver.recv())
+                except EOFError:
+                    receiver.close()
+                    del connections[receiver]
+        for process in processes.values():
+            process.join()
+        tasks.cancel_join_thread()  # Searches left by dead workers must not block our exit
+
+        # A worker that died without saying goodbye crashed, only its current search is lost
+        for worker_id, process in processes.items():
+            if worker_id not in self.worker_stats:
+                logger.error(f"Worker {worker_id} crashed with exit code {process.exitcode}")
+                self.worker_stats[worker_id] = {"worker": worker_id, "pid": process.pid, "items": 0, "news": 0,
+                                                "busy_seconds": 0.0, "wall_seconds": 0.0,
+                                                "error": f"crashed with exit code {process.exitcode}"}
+            if worker_id in in_progress:
+                reports[in_progress[worker_id]] = empty_report(searches[in_progress[worker_id]], "crashed")
+        for index, report in enumerate(reports):
+            if report is None:
+                reports[index] = empty_report(searches[index], "not processed")
+
+        return reports, news_data
+
+    def export(self, reports, news_data):
+        """
+        Creates the Excel file of every search, next to the images downloaded by its worker.
+
+        Returns
+        -------
+        None
+        """
+        for report, data in zip(reports, news_data):
+            if not data:
+                continue
+            start = time.perf_counter()
+            worker_dir = self.worker_options(report["worker"], None)["output_dir"]
+            output_dir = NewsBrowser.search_dir(worker_dir, report["search_phrase"], report["news_category"],
+                                                report["num_months"])
+            sinks = open_sinks(self.output_formats, output_dir, report["search_phrase"], report["news_category"],
+                               report["num_months"])
+            excel_creator = ExcelCreator(output_dir)
+            report["excel_file"] = excel_creator.create_excel(data, report["search_phrase"], report["news_category"],
+                                                              report["num_months"], DateWindow(report["num_months"]),
+                                                              thumbnails=self.thumbnails, sinks=sinks)
+            report["output_files"] = [sink.path for sink in sinks if sink.path]
+            report["export_seconds"] += time.perf_counter() - start
+
+    def throughput(self):
+        """
+        Returns the throughput of every worker.
+
+        Returns
+        -------
+        list of dict
+            The stats of every worker with its searches per minute and news per second.
+        """
+        metrics = []
+        for worker_id in sorted(self.worker_stats):
+            stats = dict(self.worker_stats[worker_id])
+            wall = stats["wall_seconds"]
+            stats["items_per_minute"] = stats["items"] * 60 / wall if wall else 0.0
+            stats["news_per_second"] = stats["news"] / wall if wall else 0.0
+            stats["utilization"] = stats["busy_seconds"] / wall if wall else 0.0
+            metrics.append(stats)
+        return metrics
+
+    def write_report(self, reports):
+        """
+        Logs the report of every search and the throughput of every worker, and saves them
+        in 'shard_report.json'.
+
+        Returns
+        -------
+        str
+            The path of the report.
+        """
+        metrics = self.throughput()
+        for stats in metrics:
+            logger.info(f"Worker {stats['worker']}: {stats['items']} searches, {stats['news']} news in "
+                        f"{stats['wall_seconds']:.2f}s ({stats['items_per_minute']:.2f} searches/min, "
+                        f"{stats['utilization']:.0%} busy){', error: ' + stats['error'] if stats['error'] else ''}")
+        for report in reports:
+            logger.info(f"  '{report['search_phrase']}' / '{report['news_category']}' / {report['num_months']}: "
+                        f"{report['status']}, {report['news']} news, total {report['total_seconds']:.2f}s")
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        report_path = os.path.join(self.output_dir, "shard_report.json")
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump({"searches": reports, "workers": metrics}, f, indent=4)
+        return report_path
+
+    def run_work_items(self):
+        """
+        Reads every input work item, processes them in the worker processes and exports the results.
+
+        The number of workers and the backend are taken from the 'shard_workers' and 'scraper_backend'
+        variables of the first work item.
+
+        Returns
+        -------
+        list of dict
+            The report of every work item.
+        """
+        workitems = WorkItems()
+        workitems.get_input_work_item()
+        first = workitems.get_work_item_variables()
+        if first.get("shard_workers"):
+            self.num_workers = max(1, int(first["shard_workers"]))
+        backend = first.get("scraper_backend", "browser")
+        self.thumbnails = first.get("excel_thumbnails", self.thumbnails)
+        self.output_formats = first.get("output_formats", self.output_formats)
+
+        # The supervisor takes every input work item, the workers only receive their variables
+        searches = workitems.for_each_input_work_item(workitems.get_work_item_variables)
+
+        started = time.perf_counter()
+        reports, news_data = self.run(searches, backend)
+        self.export(reports, news_data)
+        self.write_report(reports)
+        logger.info(f"Sharded run of {len(searches)} searches finished in {time.perf_counter() - started:.2f}s")
+        return reports
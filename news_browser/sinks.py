@@ -0,0 +1,311 @@
+# Standard Python library imports
+import csv
+import json
+import os
+from abc import ABC, abstractmethod
+
+# Third party libraries imports
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is only needed by the Parquet output
+    pa = None
+
+# Local module imports
+from .money import format_amounts
+from .utils import clean_text
+
+
+# The fields of every news in the CSV, JSONL and Parquet outputs
+RECORD_FIELDS = ["title", "date", "description", "article_url", "image_path",
+                 "phrase_matches", "contain_money", "money_amounts"]
+
+
+def news_record(item):
+    """
+    Returns the record of a news written by the sinks, with the fields of 'RECORD_FIELDS'.
+
+    Parameters
+    ----------
+    item : dict
+        The news data.
+
+    Returns
+    -------
+    dict
+        The record, "money_amounts" is the list of the amounts in dollars.
+    """
+    return {
+        "title": item["title"],
+        "date": item["date"],
+        "description": item["description"],
+        "article_url": item.get("article_url", "N/A"),
+        "image_path": item["image_path"],
+        "phrase_matches": item["phrase_matches"],
+        "contain_money": item["contain_money"],
+        "money_amounts": [amount["amount"] for amount in item.get("money_amounts", [])],
+    }
+
+
+class Sink(ABC):
+    """
+    The base class of the outputs written next to the Excel file, every format implements its
+    '_open()', '_write(record)' and '_close()' hooks.
+
+    A sink receives the news one by one with 'write()' and only creates its file with the first news,
+    so nothing is written for a search without news of interest.
+
+    Parameters
+    ----------
+    base_path : str
+        The path of the file without its extension.
+
+    Attributes
+    ----------
+    path : str or None
+        The path of the file, once it was closed with at least one news.
+    rows : int
+        Number of news written so far.
+
+    Methods
+    -------
+    write(item)
+        Writes a news.
+    close()
+        Finishes the file.
+    discard()
+        Deletes the file, after an error of the export.
+    """
+
+    format = None
+    extension = None
+
+    def __init__(self, base_path):
+        self.target = base_path + self.extension
+        self.path = None
+        self.rows = 0
+        self._opened = False
+
+    def write(self, item):
+        if not self._opened:
+            os.makedirs(os.path.dirname(self.target) or ".", exist_ok=True)
+            self._open()
+            self._opened = True
+        self._write(news_record(item))
+        self.rows += 1
+
+    def close(self):
+        """
+        Finishes the file.
+
+        Returns
+        -------
+        str or None
+            The path of the file, or None if no news was written.
+        """
+        if self._opened:
+            self._close()
+            self._opened = False
+            self.path = self.target
+        return self.path
+
+    def discard(self):
+        """
+        Deletes the file, whether it was finished or not, so a failed export leaves no partial output.
+
+        Returns
+        -------
+        None
+        """
+        try:
+            if self._opened:
+                self._close()
+        finally:
+            self._opened = False
+            self.path = None
+            if os.path.exists(self.target):
+                os.remove(self.target)
+
+    @abstractmethod
+    def _open(self):
+        """
+        Creates the file at 'self.target', it is called with the first news.
+        """
+
+    @abstractmethod
+    def _write(self, record):
+        """
+        Writes the record of a news, as returned by 'news_record()'.
+        """
+
+    @abstractmethod
+    def _close(self):
+        """
+        Finishes the file, it is only called if the file was created.
+        """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+class CsvSink(Sink):
+    """
+    Writes the news to a CSV file, one row at a time. The amounts of money are written as in the Excel file.
+    """
+
+    format = "csv"
+    extension = ".csv"
+
+    def _open(self):
+        self._file = open(self.target, "w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=RECORD_FIELDS)
+        self._writer.writeheader()
+
+    def _write(self, record):
+        record["money_amounts"] = format_amounts({"amount": amount} for amount in record["money_amounts"])
+        self._writer.writerow(record)
+
+    def _close(self):
+        self._file.close()
+
+
+class JsonlSink(Sink):
+    """
+    Writes the news to a JSON Lines file, one JSON object per line.
+    """
+
+    format = "jsonl"
+    extension = ".jsonl"
+
+    def _open(self):
+        self._file = open(self.target, "w", encoding="utf-8")
+
+    def _write(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def _close(self):
+        self._file.close()
+
+
+class ParquetSink(Sink):
+    """
+    Writes the news to a columnar Parquet file, in row groups of 'batch_size' news so the memory
+    does not grow with the number of news. It needs the pyarrow package.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+    """
+
+    format = "parquet"
+    extension = ".parquet"
+    batch_size = 10_000
+
+    def __init__(self, base_path):
+        if pa is None:
+            raise ImportError("The 'parquet' output needs the pyarrow package")
+        super().__init__(base_path)
+        self.schema = pa.schema([
+            ("title", pa.string()),
+            ("date", pa.string()),
+            ("description", pa.string()),
+            ("article_url", pa.string()),
+            ("image_path", pa.string()),
+            ("phrase_matches", pa.int64()),
+            ("contain_money", pa.bool_()),
+            ("money_amounts", pa.list_(pa.float64())),
+        ])
+
+    def _open(self):
+        self._writer = pq.ParquetWriter(self.target, self.schema)
+        self._batch = []
+
+    def _write(self, record):
+        self._batch.append(record)
+        if len(self._batch) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        if self._batch:
+            self._writer.write_table(pa.Table.from_pylist(self._batch, schema=self.schema))
+            self._batch = []
+
+    def _close(self):
+        self._flush()
+        self._writer.close()
+
+
+# The sink of every output format
+SINKS = {sink.format: sink for sink in (CsvSink, JsonlSink, ParquetSink)}
+
+
+def parse_formats(formats):
+    """
+    Reads the 'output_formats' variable of a work item.
+
+    Parameters
+    ----------
+    formats : str or list of str or None
+        The formats, as a list or as a comma separated string ("csv, jsonl"). "excel" is always written,
+        so it is left out.
+
+    Returns
+    -------
+    list of str
+        The formats, lowercase and without repetitions.
+
+    Raises
+    ------
+    ValueError
+        If a format is unknown.
+    ImportError
+        If the Parquet format is asked and pyarrow is not installed.
+    """
+    if not formats:
+        return []
+    if isinstance(formats, str):
+        formats = formats.split(",")
+    parsed = []
+    for output_format in formats:
+        output_format = output_format.strip().lower()
+        if output_format in ("", "excel", "xlsx") or output_format in parsed:
+            continue
+        if output_format not in SINKS:
+            raise ValueError(f"Unknown output format '{output_format}', it must be one of {', '.join(SINKS)}")
+        if output_format == "parquet" and pa is None:
+            raise ImportError("The 'parquet' output needs the pyarrow package")
+        parsed.append(output_format)
+    return parsed
+
+
+def open_sinks(formats, output_dir, search_phrase, news_category, num_months):
+    """
+    Creates the sinks of a search, their files are named like the Excel file.
+
+    Parameters
+    ----------
+    formats : str or list of str or None
+        The output formats, see 'parse_formats()'.
+    output_dir : str
+        Directory of the files.
+    search_phrase : str
+        The search phrase.
+    news_category : str
+        The desired category of the search.
+    num_months : int
+        Number of months wanted.
+
+    Returns
+    -------
+    list of Sink
+        One sink per format.
+    """
+    base_path = os.path.join(output_dir, f"{clean_text(search_phrase)}_{clean_text(news_category)}_{num_months}")
+    return [SINKS[output_format](base_path) for output_format in parse_formats(formats)]
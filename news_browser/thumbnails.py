@@ -0,0 +1,152 @@
+# Standard Python library imports
+import hashlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Third party libraries imports
+from PIL import Image, UnidentifiedImageError
+
+# Local module imports
+from .my_logger import logger
+
+
+def make_thumbnail(image_path, thumbnail_path, size):
+    """
+    Downscales an image to fit in 'size', keeping its aspect ratio, and saves it as a PNG.
+
+    It runs in the worker processes of the ThumbnailMaker, so it only receives paths.
+
+    Parameters
+    ----------
+    image_path : str
+        The path of the downloaded image.
+    thumbnail_path : str
+        Where the thumbnail is saved.
+    size : tuple of (int, int)
+        The maximum width and height of the thumbnail, in pixels.
+
+    Returns
+    -------
+    str or None
+        The path of the thumbnail, or None if the file is not an image.
+    """
+    tmp_path = f"{thumbnail_path}.{os.getpid()}.tmp"
+    try:
+        with Image.open(image_path) as image:
+            # 'draft' lets the JPEG decoder skip most of the pixels we are going to drop anyway
+            image.draft("RGB", size)
+            image.thumbnail(size)
+            image.convert("RGB").save(tmp_path, "PNG", optimize=True)
+    except (OSError, UnidentifiedImageError):
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return None
+    os.replace(tmp_path, thumbnail_path)
+    return thumbnail_path
+
+
+class ThumbnailMaker:
+    """
+    A class that makes the small thumbnails of the news images embedded in the Excel file.
+
+    The thumbnails are made in a pool of processes (resizing is CPU bound) and cached on disk by the
+    SHA-256 of the image content and the thumbnail size, so exporting the same images again does not
+    resize them again. The processes are spawned, not forked, because the export runs next to the
+    download and scraping threads.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory where the thumbnails are cached.
+    size : tuple of (int, int)
+        The maximum width and height of the thumbnails, in pixels.
+    max_workers : int, optional
+        Number of processes, by default the number of CPUs.
+
+    Attributes
+    ----------
+    hits : int
+        Number of images whose thumbnail was found in the cache by the last 'make_thumbnails()'.
+    made : int
+        Number of thumbnails written by the last 'make_thumbnails()', the same picture under two names
+        is only made once.
+
+    Methods
+    -------
+    make_thumbnails(image_paths, digests=None)
+        Returns the thumbnail of every image, making the missing ones.
+    """
+
+    def __init__(self, cache_dir="cache/thumbnails/", size=(120, 80), max_workers=None):
+        self.cache_dir = cache_dir
+        self.size = tuple(size)
+        self.max_workers = max_workers
+        self.hits = 0
+        self.made = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def thumbnail_path(self, image_path, digest=None):
+        """
+        Returns the cached thumbnail path of an image, named after the hash of its content. The image is
+        only hashed if its 'digest' is not given.
+        """
+        if digest is None:
+            sha256 = hashlib.sha256()
+            with open(image_path, "rb") as f:
+                for chunk in iter(lambda: f.read(64 * 1024), b""):
+                    sha256.update(chunk)
+            digest = sha256.hexdigest()
+        width, height = self.size
+        return os.path.join(self.cache_dir, f"{digest}_{width}x{height}.png")
+
+    def make_thumbnails(self, image_paths, digests=None):
+        """
+        Returns the thumbnail of every image, taking it from the cache or making it in the process pool.
+
+        Parameters
+        ----------
+        image_paths : iterable of str
+            The paths of the downloaded images, those that do not exist are left out.
+        digests : dict, optional
+            The SHA-256 of the images already known, by image path, as kept by 'ImageDownloader.digests'.
+
+        Returns
+        -------
+        dict
+            The thumbnail path of every image path that could be read as an image.
+        """
+        logger.info("Starting 'make_thumbnails' function")
+        thumbnails = {}
+        missing = {}
+        digests = digests or {}
+        for image_path in dict.fromkeys(image_paths):
+            if not image_path or not os.path.isfile(image_path):
+                continue
+            thumbnail_path = self.thumbnail_path(image_path, digests.get(image_path))
+            if os.path.isfile(thumbnail_path):
+                thumbnails[image_path] = thumbnail_path
+            else:
+                missing[image_path] = thumbnail_path
+        self.hits = len(thumbnails)
+
+        # Here we make every missing thumbnail once, from the first image with its content
+        to_make = {}
+        for image_path, thumbnail_path in missing.items():
+            to_make.setdefault(thumbnail_path, image_path)
+
+        # A single image is not worth starting the processes
+        if len(to_make) > 1:
+            with ProcessPoolExecutor(max_workers=self.max_workers,
+                                     mp_context=multiprocessing.get_context("spawn")) as executor:
+                results = executor.map(make_thumbnail, to_make.values(), to_make, [self.size] * len(to_make))
+                written = {thumbnail_path for thumbnail_path in results if thumbnail_path}
+        else:
+            written = {make_thumbnail(image_path, thumbnail_path, self.size)
+                       for thumbnail_path, image_path in to_make.items()} - {None}
+
+        self.made = len(written)
+        thumbnails.update((image_path, thumbnail_path) for image_path, thumbnail_path in missing.items()
+                          if thumbnail_path in written)
+        logger.info(f"{self.hits} thumbnails taken from the cache and {self.made} made")
+        return thumbnails
@@ -0,0 +1,110 @@
+# Standard Python library imports
+import json
+import threading
+import time
+
+# Local module imports
+from .file_lock import FileLock, write_json
+from .my_logger import logger
+
+
+class TopicCache:
+    """
+    An on-disk cache of the facet id of every news category, per search phrase.
+
+    Finding the category of a search means opening the filters, clicking 'See all' and scanning
+    every topic of the topic box. The facet id found (the value of the topic checkbox) is saved here,
+    so the next work item with the same search phrase and category goes straight to the filtered results.
+
+    Parameters
+    ----------
+    path : str
+        The JSON file where the cache is stored.
+    ttl : float
+        Seconds a facet id is trusted, after that the topic box is scanned again.
+
+    Methods
+    -------
+    get(search_phrase, news_category)
+        Returns the cached facet id, if any and not expired.
+    put(search_phrase, news_category, facet_id)
+        Stores the facet id of a category.
+    save()
+        Writes the cache to disk.
+    """
+
+    def __init__(self, path="cache/topics.json", ttl=24 * 60 * 60):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(path)  # Shared with the other processes using the cache
+        self._entries = self._load()
+
+    def _load(self):
+        """
+        Loads the cache from disk, an unreadable file just means an empty cache.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _key(search_phrase, news_category):
+        # The site compares both case insensitively, so do we
+        return f"{search_phrase.strip().lower()}|{news_category.strip().lower()}"
+
+    def get(self, search_phrase, news_category):
+        """
+        Returns the cached facet id of a category for a search phrase.
+
+        Parameters
+        ----------
+        search_phrase : str
+            The text searched.
+        news_category : str
+            The category (topic) of the news.
+
+        Returns
+        -------
+        str or None
+            The facet id, or None if it is not cached or it expired.
+        """
+        with self._lock:
+            entry = self._entries.get(self._key(search_phrase, news_category))
+        if entry and time.time() - entry["resolved_at"] < self.ttl:
+            logger.info(f"Using the cached facet of the category '{news_category}'")
+            return entry["facet_id"]
+        return None
+
+    def put(self, search_phrase, news_category, facet_id):
+        """
+        Stores the facet id of a category for a search phrase.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self._entries[self._key(search_phrase, news_category)] = {
+                "facet_id": facet_id,
+                "resolved_at": time.time(),
+            }
+
+    def save(self):
+        """
+        Writes the cache to disk, merged with the facets saved by the other processes (the workers of a
+        sharded run): the most recently resolved facet of every category wins.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock, self._file_lock:
+            merged = self._load()
+            for key, entry in self._entries.items():
+                if key not in merged or entry["resolved_at"] >= merged[key]["resolved_at"]:
+                    merged[key] = entry
+            self._entries = merged
+            write_json(self.path, self._entries)
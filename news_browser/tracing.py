@@ -0,0 +1,215 @@
+# Standard Python library imports
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+# Local module imports
+from .my_logger import logger
+
+
+class Tracer:
+    """
+    A class that records spans (a named stage with its start and duration) and exports them
+    in the Chrome trace-event format, to be opened in chrome://tracing or https://ui.perfetto.dev.
+
+    Every span is recorded in the thread that ran it, so the image downloads show up as parallel tracks.
+
+    Methods
+    -------
+    span(name, category, args)
+        A context manager that records a span.
+    summary()
+        Returns the count, total, p50 and p95 milliseconds per stage.
+    trace_events()
+        Returns the spans as Chrome trace events.
+    write(path)
+        Writes the trace and its summary to a JSON file.
+    log_report()
+        Logs the summary.
+    """
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.origin = time.perf_counter_ns()
+        # Every span is a tuple (name, category, start ns, duration ns, thread id, args),
+        # appending to a list is atomic so the threads do not need a lock
+        self.spans = []
+
+    @contextmanager
+    def span(self, name, category="news_browser", args=None):
+        """
+        Records the time spent in the 'with' block as a span, even if it raises.
+
+        Parameters
+        ----------
+        name : str
+            The stage, for example "search_news". The summary groups the spans by it.
+        category : str
+            The category of the trace event.
+        args : dict, optional
+            Details shown with the event, for example the page number.
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            self.spans.append((name, category, start - self.origin, end - start, threading.get_ident(), args))
+
+    def summary(self):
+        """
+        Returns the count, total, p50 and p95 milliseconds per stage.
+
+        Returns
+        -------
+        dict
+            {stage: {"count": int, "total_ms": float, "p50_ms": float, "p95_ms": float}}
+        """
+        durations = {}
+        for name, _, _, duration, _, _ in self.spans:
+            durations.setdefault(name, []).append(duration / 1e6)
+        summary = {}
+        for name, values in durations.items():
+            values.sort()
+            summary[name] = {"count": len(values), "total_ms": round(sum(values), 3),
+                             "p50_ms": round(percentile(values, 50), 3), "p95_ms": round(percentile(values, 95), 3)}
+        return summary
+
+    def trace_events(self):
+        """
+        Returns the spans as Chrome trace events: complete events ("ph": "X") with microsecond times,
+        plus the name of every thread.
+
+        Returns
+        -------
+        list of dict
+            The trace events.
+        """
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        events = []
+        threads = {}
+        for name, category, start, duration, tid, args in self.spans:
+            event = {"name": name, "cat": category, "ph": "X", "ts": start / 1000, "dur": duration / 1000,
+                     "pid": self.pid, "tid": threads.setdefault(tid, len(threads) + 1)}
+            if args:
+                event["args"] = args
+            events.append(event)
+        for tid, number in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": self.pid, "tid": number,
+                           "args": {"name": thread_names.get(tid, f"thread-{number}")}})
+        return events
+
+    def write(self, path="output/trace.json"):
+        """
+        Writes the trace and its per stage summary ("otherData") to a JSON file.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+
+        Returns
+        -------
+        str
+            The path of the file.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        trace = {"traceEvents": self.trace_events(), "displayTimeUnit": "ms",
+                 "otherData": {"summary": self.summary()}}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace, f)
+        logger.info(f"Trace of {len(self.spans)} spans written to {path}")
+        return path
+
+    def log_report(self):
+        """
+        Logs the summary, the stages with the most time first.
+
+        Returns
+        -------
+        None
+        """
+        summary = self.summary()
+        logger.info(f"Trace summary: {len(self.spans)} spans")
+        for name, stats in sorted(summary.items(), key=lambda kv: kv[1]["total_ms"], reverse=True):
+            logger.info(f"  {name}: {stats['count']} spans, {stats['total_ms']:.1f}ms total, "
+                        f"p50 {stats['p50_ms']:.1f}ms, p95 {stats['p95_ms']:.1f}ms")
+
+
+def percentile(sorted_values, percent):
+    """
+    Returns the nearest-rank percentile of a sorted, non empty list.
+    """
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+# The tracer of the process, None while tracing is disabled
+_tracer = None
+
+# What 'span()' returns while tracing is disabled, so a disabled span allocates nothing
+_NO_SPAN = nullcontext()
+
+
+def enable():
+    """
+    Starts tracing with a new Tracer, and returns it.
+    """
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def disable():
+    """
+    Stops tracing, and returns the Tracer that was recording (or None).
+    """
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def current():
+    """
+    Returns the Tracer that is recording, or None if tracing is disabled.
+    """
+    return _tracer
+
+
+def span(name, category="news_browser", **args):
+    """
+    Returns a context manager that records the 'with' block as a span, if tracing is enabled.
+
+    Parameters
+    ----------
+    name : str
+        The stage.
+    category : str
+        The category of the trace event.
+    **args
+        Details shown with the event.
+    """
+    if _tracer is None:
+        return _NO_SPAN
+    return _tracer.span(name, category, args)
+
+
+def traced(name, category="news_browser"):
+    """
+    A decorator that records every call of a function as a span, if tracing is enabled.
+
+    It must not be used on generators, their span would end before they run.
+    """
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return function(*args, **kwargs)
+            with _tracer.span(name, category):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -1,9 +1,12 @@
 # Standard Python library imports
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 import re
 
-# Third party libraries imports
-from dateutil.relativedelta import relativedelta
+# Local module imports
+from .dates import DateWindow, parse_date
+from .money import contains_money
+from .phrases import PhraseMatcher
 
 
 def format_current_date():
@@ -25,63 +28,18 @@ def convert_date_to_mm_aaaa(date_str):
     Parameters
     ----------
     date_str : str
-        The date string to be converted.
+        The date string to be converted, absolute ("Jan. 1, 2020") or relative ("3 hours ago").
 
     Returns
     -------
     str or None
         The date in 'MM-YYYY' format, or None if the conversion fails.
     """
-    # Check for recent time patterns
-    recent_patterns = {
-        "now": datetime.now(),
-        "sec": timedelta(seconds=1),
-        "seconds": timedelta(seconds=1),
-        "min": timedelta(minutes=1),
-        "minutes": timedelta(minutes=1),
-        "hour": timedelta(hours=1),
-        "hours": timedelta(hours=1),
-        "day": timedelta(days=1)
-    }
-    
-    for pattern, delta in recent_patterns.items():
-        if re.match(fr"\b\d+\s*{pattern}\b", date_str):
-            return (datetime.now() - delta).strftime("%m-%Y")
-
-    # Map of month abbreviations to full month names
-    month_map = {
-        "Jan.": "January", "Jan": "January",
-        "Feb.": "February", "Feb": "February",
-        "March": "March", "Mar": "March",
-        "April": "April", "Apr": "April",
-        "May": "May",
-        "June": "June", "Jun": "June",
-        "July": "July", "Jul": "July", 
-        "Aug.": "August", "Aug": "August",
-        "Sept.": "September", "Sep": "September",
-        "Oct.": "October", "Oct": "October",
-        "Nov.": "November", "Nov": "November",
-        "Dec.": "December", "Dec": "December"
-    }
-    
-    # Replace month abbreviation with full name
-    for abbr, full in month_map.items():
-        if abbr in date_str:
-            date_str = date_str.replace(abbr, full)
-            break
-
-    # Possible date formats
-    possible_formats = ["%B. %d, %Y", "%B %d, %Y"]
-    
-    # Try parsing with each format
-    for fmt in possible_formats:
-        try:
-            date_obj = datetime.strptime(date_str, fmt)
-            return date_obj.strftime("%m-%Y")
-        except ValueError:
-            pass
-    
-    return None
+    # The parsing is done (and cached) by the 'dates' module
+    date_obj = parse_date(date_str)
+    if date_obj is None:
+        return None
+    return f"{date_obj.month:02d}-{date_obj.year}"
 
 def word_counter(text_to_match, search_phrase):
     """
@@ -99,17 +57,12 @@ def word_counter(text_to_match, search_phrase):
     int
         The number of occurrences of the search phrase in the text.
     """
-    text_to_match = text_to_match.lower()
-    search_phrase = search_phrase.lower()
-
-    # Create a regular expression that searches for the word within other words
-    pattern = re.compile(r'\b\w*' + re.escape(search_phrase) + r'\w*\b')
+    # The matcher of the phrase is compiled once and reused for every news
+    return _phrase_matcher(search_phrase).count(text_to_match)[search_phrase]
 
-    # Find all occurrences that match the pattern
-    matches = pattern.findall(text_to_match)
-
-    # Return the number of matches found
-    return len(matches)
+@lru_cache(maxsize=256)
+def _phrase_matcher(search_phrase):
+    return PhraseMatcher([search_phrase])
 
 def does_it_contain_money(text_to_match):
     """
@@ -125,8 +78,8 @@ def does_it_contain_money(text_to_match):
     bool
         True if the text contains monetary values, False otherwise.
     """
-    patron_dinero = r'\$[0-9]+(\.[0-9]+)?(\,[0-9]+)?(\s(dollars|usd))?'
-    return bool(re.search(patron_dinero, text_to_match, re.IGNORECASE))
+    # The pattern is compiled once by the 'money' module, which also extracts the amounts
+    return contains_money(text_to_match)
 
 def calculate_months_to_consider(num_months):
     """
@@ -147,19 +100,8 @@ def calculate_months_to_consider(num_months):
     ValueError
         If num_months is not a positive integer.
     """
-    # We do not accept strings or negative numbers
-    if not isinstance(num_months, int) or num_months < 0:
-        raise ValueError("num_months can not be negative integer.")
-
-    # We find current date and obtain the current month and year
-    current_date = datetime.now()
-    months_years = [current_date.strftime("%m-%Y")]
-
-    # Then, we find the possible month and years to consider for the search
-    for i in range(1, num_months):
-        date_to_add = current_date - relativedelta(months=i)
-        months_years.append(date_to_add.strftime("%m-%Y"))
-    return months_years
+    # The window checks num_months and knows its months, the current one first
+    return DateWindow(num_months).labels()
 
 def clean_text(text):
     """
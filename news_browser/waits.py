@@ -0,0 +1,259 @@
+# Standard Python library imports
+import time
+from collections import deque
+
+# Third party libraries imports
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
+
+# Local module imports
+from .my_logger import logger
+
+
+class PageWaiter:
+    """
+    A class that waits for concrete conditions on the page instead of sleeping a fixed time,
+    and records how long every wait actually took.
+
+    Parameters
+    ----------
+    browser : RPA.Browser.Selenium.Selenium
+        The Selenium Browser instance used to interact with the website.
+    timeout : float
+        Default maximum number of seconds to wait for a condition.
+    poll_interval : float
+        Seconds between two checks of a condition.
+    max_timings : int
+        Number of the last waits kept in 'timings', the summary counts every wait of the session.
+
+    Methods
+    -------
+    until(condition, step)
+        Waits until 'condition()' returns a truthy value.
+    page_ready(step)
+        Waits until the document finished loading.
+    element_visible(locator, step)
+        Waits until an element is visible.
+    any_visible(locators, step)
+        Waits until one of several elements is visible and returns which one.
+    staleness(element, step)
+        Waits until an element is removed from the page (for example after a navigation).
+    rerendered(element, find_current, step)
+        Waits until an element is replaced, or its text changes (for example after sorting).
+    select_value(locator, label, step)
+        Waits until a select shows the given label.
+    summary()
+        Returns the count, total and max seconds waited per step.
+    log_report()
+        Logs the summary.
+    """
+
+    def __init__(self, browser, timeout=20, poll_interval=0.1, max_timings=100):
+        self.browser = browser
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        # A batch waits thousands of times, so only the last waits are kept and the others are counted per step
+        self.timings = deque(maxlen=max_timings)
+        self._stats = {}
+
+    def _record(self, step, start, success):
+        seconds = time.perf_counter() - start
+        self.timings.append({"step": step, "seconds": seconds, "success": success})
+        stats = self._stats.setdefault(step, {"count": 0, "total": 0.0, "max": 0.0, "failures": 0})
+        stats["count"] += 1
+        stats["total"] += seconds
+        stats["max"] = max(stats["max"], seconds)
+        stats["failures"] += 0 if success else 1
+        logger.debug(f"Waited {seconds:.3f}s for '{step}' (success={success})")
+
+    def _timed(self, step, keyword, *args, **kwargs):
+        """
+        Runs a blocking RPA wait keyword and records how long it took.
+        """
+        start = time.perf_counter()
+        try:
+            result = keyword(*args, **kwargs)
+        except Exception:
+            self._record(step, start, False)
+            raise
+        self._record(step, start, True)
+        return result
+
+    def until(self, condition, step, timeout=None):
+        """
+        Waits until 'condition()' returns a truthy value.
+
+        Parameters
+        ----------
+        condition : callable
+            A function without arguments, an exception raised by it counts as a falsy value.
+        step : str
+            Name of the step, used in the timings report.
+        timeout : float, optional
+            Maximum number of seconds to wait, 'self.timeout' by default.
+
+        Returns
+        -------
+        object
+            The truthy value returned by the condition.
+
+        Raises
+        ------
+        TimeoutError
+            If the condition is not met in time.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        start = time.perf_counter()
+        deadline = start + timeout
+        while True:
+            try:
+                result = condition()
+            except WebDriverException:
+                result = None
+            if result:
+                self._record(step, start, True)
+                return result
+            if time.perf_counter() >= deadline:
+                self._record(step, start, False)
+                raise TimeoutError(f"'{step}' was not met after {timeout} seconds")
+            time.sleep(self.poll_interval)
+
+    def page_ready(self, step="page ready", timeout=None):
+        """
+        Waits until the document finished loading.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        return self._timed(step, self.browser.wait_for_condition,
+                           "return document.readyState == 'complete'", timeout=timeout)
+
+    def element_visible(self, locator, step=None, timeout=None):
+        """
+        Waits until an element is visible.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        return self._timed(step or f"visible {locator}", self.browser.wait_until_element_is_visible,
+                           locator, timeout=timeout)
+
+    def any_visible(self, locators, step, timeout=None):
+        """
+        Waits until one of several elements is visible.
+
+        Parameters
+        ----------
+        locators : list of str
+            The locators to check, in order of preference.
+        step : str
+            Name of the step, used in the timings report.
+        timeout : float, optional
+            Maximum number of seconds to wait.
+
+        Returns
+        -------
+        str
+            The first locator whose element is visible.
+        """
+        def first_visible():
+            for locator in locators:
+                if self.browser.is_element_visible(locator):
+                    return locator
+            return None
+        return self.until(first_visible, step, timeout)
+
+    def staleness(self, element, step, timeout=None):
+        """
+        Waits until an element is removed from the page, which is how we know that the
+        old results were replaced by the new ones.
+
+        Parameters
+        ----------
+        element : selenium.webdriver.remote.webelement.WebElement or None
+            An element of the old page, if None there is nothing to wait for.
+        step : str
+            Name of the step, used in the timings report.
+        timeout : float, optional
+            Maximum number of seconds to wait.
+
+        Returns
+        -------
+        bool
+            True once the element is stale.
+        """
+        if element is None:
+            return True
+
+        def is_stale():
+            try:
+                element.is_enabled()
+                return False
+            except StaleElementReferenceException:
+                return True
+        return self.until(is_stale, step, timeout)
+
+    def rerendered(self, element, find_current, step, timeout=None):
+        """
+        Waits until a list of elements was rendered again: its old first element was removed from the page,
+        or the first element is now another one, or its text changed (the site may update the node in place).
+
+        Parameters
+        ----------
+        element : selenium.webdriver.remote.webelement.WebElement or None
+            The first element before the action, if None there is nothing to wait for.
+        find_current : callable
+            Returns the current first element, or None.
+        step : str
+            Name of the step, used in the timings report.
+        timeout : float, optional
+            Maximum number of seconds to wait.
+
+        Returns
+        -------
+        bool
+            True once the list was rendered again.
+        """
+        if element is None:
+            return True
+        try:
+            old_text = element.text
+        except StaleElementReferenceException:
+            return True
+
+        def changed():
+            try:
+                text = element.text
+            except StaleElementReferenceException:
+                return True
+            current = find_current()
+            return current is not None and (current != element or text != old_text)
+        return self.until(changed, step, timeout)
+
+    def select_value(self, locator, label, step, timeout=None):
+        """
+        Waits until a select element shows the given label.
+        """
+        return self.until(lambda: self.browser.get_selected_list_label(locator) == label, step, timeout)
+
+    def summary(self):
+        """
+        Returns the count, total and max seconds waited per step.
+
+        Returns
+        -------
+        dict
+            {step: {"count": int, "total": float, "max": float, "failures": int}}
+        """
+        return {step: dict(stats) for step, stats in self._stats.items()}
+
+    def log_report(self):
+        """
+        Logs how long we waited in every step, slowest steps first.
+
+        Returns
+        -------
+        None
+        """
+        summary = self.summary()
+        count = sum(stats["count"] for stats in summary.values())
+        total = sum(stats["total"] for stats in summary.values())
+        logger.info(f"Wait timings: {count} waits, {total:.2f}s in total")
+        for step, stats in sorted(summary.items(), key=lambda kv: kv[1]["total"], reverse=True):
+            logger.info(f"  {step}: {stats['count']} waits, {stats['total']:.2f}s total, "
+                        f"{stats['max']:.2f}s max, {stats['failures']} timeouts")
@@ -6,11 +6,26 @@ from robocorp.tasks import task
 
 # Local module imports
 from news_browser.my_logger import logger
+from testing.test_article_store import TestArticleStore
 from testing.test_browser import TestNewsBrowser
+from testing.test_dates import TestDates
 from testing.test_excel_creator import TestExcelCreator
+from testing.test_http_scraper import TestHttpNewsScraper
+from testing.test_image_cache import TestImageCache
 from testing.test_image_downloader import TestImageDownloader
-# from testing.test_news_scraper import TestNewsScraper
+from testing.test_money import TestMoney
+from testing.test_news_item import TestNewsItem
+from testing.test_news_scraper import TestNewsScraper
+from testing.test_phrases import TestPhraseMatcher
+from testing.test_pipeline import TestNewsPipeline
+from testing.test_recording import TestRecording
+from testing.test_sharding import TestShardSupervisor
+from testing.test_sinks import TestSinks
+from testing.test_thumbnails import TestThumbnailMaker
+from testing.test_topic_cache import TestTopicCache
+from testing.test_tracing import TestTracing
 from testing.test_utils import TestUtils
+from testing.test_waits import TestPageWaiter
 
 
 @task
@@ -21,11 +36,26 @@ def main():
     # Add the unit tests of each module to the TestSuite
     suite = unittest.TestSuite()
 
+    suite.addTests(loader.loadTestsFromTestCase(TestArticleStore))
+    suite.addTests(loader.loadTestsFromTestCase(TestDates))
     suite.addTests(loader.loadTestsFromTestCase(TestExcelCreator))
+    suite.addTests(loader.loadTestsFromTestCase(TestHttpNewsScraper))
+    suite.addTests(loader.loadTestsFromTestCase(TestImageCache))
     suite.addTests(loader.loadTestsFromTestCase(TestImageDownloader))
     suite.addTests(loader.loadTestsFromTestCase(TestNewsBrowser))
-    # suite.addTests(loader.loadTestsFromTestCase(TestNewsScraper))
+    suite.addTests(loader.loadTestsFromTestCase(TestMoney))
+    suite.addTests(loader.loadTestsFromTestCase(TestNewsItem))
+    suite.addTests(loader.loadTestsFromTestCase(TestNewsScraper))
+    suite.addTests(loader.loadTestsFromTestCase(TestPhraseMatcher))
+    suite.addTests(loader.loadTestsFromTestCase(TestNewsPipeline))
+    suite.addTests(loader.loadTestsFromTestCase(TestRecording))
+    suite.addTests(loader.loadTestsFromTestCase(TestShardSupervisor))
+    suite.addTests(loader.loadTestsFromTestCase(TestSinks))
+    suite.addTests(loader.loadTestsFromTestCase(TestThumbnailMaker))
+    suite.addTests(loader.loadTestsFromTestCase(TestTopicCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestTracing))
     suite.addTests(loader.loadTestsFromTestCase(TestUtils))
+    suite.addTests(loader.loadTestsFromTestCase(TestPageWaiter))
 
 
     # Create a TextTestRunner object to run the tests and display the results
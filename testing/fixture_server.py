@@ -0,0 +1,77 @@
+# Standard Python library imports
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def read_fixture(name):
+    """
+    Returns the content of a file of the 'testing/fixtures' directory.
+    """
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+class FixtureServer:
+    """
+    A local stand-in for the search of the news site, serving the saved pages of 'testing/fixtures'.
+
+    - '/search?q=sdsdfdsf...' answers with the 'no results' page.
+    - '/search?...&p=2' answers with the second page of results.
+    - Any other '/search' answers with the first page of results.
+
+    Every requested path is kept in 'requested', so the tests can check the URLs that were built.
+    """
+
+    no_results_phrase = "sdsdfdsf"
+
+    def __init__(self):
+        self.requested = []
+        self._server = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def page_for(self, query):
+        if query.get("q", [""])[0] == self.no_results_phrase:
+            return "search_no_results.html"
+        if query.get("p", ["1"])[0] == "2":
+            return "search_page_2.html"
+        return "search_page_1.html"
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requested.append(self.path)
+                url = urlsplit(self.path)
+                if url.path != "/search":
+                    self.send_error(404)
+                    return
+                body = read_fixture(server.page_for(parse_qs(url.query))).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._server.shutdown()
+        self._server.server_close()
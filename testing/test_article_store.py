@@ -0,0 +1,94 @@
+# Standard Python library imports
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date
+from unittest.mock import patch
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from news_browser.article_store import ArticleStore
+from news_browser.dates import DateWindow, month_ordinal
+from news_browser.news_collector import NewsCollector
+
+
+def make_promo(name, published=None):
+    published = published or date.today()
+    return {"title": f"Messi {name}", "date": f"{published:%B} {published.day}, {published.year}",
+            "description": f"The news {name}", "image_url": "N/A", "image_alt": "N/A",
+            "article_url": f"https://www.latimes.com/sports/story/{name}"}
+
+
+@patch("news_browser.news_collector.logger")
+class TestArticleStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ArticleStore(os.path.join(self.tmp.name, "articles.sqlite3"))
+        self.old = make_promo("old", date(2020, 1, 1))
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def crawl(self, pages, incremental):
+        collector = NewsCollector("Messi", 1, "Sports", self.store, incremental)
+        for promos in pages:
+            if not collector.add_page(promos):
+                break
+        return collector, collector.finish()
+
+    def test_article_key(self, mock_logger):
+        promo = make_promo("a")
+        self.assertEqual(self.store.article_key(promo), "https://www.latimes.com/sports/story/a")
+        promo["article_url"] = "N/A"
+        self.assertTrue(self.store.article_key(promo).startswith("sha1:"))
+        self.assertEqual(self.store.article_key(promo), self.store.article_key(dict(promo)))
+
+        # The same news read again a few hours later has another relative date, but the same key
+        self.assertEqual(self.store.article_key(promo), self.store.article_key(dict(promo, date="5 hours ago")))
+
+    def test_store_and_read(self, mock_logger):
+        today = date.today()
+        entries = [(self.store.article_key(promo), promo, month_ordinal(today))
+                   for promo in (make_promo("a"), make_promo("b"))]
+        entries[1][1]["date"] = "3 minutes ago"
+        self.store.add("Messi", "Sports", entries)
+
+        self.assertEqual(self.store.known_keys(" messi", "SPORTS", [entries[0][0], "unknown"]), {entries[0][0]})
+        articles = self.store.articles("Messi", "Sports", DateWindow(1), exclude={entries[0][0]})
+        self.assertEqual([promo["title"] for _, promo, _ in articles], ["Messi b"])
+        # A relative date is replaced by the day it meant
+        self.assertTrue(articles[0][1]["date"].endswith(str(today.year)))
+        self.assertEqual(self.store.articles("Messi", "Politics", DateWindow(1)), [])
+
+    def test_incremental_crawl_stops_at_the_first_known_page(self, mock_logger):
+        a, b, c, d, e, new = (make_promo(name) for name in ["a", "b", "c", "d", "e", "new"])
+        collector, news_data = self.crawl([[a, b], [c, d], [e, self.old]], incremental=True)
+        self.assertEqual(collector.pages_read, 3)
+        self.assertEqual(len(news_data), 5)
+
+        # The second run reads a new news, then a page of known news, and takes the older ones from the store
+        collector, news_data = self.crawl([[new, a], [b, c], [d, e], [self.old]], incremental=True)
+        self.assertEqual(collector.pages_read, 2)
+        self.assertTrue(collector.reached_known)
+        self.assertEqual(collector.items_from_store, 2)
+        self.assertEqual([item["title"] for item in news_data], [f"Messi {name}" for name in "new a b c d e".split()])
+        self.assertEqual([item["news_name"] for item in news_data], [f"news{index}" for index in range(1, 7)])
+
+    def test_full_crawl_only_records(self, mock_logger):
+        a, b = make_promo("a"), make_promo("b")
+        self.crawl([[a, b], [self.old]], incremental=False)
+        collector, news_data = self.crawl([[a, b], [self.old]], incremental=False)
+        self.assertEqual(collector.pages_read, 2)
+        self.assertFalse(collector.reached_known)
+        self.assertEqual(len(news_data), 2)
+        self.assertEqual(len(self.store.articles("Messi", "Sports", DateWindow(1))), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 # Standard Python library imports
 import os
 import sys
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 
@@ -11,6 +12,8 @@ sys.path.append(project_dir)
 
 # Local module imports
 from news_browser.browser import NewsBrowser
+from news_browser.dates import DateWindow
+from news_browser.http_scraper import HttpNewsScraper
 
 class TestNewsBrowser(unittest.TestCase):
     
@@ -77,5 +80,125 @@ class TestNewsBrowser(unittest.TestCase):
         self.mock_browser.open_available_browser.assert_not_called()
         self.mock_news_scraper.scrap_news.assert_not_called()
 
+    @patch("news_browser.browser.logger")
+    @patch("news_browser.browser.ExcelCreator")
+    @patch("news_browser.browser.ImageDownloader")
+    def test_run_batch(self, MockImageDownloader, MockExcelCreator, mock_logger):
+        # Arrange, two valid searches and an invalid one in the input queue
+        queue = [
+            {"search_phrase": "Messi", "news_category": "Sports", "num_months": 1},
+            {"search_phrase": "Messi", "news_category": "Sports", "num_months": -1},
+            {"search_phrase": "Trump", "news_category": "World & Nation", "num_months": 2},
+        ]
+
+        def for_each_input_work_item(func, *args):
+            results = []
+            for variables in queue:
+                self.mock_workitems.get_work_item_variables.return_value = variables
+                results.append(func(*args))
+            return results
+
+        self.mock_workitems.get_work_item_variables.return_value = queue[0]
+        self.mock_workitems.for_each_input_work_item.side_effect = for_each_input_work_item
+        self.mock_news_scraper.scrap_news.return_value = [{"bool": True, "image_path": "N/A"}]
+        MockExcelCreator.return_value.create_excel.return_value = "output/Messi_Sports_1/Messi_Sports_1.xlsx"
+
+        # Act
+        report = self.news_browser.run_batch()
+
+        # Assert, one browser for the whole batch, going back to the home page after every search
+        self.mock_browser.open_available_browser.assert_called_once()
+        self.mock_browser.close_all_browsers.assert_called_once()
+        self.assertEqual(self.mock_browser.go_to.call_count, 2)
+        self.assertEqual([item["status"] for item in report], ["done", "invalid", "done"])
+        self.assertEqual([call.args[0] for call in MockExcelCreator.call_args_list],
+                         [os.path.join("output", "Messi_Sports_1"), os.path.join("output", "Trump_WorldNation_2")])
+
+        # Every input work item has its output work item with its timings
+        self.assertEqual(self.mock_workitems.create_output_work_item.call_count, 3)
+        output = self.mock_workitems.create_output_work_item.call_args_list[0].kwargs
+        self.assertEqual(output["files"], ["output/Messi_Sports_1/Messi_Sports_1.xlsx"])
+        self.assertEqual(output["variables"]["news"], 1)
+        self.assertGreaterEqual(output["variables"]["total_seconds"], output["variables"]["scrape_seconds"])
+
+    @patch("news_browser.browser.logger")
+    @patch("news_browser.pipeline.logger")
+    @patch("news_browser.browser.ExcelCreator")
+    @patch("news_browser.browser.ImageDownloader")
+    def test_process_query_streaming(self, MockImageDownloader, MockExcelCreator, mock_pipeline_logger, mock_logger):
+        # Arrange, the news of every page are exported while the next one is scraped
+        MockImageDownloader.return_value.max_workers = 2
+        MockExcelCreator.return_value.create_excel.return_value = "output/Messi_Sports_1/Messi_Sports_1.xlsx"
+        this_month = DateWindow(1).last
+        pages = [[{"bool": True, "month_ordinal": this_month, "image_url": "N/A", "image_path": "N/A"}],
+                 [{"bool": True, "month_ordinal": this_month, "image_url": "http://example.com/image2.jpg",
+                   "image_path": "output/news2.jpg"}]]
+        self.mock_news_scraper.iter_news.return_value = iter(pages)
+        variables = {"search_phrase": "Messi", "news_category": "Sports", "num_months": 1, "streaming": True}
+
+        # Act
+        report, news_data, files = self.news_browser.process_query(variables, "browser")
+
+        # Assert
+        self.mock_news_scraper.iter_news.assert_called_once_with("Messi", "Sports", 1)
+        self.mock_news_scraper.scrap_news.assert_not_called()
+        MockImageDownloader.return_value.download_image.assert_called_once_with(pages[1][0])
+        MockImageDownloader.return_value.close.assert_called_once()
+        MockExcelCreator.return_value.create_excel.assert_called_once()
+        self.assertEqual(news_data, pages[0] + pages[1])
+        self.assertEqual((report["status"], report["news"]), ("done", 2))
+        self.assertEqual(files, ["output/Messi_Sports_1/Messi_Sports_1.xlsx"])
+
+    @patch("news_browser.browser.logger")
+    def test_process_query_attaches_only_the_images_of_the_search(self, mock_logger):
+        variables = {"search_phrase": "Messi", "news_category": "Sports", "num_months": 1}
+        with tempfile.TemporaryDirectory() as tmp:
+            # An image of this search, and one left in the output directory by another run
+            search_dir = NewsBrowser.search_dir(tmp, "Messi", "Sports", 1)
+            os.makedirs(search_dir)
+            inside = os.path.join(search_dir, "news1.jpg")
+            outside = os.path.join(tmp, "news2.jpg")
+            for path in (inside, outside):
+                open(path, "wb").close()
+            self.mock_news_scraper.scrap_news.return_value = [
+                {"bool": True, "image_path": inside}, {"bool": True, "image_path": outside},
+                {"bool": True, "image_path": "N/A"}]
+
+            with patch.object(self.news_browser, "export", return_value=None):
+                report, news_data, files = self.news_browser.process_query(variables, "browser", output_root=tmp)
+
+        self.assertEqual(report["status"], "done")
+        self.assertEqual(files, [inside])
+
+    def test_the_article_store_is_closed_at_the_end_of_the_run(self):
+        store = MagicMock()
+        self.news_browser.article_store = store
+
+        # Even when the search fails, its journal is written to the database
+        with patch.object(self.news_browser, "read_input", return_value={"search_phrase": "Messi"}), \
+             patch.object(self.news_browser, "run_search", side_effect=RuntimeError("The site is down")):
+            with self.assertRaises(RuntimeError):
+                self.news_browser.run()
+        store.close.assert_called_once()
+        self.assertIsNone(self.news_browser.article_store)
+
+        # And after a batch
+        self.news_browser.article_store = store
+        self.news_browser.run_batch()
+        self.assertEqual(store.close.call_count, 2)
+
+    @patch("news_browser.browser.logger")
+    def test_process_query_closes_the_http_session(self, mock_logger):
+        http_scraper = MagicMock(spec=HttpNewsScraper)
+        http_scraper.scrap_news.side_effect = RuntimeError("The site is down")
+        variables = {"search_phrase": "Messi", "news_category": "Sports", "num_months": 1, "max_retries": 0}
+
+        # Even when the search fails, its session is closed
+        with patch.object(self.news_browser, "configure", return_value=http_scraper):
+            report, news_data, files = self.news_browser.process_query(variables, "http")
+
+        self.assertEqual(report["status"], "failed")
+        http_scraper.close.assert_called_once()
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,81 @@
+# Standard Python library imports
+import os
+import sys
+import unittest
+from datetime import date, datetime
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from news_browser.dates import DateWindow, is_of_interest, month_ordinal, parse_date, parse_many, parse_timestamp
+
+
+class TestDates(unittest.TestCase):
+    def setUp(self):
+        self.now = datetime(2024, 3, 1, 2, 30)
+
+    def test_relative_dates_use_their_number(self):
+        self.assertEqual(parse_date("45 minutes ago", self.now), date(2024, 3, 1))
+        self.assertEqual(parse_date("3 hours ago", self.now), date(2024, 2, 29))
+        self.assertEqual(parse_date("2 days ago", self.now), date(2024, 2, 28))
+        self.assertEqual(parse_date("an hour ago", self.now), date(2024, 3, 1))
+        self.assertEqual(parse_date("1 week ago", self.now), date(2024, 2, 23))
+        self.assertEqual(parse_date("3 months ago", self.now), date(2023, 12, 1))
+        self.assertEqual(parse_date("just now", self.now), date(2024, 3, 1))
+
+    def test_absolute_dates(self):
+        self.assertEqual(parse_date("Jan. 1, 2020"), date(2020, 1, 1))
+        self.assertEqual(parse_date("Sept. 5, 2023"), date(2023, 9, 5))
+        self.assertEqual(parse_date("June 3, 2024"), date(2024, 6, 3))
+        self.assertEqual(parse_date(" May 15, 2019 "), date(2019, 5, 15))
+        self.assertIsNone(parse_date("Feb. 30, 2024"))
+        self.assertIsNone(parse_date("Smarch 3, 2024"))
+        self.assertIsNone(parse_date("N/A"))
+
+    def test_parse_is_cached(self):
+        parse_timestamp.cache_clear()
+        parse_many(["3 hours ago", "Jan. 1, 2020", "3 hours ago", "3 hours ago"], self.now)
+        info = parse_timestamp.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 2))
+
+    def test_parse_many(self):
+        self.assertEqual(parse_many(["3 hours ago", "Oct. 16, 2004", "not a date"], self.now),
+                         [date(2024, 2, 29), date(2004, 10, 16), None])
+
+    def test_date_window_crosses_the_year(self):
+        window = DateWindow(3, today=date(2024, 2, 10))
+        self.assertEqual(window.labels(), ["02-2024", "01-2024", "12-2023"])
+        self.assertEqual(len(window), 3)
+        self.assertIn(date(2023, 12, 31), window)
+        self.assertIn("Jan. 5, 2024", window)
+        self.assertNotIn(date(2023, 11, 30), window)
+        self.assertNotIn("not a date", window)
+        self.assertNotIn(None, window)
+
+    def test_date_window_of_zero_months_is_the_current_month(self):
+        self.assertEqual(DateWindow(0, today=date(2024, 2, 10)).labels(), ["02-2024"])
+        with self.assertRaises(ValueError):
+            DateWindow(-1)
+        with self.assertRaises(ValueError):
+            DateWindow("2")
+
+    def test_date_window_compare(self):
+        window = DateWindow(2, today=self.now.date())
+        self.assertEqual(window.compare("3 hours ago", self.now), 0)
+        self.assertEqual(window.compare("2 months ago", self.now), -1)
+        self.assertEqual(window.compare(date(2024, 4, 1)), 1)
+        self.assertIsNone(window.compare("N/A", self.now))
+
+    def test_is_of_interest(self):
+        window = DateWindow(1, today=date(2024, 3, 5))
+        item = {"bool": False, "month_ordinal": month_ordinal(date(2024, 3, 1))}
+        self.assertFalse(is_of_interest(item))
+        self.assertTrue(is_of_interest(item, window))
+        self.assertFalse(is_of_interest({"bool": True, "month_ordinal": None}, window))
+
+
+if __name__ == "__main__":
+    unittest.main()
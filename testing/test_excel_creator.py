@@ -1,4 +1,5 @@
 # Standard Python library imports
+import gc
 import os
 import sys
 import unittest
@@ -9,8 +10,11 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 project_dir = os.path.dirname(current_dir)
 sys.path.append(project_dir)
 
+# Third party libraries imports
+import openpyxl
+
 # Local module imports
-from news_browser.excel_creator import ExcelCreator
+from news_browser.excel_creator import HEADERS, ExcelCreator
 
 class TestExcelCreator(unittest.TestCase):
     def setUp(self):
@@ -35,8 +39,9 @@ class TestExcelCreator(unittest.TestCase):
         # Act
         self.creator.clear_excel_files()
 
-        # Assert
-        mock_glob.assert_called_once_with("output/*.xlsx")
+        # Assert, the files of the other output formats are cleared too
+        mock_glob.assert_any_call("output/*.xlsx")
+        mock_glob.assert_any_call("output/*.csv")
         mock_remove.assert_any_call("output/file1.xlsx")
         mock_remove.assert_any_call("output/file2.xlsx")
 
@@ -59,5 +64,68 @@ class TestExcelCreator(unittest.TestCase):
         # Assert
         mock_save.assert_called_once_with(f"output/{search_phrase}_{news_category}_{num_months}.xlsx")
 
+    def test_create_excel_writes_the_money_amounts(self):
+        # Arrange
+        news_data = [
+            {"bool": True, "title": "Title 1", "date": "Date 1", "description": "It cost $1.2 million and 20 dollars",
+             "image_path": "Path 1", "phrase_matches": 1, "contain_money": True,
+             "money_amounts": [{"amount": 1200000.0, "text": "$1.2 million", "span": (8, 20)},
+                               {"amount": 20.0, "text": "20 dollars", "span": (25, 35)}]},
+            {"bool": True, "title": "Title 2", "date": "Date 2", "description": "Description 2",
+             "image_path": "Path 2", "phrase_matches": 0, "contain_money": False},
+        ]
+
+        # Act
+        excel_file = self.creator.create_excel(news_data, "Messi", "Sports", 1)
+
+        # Assert
+        ws = openpyxl.load_workbook(excel_file).active
+        self.assertEqual(ws.cell(row=1, column=7).value, "Money Amounts")
+        self.assertEqual(ws.cell(row=2, column=7).value, "$1,200,000.00; $20.00")
+        self.assertIsNone(ws.cell(row=3, column=7).value)
+
+    def test_create_excel_streams_a_generator_of_news(self):
+        # Arrange
+        news_data = ({"bool": index % 2 == 0, "title": f"Title {index}", "date": "Date", "description": "Description",
+                      "image_path": "N/A", "phrase_matches": index, "contain_money": False} for index in range(10))
+
+        # Act
+        excel_file = self.creator.create_excel(news_data, "Messi", "Sports", 3)
+
+        # Assert
+        rows = list(openpyxl.load_workbook(excel_file).active.iter_rows(values_only=True))
+        self.assertEqual(list(rows[0]), HEADERS)
+        self.assertEqual([row[0] for row in rows[1:]], ["Title 0", "Title 2", "Title 4", "Title 6", "Title 8"])
+        self.assertEqual(rows[2][4], 2)
+
+    @patch("openpyxl.Workbook.save")
+    def test_create_excel_without_news_of_interest(self, mock_save):
+        news_data = [{"bool": False, "title": "Title 1", "date": "Date 1", "description": "Description 1",
+                      "image_path": "Path 1", "phrase_matches": 1, "contain_money": True}]
+
+        self.assertIsNone(self.creator.create_excel(news_data, "Messi", "Sports", 1))
+        mock_save.assert_not_called()
+
+    def test_create_excel_drops_the_workbook_of_a_failed_row(self):
+        # The second news has no title, its row can not be written
+        news_data = [{"bool": True, "title": "Title 1", "date": "Date 1", "description": "Description 1",
+                      "image_path": "Path 1", "phrase_matches": 1, "contain_money": False},
+                     {"bool": True, "date": "Date 2"}]
+        sink = MagicMock()
+        unraisable = []
+        previous_hook, sys.unraisablehook = sys.unraisablehook, unraisable.append
+        try:
+            with self.assertRaises(KeyError):
+                self.creator.create_excel(news_data, "Messi", "Failed", 1, sinks=[sink])
+            gc.collect()
+        finally:
+            sys.unraisablehook = previous_hook
+
+        # No file, no rows generator failing when garbage collected, and the files of the sinks are deleted
+        self.assertEqual(unraisable, [])
+        self.assertFalse(os.path.exists("output/Messi_Failed_1.xlsx"))
+        sink.discard.assert_called_once()
+        sink.close.assert_not_called()
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,110 @@
+# Standard Python library imports
+import os
+import sys
+import unittest
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from news_browser.http_scraper import HttpNewsScraper
+from news_browser.promo_parser import parse_page, parse_promos, parse_topics
+from testing.fixture_server import FixtureServer, read_fixture
+
+
+class TestHttpNewsScraper(unittest.TestCase):
+    def setUp(self):
+        self.server = FixtureServer().__enter__()
+        self.scraper = HttpNewsScraper(self.server.base_url)
+
+    def tearDown(self):
+        self.scraper.close()
+        self.server.__exit__(None, None, None)
+
+    def test_search_url(self):
+        url = self.scraper.search_url("old trafford", "0000-abc", page=3)
+        self.assertEqual(parse_qs(urlsplit(url).query), {"q": ["old trafford"], "s": ["1"], "f0": ["0000-abc"], "p": ["3"]})
+
+    def test_parse_promos_only_reads_the_results(self):
+        promos = parse_promos(read_fixture("search_page_1.html"))
+        self.assertEqual(len(promos), 4)
+        self.assertEqual(promos[0]["title"], "Messi leads Inter Miami to a win in his debut")
+        self.assertEqual(promos[1]["title"], "Argentina wins the Copa América final & Messi cries")
+        self.assertEqual(promos[2]["image_url"], "N/A")
+        self.assertEqual(promos[3]["description"], "N/A")
+        self.assertEqual(promos[0]["article_url"], "https://www.latimes.com/sports/story/messi-inter-miami-debut")
+
+        topics = parse_topics(read_fixture("search_page_1.html"))
+        self.assertEqual([topic["labels"] for topic in topics], [["World & Nation"], ["Sports"], ["Politics"]])
+
+    def test_engines_extract_identical_fields(self):
+        tricky = (
+            '<ul class="search-results-module-results-menu">'
+            '<li><div class="promo-wrapper  extra"><h3 class="x promo-title">\n  Caf&eacute; <b>owner</b> &amp; <!-- c --> chef \n</h3>'
+            '<p class="promo-description">  First line<br>second line </p>'
+            '<img class="lazy image" src="https://example.com/a.jpg"></div></li>'
+            '<li><div class="promo-wrapper"><p class="promo-timestamp">Sept. 5, 2023</p></div></li></ul>'
+        )
+        for html in [read_fixture("search_page_1.html"), read_fixture("search_page_2.html"),
+                     read_fixture("search_no_results.html"), tricky]:
+            lxml_page, soup_page = parse_page(html, "lxml"), parse_page(html, "soup")
+            self.assertEqual(list(lxml_page.iter_promos()), list(soup_page.iter_promos()))
+            self.assertEqual(lxml_page.topics(), soup_page.topics())
+            self.assertEqual(lxml_page.next_page_href(), soup_page.next_page_href())
+            self.assertEqual(lxml_page.no_results_text(), soup_page.no_results_text())
+
+        promos = parse_promos(tricky)
+        self.assertEqual(promos[0]["title"], "Café owner &  chef")
+        self.assertEqual(promos[0]["image_alt"], None)
+        self.assertEqual(promos[1]["title"], "N/A")
+        self.assertEqual(promos[1]["article_url"], "N/A")
+
+    @patch("news_browser.http_scraper.logger")
+    def test_scrap_news(self, mock_logger):
+        news_data = self.scraper.scrap_news("Messi", "sports", 2)
+
+        # The first page and the second page (which goes out of the months of interest) were read,
+        # the news after the first old one were not even parsed
+        self.assertEqual([item["news_name"] for item in news_data], [f"news{i}" for i in range(1, 6)])
+        self.assertTrue(all(item["bool"] for item in news_data))
+        self.assertEqual((self.scraper.collector.pages_read, self.scraper.collector.items_parsed), (2, 6))
+        self.assertTrue(self.scraper.collector.reached_cutoff)
+        self.assertEqual(news_data[0]["phrase_matches"], 3)
+        self.assertTrue(news_data[0]["contain_money"])
+        self.assertEqual([amount["amount"] for amount in news_data[0]["money_amounts"]], [50_000_000.0])
+        self.assertEqual(news_data[1]["money_amounts"][0]["text"], "2,000 dollars")
+        self.assertNotEqual(news_data[0]["image_url"], "N/A")
+        self.assertEqual(news_data[2]["image_url"], "N/A")
+        self.assertEqual(news_data[0]["image_path"], "N/A")  # Until the image is downloaded
+
+        # The search was sorted by 'Newest' and filtered by the facet of the 'Sports' checkbox
+        queries = [parse_qs(urlsplit(path).query) for path in self.server.requested]
+        self.assertEqual(queries[0], {"q": ["Messi"], "s": ["1"]})
+        self.assertEqual(queries[1]["f0"], ["00000168-8694-d257-a96e-c7d7f8bb0000"])
+        self.assertEqual(queries[2]["p"], ["2"])
+        self.assertEqual(len(queries), 3)
+
+    @patch("news_browser.http_scraper.logger")
+    def test_iter_news_yields_page_by_page(self, mock_logger):
+        pages = self.scraper.iter_news("Messi", "sports", 2)
+
+        # Only the search and the first page are requested before the first page of news is yielded
+        first_page = next(pages)
+        self.assertEqual([item["news_name"] for item in first_page], [f"news{i}" for i in range(1, 5)])
+        self.assertEqual(len(self.server.requested), 2)
+        self.assertEqual([item["news_name"] for item in next(pages)], ["news5"])
+        self.assertEqual(list(pages), [])
+        self.assertEqual(len(self.server.requested), 3)
+
+    @patch("news_browser.http_scraper.logger")
+    def test_scrap_news_without_results_or_category(self, mock_logger):
+        self.assertEqual(self.scraper.scrap_news(FixtureServer.no_results_phrase, "Sports", 2), [])
+        self.assertEqual(self.scraper.scrap_news("Messi", "Not a topic", 2), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+# Standard Python library imports
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from news_browser.image_cache import ImageCache
+from news_browser.image_downloader import ImageDownloader
+
+
+class TestImageCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ImageCache(cache_dir=self.tmp.name, max_bytes=1000)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_tmp(self, content):
+        # A downloaded file waiting to be stored in the cache
+        fd, path = tempfile.mkstemp(dir=self.cache.tmp_dir)
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        return path
+
+    def test_same_content_is_stored_once(self):
+        headers = {"ETag": '"abc"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        self.cache.store("http://a.com/1.jpg", self.write_tmp(b"same"), "d1", headers)
+        self.cache.store("http://b.com/2.jpg", self.write_tmp(b"same"), "d1", {})
+
+        self.assertEqual(os.listdir(self.cache.blobs_dir), ["d1.jpg"])
+        self.assertEqual(os.listdir(self.cache.tmp_dir), [])
+        self.assertEqual(self.cache.validators(self.cache.lookup("http://a.com/1.jpg")),
+                         {"If-None-Match": '"abc"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"})
+        self.assertEqual(self.cache.validators(self.cache.lookup("http://b.com/2.jpg")), {})
+
+    def test_materialize_and_persist(self):
+        self.cache.store("http://a.com/1.jpg", self.write_tmp(b"image"), "d1", {})
+        dest = os.path.join(self.tmp.name, "news1.jpg")
+        self.cache.materialize("http://a.com/1.jpg", dest)
+        self.cache.save()
+
+        with open(dest, "rb") as f:
+            self.assertEqual(f.read(), b"image")
+
+        # A new cache on the same directory (the next run) still knows the image
+        self.assertIsNotNone(ImageCache(cache_dir=self.tmp.name).lookup("http://a.com/1.jpg"))
+
+    def test_evict_least_recently_used(self):
+        self.cache.store("http://a.com/old.jpg", self.write_tmp(b"o" * 600), "old", {})
+        self.cache.store("http://a.com/new.jpg", self.write_tmp(b"n" * 600), "new", {})
+        self.cache.materialize("http://a.com/new.jpg", os.path.join(self.tmp.name, "news1.jpg"))
+
+        self.assertEqual(self.cache.evict(), 1)
+        self.assertIsNone(self.cache.lookup("http://a.com/old.jpg"))
+        self.assertIsNotNone(self.cache.lookup("http://a.com/new.jpg"))
+
+    def test_caches_shared_by_two_processes(self):
+        # Two caches on the same directory stand for two workers of a sharded run
+        other = ImageCache(cache_dir=self.tmp.name, max_bytes=1000)
+        self.cache.store("http://a.com/1.jpg", self.write_tmp(b"1" * 400), "d1", {})
+        other.store("http://a.com/2.jpg", self.write_tmp(b"2" * 400), "d2", {})
+        self.cache.save()
+        other.save()
+
+        # The last save does not drop the entries of the other worker, and nothing is left behind
+        reloaded = ImageCache(cache_dir=self.tmp.name)
+        self.assertIsNotNone(reloaded.lookup("http://a.com/1.jpg"))
+        self.assertIsNotNone(reloaded.lookup("http://a.com/2.jpg"))
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ["blobs", "index.json", "index.json.lock", "tmp"])
+
+        # The size limit counts the images of both workers, even those this one never saw
+        other.store("http://a.com/3.jpg", self.write_tmp(b"3" * 400), "d3", {})
+        self.assertEqual(self.cache.evict(), 1)
+        self.assertEqual(sorted(os.listdir(self.cache.blobs_dir)), ["d2.jpg", "d3.jpg"])
+        self.assertIsNone(self.cache.lookup("http://a.com/1.jpg"))
+
+        # An entry of an image evicted by another worker is not saved again
+        other.save()
+        self.assertIsNone(ImageCache(cache_dir=self.tmp.name).lookup("http://a.com/1.jpg"))
+
+    @patch('news_browser.image_downloader.logger')
+    @patch('news_browser.image_downloader.requests.Session')
+    def test_downloader_uses_the_cache(self, MockSession, mock_logger):
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.status_code = 200
+        response.headers = {"Content-Type": "image/jpeg", "ETag": '"v1"'}
+        response.iter_content.return_value = [b"image content"]
+        MockSession.return_value.get.return_value = response
+        news_data = [{"bool": True, "image_url": "http://a.com/1.jpg", "news_name": "news1",
+                      "image_path": "output/news1.jpg"}]
+
+        # First run downloads the image
+        ImageDownloader(cache=self.cache).download_images(news_data)
+        self.assertEqual(MockSession.return_value.get.call_count, 1)
+
+        # Second run, the image is fresh so there is no request at all
+        ImageDownloader(cache=ImageCache(cache_dir=self.tmp.name)).download_images(news_data)
+        self.assertEqual(MockSession.return_value.get.call_count, 1)
+        self.assertTrue(os.path.exists("output/news1.jpg"))
+
+        # Third run, the image is stale so it is revalidated and the server answers 304
+        response.status_code = 304
+        stale_cache = ImageCache(cache_dir=self.tmp.name, max_age=0)
+        ImageDownloader(cache=stale_cache).download_images(news_data)
+        self.assertEqual(MockSession.return_value.get.call_args.kwargs["headers"], {"If-None-Match": '"v1"'})
+        response.iter_content.assert_called_once()
+        self.assertTrue(os.path.exists("output/news1.jpg"))
+        os.remove("output/news1.jpg")
+
+    @patch('news_browser.image_downloader.logger')
+    @patch('news_browser.image_downloader.requests.Session')
+    def test_downloader_downloads_images_evicted_after_the_lookup(self, MockSession, mock_logger):
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.status_code = 200
+        response.headers = {"Content-Type": "image/jpeg", "ETag": '"v1"'}
+        response.iter_content.return_value = [b"image content"]
+        MockSession.return_value.get.return_value = response
+        self.cache.max_bytes = 1024 * 1024
+        self.cache.store("http://a.com/1.jpg", self.write_tmp(b"image content"), "d1", {"ETag": '"v1"'})
+        news_data = [{"bool": True, "image_url": "http://a.com/1.jpg", "news_name": "news1",
+                      "image_path": "output/news1.jpg"}]
+
+        # Another process evicts the image between the lookup and the copy of a fresh entry
+        lookup = self.cache.lookup
+
+        def evicted_after_lookup(url):
+            entry = lookup(url)
+            if entry:
+                os.remove(os.path.join(self.cache.blobs_dir, f"{entry['sha256']}.jpg"))
+            return entry
+
+        with patch.object(self.cache, "lookup", side_effect=evicted_after_lookup):
+            ImageDownloader(cache=self.cache).download_images(news_data)
+        self.assertEqual(MockSession.return_value.get.call_args.kwargs["headers"], {})
+        self.assertEqual(news_data[0]["image_path"], "output/news1.jpg")
+        self.assertTrue(os.path.exists("output/news1.jpg"))
+
+        # The same with a stale entry: the server answers 304, and the image is requested again
+        self.cache.max_age = 0
+        MockSession.return_value.get.reset_mock()
+
+        def answer(url, headers, **kwargs):
+            response.status_code = 304 if headers else 200
+            return response
+
+        MockSession.return_value.get.side_effect = answer
+        with patch.object(self.cache, "lookup", side_effect=evicted_after_lookup):
+            ImageDownloader(cache=self.cache).download_images(news_data)
+        self.assertEqual([call.kwargs["headers"] for call in MockSession.return_value.get.call_args_list],
+                         [{"If-None-Match": '"v1"'}, {}])
+        self.assertIsNotNone(self.cache.lookup("http://a.com/1.jpg"))
+        with open("output/news1.jpg", "rb") as f:
+            self.assertEqual(f.read(), b"image content")
+        os.remove("output/news1.jpg")
+
+
+if __name__ == "__main__":
+    unittest.main()
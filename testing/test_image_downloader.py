@@ -5,6 +5,7 @@ import sys
 import unittest
 from unittest.mock import patch, MagicMock
 from openpyxl import load_workbook
+import requests
 
 # Taking the correct directory to import the files
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -18,6 +19,18 @@ class TestImageDownloader(unittest.TestCase):
     def setUp(self):
         self.image_downloader = ImageDownloader()
 
+    @staticmethod
+    def make_response(body, content_type="image/jpeg", content_length=None, chunk_size=4):
+        # A streamed response that returns the body in small chunks
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.status_code = 200
+        response.headers = {"Content-Type": content_type}
+        if content_length is not None:
+            response.headers["Content-Length"] = str(content_length)
+        response.iter_content.return_value = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+        return response
+
     @patch('news_browser.image_downloader.logger')
     def test_clear_images(self, mock_logger):
         # Create a dummy image file to test deletion
@@ -82,6 +95,83 @@ class TestImageDownloader(unittest.TestCase):
         image_files = glob.glob(f"{self.image_downloader.imgs_dir}*.jpg")
         self.assertTrue(len(image_files) == 0)
 
+    @patch('news_browser.image_downloader.logger')
+    @patch('news_browser.image_downloader.requests.Session')
+    def test_download_images_concurrently(self, MockSession, mock_logger):
+        # Mock response shared by every session
+        MockSession.return_value.get.return_value = self.make_response(b'test image content')
+
+        # Sample news data, all of them from the same host
+        news_data = [
+            {
+                "bool": True,
+                "image_url": f"http://example.com/image{i}.jpg",
+                "news_name": f"test_news{i}",
+                "image_path": f"output/test_news{i}.jpg"
+            }
+            for i in range(1, 6)
+        ]
+
+        downloader = ImageDownloader(max_workers=4)
+        downloader.download_images(news_data)
+        downloader.close()
+
+        # Every image is written and every dictionary points to its file
+        for item in news_data:
+            self.assertEqual(item["image_path"], os.path.join("output/", f"{item['news_name']}.jpg"))
+            self.assertTrue(os.path.exists(item["image_path"]))
+
+        # One keep-alive session for the host, with a timeout on every request
+        self.assertEqual(MockSession.call_count, 1)
+        for call in MockSession.return_value.get.call_args_list:
+            self.assertEqual(call.kwargs["timeout"], downloader.timeout)
+        downloader.clear_images()
+
+    @patch('news_browser.image_downloader.logger')
+    @patch('news_browser.image_downloader.requests.Session')
+    def test_download_image_failure_keeps_path(self, MockSession, mock_logger):
+        # The request fails, for example because of a timeout
+        MockSession.return_value.get.side_effect = requests.Timeout("timed out")
+        item = {
+            "bool": True,
+            "image_url": "http://example.com/image.jpg",
+            "news_name": "test_news",
+            "image_path": "output/test_news.jpg"
+        }
+
+        self.assertFalse(self.image_downloader.download_image(item))
+        self.assertEqual(item["image_path"], "output/test_news.jpg")
+        self.assertFalse(os.path.exists("output/test_news.jpg"))
+
+    @patch('news_browser.image_downloader.logger')
+    @patch('news_browser.image_downloader.requests.Session')
+    def test_download_image_size_cap(self, MockSession, mock_logger):
+        item = {"bool": True, "image_url": "http://example.com/big.jpg", "news_name": "big_news"}
+        downloader = ImageDownloader(max_bytes=10)
+
+        # The Content-Length already tells us that the image is too big, so the body is never read
+        response = self.make_response(b'x' * 20, content_length=20)
+        MockSession.return_value.get.return_value = response
+        self.assertFalse(downloader.download_image(item))
+        response.iter_content.assert_not_called()
+
+        # Without Content-Length, the download is aborted while streaming and nothing is left behind
+        MockSession.return_value.get.return_value = self.make_response(b'x' * 20)
+        self.assertFalse(downloader.download_image(item))
+        self.assertNotIn("image_path", item)
+        self.assertEqual(glob.glob("output/*.part") + glob.glob("output/big_news.jpg"), [])
+
+    @patch('news_browser.image_downloader.logger')
+    @patch('news_browser.image_downloader.requests.Session')
+    def test_download_image_rejects_non_images(self, MockSession, mock_logger):
+        item = {"bool": True, "image_url": "http://example.com/page", "news_name": "html_news"}
+        response = self.make_response(b'<html></html>', content_type="text/html")
+        MockSession.return_value.get.return_value = response
+
+        self.assertFalse(self.image_downloader.download_image(item))
+        response.iter_content.assert_not_called()
+        self.assertFalse(os.path.exists("output/html_news.jpg"))
+
     # @patch('image_downloader.logger')
     # @patch('image_downloader.requests.get')
     # def test_no_images_downloaded_for_na_urls(self, mock_requests_get, mock_logger):
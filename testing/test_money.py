@@ -0,0 +1,67 @@
+# Standard Python library imports
+import os
+import sys
+import unittest
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from news_browser.money import contains_money, extract_money, extract_money_many, format_amounts
+
+
+class TestMoney(unittest.TestCase):
+    def amounts(self, text):
+        return [(amount["amount"], amount["text"]) for amount in extract_money(text)]
+
+    def test_formats_of_the_challenge(self):
+        self.assertEqual(self.amounts("$11.1"), [(11.1, "$11.1")])
+        self.assertEqual(self.amounts("$111,111.11"), [(111111.11, "$111,111.11")])
+        self.assertEqual(self.amounts("11 dollars"), [(11.0, "11 dollars")])
+        self.assertEqual(self.amounts("11 USD"), [(11.0, "11 USD")])
+
+    def test_scales_and_prefixes(self):
+        self.assertEqual(self.amounts("a $1.2 million deal"), [(1200000.0, "$1.2 million")])
+        self.assertEqual(self.amounts("3 billion dollars"), [(3e9, "3 billion dollars")])
+        self.assertEqual(self.amounts("a fee of USD 500"), [(500.0, "USD 500")])
+        self.assertEqual(self.amounts("a $5k raise"), [(5000.0, "$5k")])
+        self.assertEqual(self.amounts("It costs $100,00 USD."), [(100.0, "$100,00 USD")])
+
+    def test_spans(self):
+        text = "Paid $20.50, not €30, and then 2,000 dollars."
+        for amount in extract_money(text):
+            start, end = amount["span"]
+            self.assertEqual(text[start:end], amount["text"])
+        self.assertEqual([amount["amount"] for amount in extract_money(text)], [20.5, 2000.0])
+
+    def test_no_money(self):
+        self.assertEqual(extract_money("In 2024, 5 more players and €30."), [])
+        self.assertFalse(contains_money("In 2024, 5 more players and €30."))
+        self.assertTrue(contains_money("$5 more"))
+
+    def test_years_are_not_amounts(self):
+        self.assertEqual(extract_money("The year 2020 dollars were worth more."), [])
+        self.assertFalse(contains_money("Back to 1999 USD prices"))
+        self.assertEqual(self.amounts("2,020 dollars or 2020.5 USD"), [(2020.0, "2,020 dollars"), (2020.5, "2020.5 USD")])
+        self.assertEqual(self.amounts("a 2020 million dollars plan"), [(2.02e9, "2020 million dollars")])
+
+    def test_bare_integers_that_are_not_years(self):
+        self.assertEqual(self.amounts("It cost 1500 dollars"), [(1500.0, "1500 dollars")])
+        self.assertEqual(self.amounts("a 25000 USD fine and 2100 dollars"),
+                         [(25000.0, "25000 USD"), (2100.0, "2100 dollars")])
+
+    def test_batch_and_format(self):
+        texts = ["$1.2 million and 20 dollars", "No money here.", "Paid 20", "$30 more"]
+        amounts = extract_money_many(texts)
+        self.assertEqual(len(amounts), 4)
+        self.assertEqual(format_amounts(amounts[0]), "$1,200,000.00; $20.00")
+        self.assertEqual(format_amounts(amounts[1]), "")
+        self.assertEqual(amounts[2], [])  # "20" and the "$" of the next text are not joined
+        self.assertEqual(amounts, [extract_money(text) for text in texts])
+        self.assertEqual(extract_money_many(["No money", "at all"]), [[], []])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+# Standard Python library imports
+import os
+import pickle
+import sys
+import unittest
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from news_browser.news_item import KEYS, NewsItem, has_image
+from news_browser.promo_parser import build_news_item
+
+
+class TestNewsItem(unittest.TestCase):
+    def setUp(self):
+        self.promo = {
+            "title": "Messi wins a $1.2 million prize",
+            "date": "June 3, 2024",
+            "description": "Messi is in the news.",
+            "image_url": "https://example.com/image.jpg",
+            "image_alt": "Messi",
+            "article_url": "https://example.com/story",
+        }
+
+    def test_build_news_item_reads_like_the_dictionary(self):
+        item = build_news_item(self.promo, 3, "Messi", True, 24293)
+
+        self.assertIsInstance(item, NewsItem)
+        self.assertEqual(item["title"], "Messi wins a $1.2 million prize")
+        self.assertEqual(item["phrase_matches"], 2)
+        self.assertTrue(item["contain_money"])
+        self.assertEqual(item["money_amounts"][0]["amount"], 1200000.0)
+        self.assertEqual(item["news_name"], "news3")
+        self.assertEqual(item["image_path"], "N/A")  # Not downloaded yet
+        self.assertEqual(item["excel_filename"], "output/excel_files/news3.xlsx")
+        self.assertTrue(item["bool"])
+        self.assertEqual(item["month_ordinal"], 24293)
+        self.assertEqual(list(item.to_dict()), list(KEYS))
+
+    def test_missing_values_are_none_and_read_as_na(self):
+        self.promo.update(image_url="N/A", image_alt="N/A", article_url="N/A")
+        item = build_news_item(self.promo, 1, "Messi", False, None)
+
+        self.assertIsNone(item.image_url)
+        self.assertIsNone(item.article_url)
+        self.assertIsNone(item.image_path)
+        self.assertEqual(item["image_url"], "N/A")
+        self.assertEqual(item["image_path"], "N/A")
+        self.assertEqual(item.get("article_url", "missing"), "N/A")
+        self.assertFalse(item["bool"])
+
+        # A news without picture, whether it is a NewsItem or an old dictionary
+        self.assertFalse(has_image(item))
+        self.assertFalse(has_image(item.to_dict()))
+        self.assertTrue(has_image(NewsItem(2, image_url="https://example.com/pic.jpg")))
+
+    def test_image_path_is_set_like_the_dictionary(self):
+        item = build_news_item(self.promo, 1, "Messi", True, 24293)
+
+        item["image_path"] = "output/news1.png"
+        self.assertEqual(item["image_path"], "output/news1.png")
+        item["image_path"] = "N/A"
+        self.assertIsNone(item.downloaded_path)
+        self.assertEqual(item["image_path"], "N/A")
+
+    def test_unknown_and_derived_keys(self):
+        item = NewsItem(1, title="Messi")
+
+        self.assertNotIn("color", item)
+        self.assertIsNone(item.get("color"))
+        with self.assertRaises(KeyError):
+            item["color"]
+        with self.assertRaises(KeyError):
+            item["news_name"] = "news2"
+        with self.assertRaises(AttributeError):
+            item.color = "red"
+
+    def test_equality_and_pickle(self):
+        item = build_news_item(self.promo, 1, "Messi", True, 24293)
+
+        self.assertEqual(item, build_news_item(self.promo, 1, "Messi", True, 24293))
+        self.assertNotEqual(item, build_news_item(self.promo, 2, "Messi", True, 24293))
+        self.assertEqual(pickle.loads(pickle.dumps(item)), item)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,201 @@
+# Standard Python library imports
+import os
+import sys
+import unittest
+from unittest.mock import patch, MagicMock
+from urllib.parse import parse_qs, urlsplit
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from news_browser.news_scraper import NewsScraper, PROMOS_SCRIPT
+from news_browser.promo_parser import parse_promos
+from testing.fixture_server import read_fixture
+
+
+class FakeDriver:
+    """
+    Just enough of a WebDriver to open, switch and close tabs.
+    """
+
+    def __init__(self):
+        self.window_handles = ["main"]
+        self.current_window_handle = "main"
+        self.urls = {"main": "https://www.latimes.com/search?q=Messi&s=1&f0=abc"}
+        self.switch_to = MagicMock()
+        self.switch_to.window.side_effect = self._switch
+
+    def _switch(self, handle):
+        self.current_window_handle = handle
+
+    def execute_script(self, script, url):
+        handle = f"tab{len(self.urls)}"
+        self.window_handles.append(handle)
+        self.urls[handle] = url
+
+    def close(self):
+        self.window_handles.remove(self.current_window_handle)
+
+
+class TestNewsScraper(unittest.TestCase):
+    def setUp(self):
+        self.browser = MagicMock()
+        self.scraper = NewsScraper(self.browser, MagicMock(), waiter=MagicMock())
+
+    def test_page_url(self):
+        url = NewsScraper.page_url("https://www.latimes.com/search?q=Messi&s=1&p=2&f0=abc", 5)
+        self.assertEqual(parse_qs(urlsplit(url).query), {"q": ["Messi"], "s": ["1"], "f0": ["abc"], "p": ["5"]})
+
+    def test_facet_url(self):
+        url = NewsScraper.facet_url("https://www.latimes.com/search?q=Messi&s=1&p=2&f0=old", "new")
+        self.assertEqual(parse_qs(urlsplit(url).query), {"q": ["Messi"], "s": ["1"], "f0": ["new"]})
+
+    @patch("news_browser.news_scraper.logger")
+    def test_select_topic_clicks_the_checkbox_of_the_category(self, mock_logger):
+        topics_box = self.browser.get_webelement.return_value
+        topics_box.get_attribute.return_value = read_fixture("search_page_1.html")
+
+        with patch.object(self.scraper, "apply_topic_filter"):
+            topic = self.scraper.select_topic("SPORTS")
+
+            # The checkbox is located by the facet id of the topic, not by its position among the checkboxes
+            self.assertEqual(topic["labels"], ["Sports"])
+            self.browser.click_element.assert_called_with(
+                'css:ul.search-filter-menu input.checkbox-input-element[value="00000168-8694-d257-a96e-c7d7f8bb0000"]')
+
+            self.assertIsNone(self.scraper.select_topic("Not a topic"))
+
+    @patch("news_browser.news_scraper.logger")
+    def test_search_news_uses_the_topic_cache(self, mock_logger):
+        self.scraper.topic_cache = MagicMock()
+        self.scraper.topic_cache.get.return_value = None
+        self.browser.get_location.return_value = "https://www.latimes.com/search?q=Messi&s=1"
+
+        # First search, the topic box is scanned and the facet is cached
+        with patch.object(self.scraper, "no_results_search", return_value=False), \
+             patch.object(self.scraper, "select_topic", return_value={"labels": ["Sports"], "value": "abc"}) as select:
+            self.assertTrue(self.scraper.search_news("Messi", "Sports"))
+            self.scraper.topic_cache.put.assert_called_once_with("Messi", "Sports", "abc")
+
+            # Second search, the cached facet is loaded directly
+            self.scraper.topic_cache.get.return_value = "abc"
+            self.assertTrue(self.scraper.search_news("Messi", "Sports"))
+
+        select.assert_called_once()
+        self.browser.go_to.assert_called_once_with("https://www.latimes.com/search?q=Messi&s=1&f0=abc")
+
+    def test_iter_pages_in_tabs(self):
+        driver = FakeDriver()
+        self.browser.driver = driver
+        self.browser.get_location.return_value = driver.urls["main"]
+        self.scraper.parallel_pages = 3
+
+        # Every tab returns the page number of its URL as its news
+        def read_results():
+            query = parse_qs(urlsplit(driver.urls[driver.current_window_handle]).query)
+            return query.get("p", ["1"])[0]
+
+        with patch.object(self.scraper, "read_results", side_effect=read_results):
+            pages = self.scraper.iter_pages_in_tabs(last_page=10)
+            read = []
+            for page_number, promos in pages:
+                read.append((page_number, promos))
+                if page_number == 5:
+                    break
+            pages.close()
+
+        # The pages come in order, in batches of 3 tabs, and the tab of the page 6 was closed unread
+        self.assertEqual(read, [(1, "1"), (2, "2"), (3, "3"), (4, "4"), (5, "5")])
+        self.assertEqual(len(driver.urls), 7)
+        self.assertEqual(driver.window_handles, ["main"])
+        self.assertEqual(driver.current_window_handle, "main")
+
+    @patch("news_browser.news_scraper.logger")
+    def test_scrap_news_reads_pages_in_order(self, mock_logger):
+        pages = [read_fixture("search_page_1.html"), read_fixture("search_page_2.html")]
+
+        with patch.object(self.scraper, "search_news", return_value=True), \
+             patch.object(self.scraper, "read_page_counts", return_value=2), \
+             patch.object(self.scraper, "read_results_html", side_effect=pages):
+            news_data = self.scraper.scrap_news("Messi", "Sports", 2)
+
+        # Only one 'Next Page' click, from the first page to the last one
+        self.browser.click_element.assert_called_once_with("class:search-results-module-next-page")
+        self.assertEqual([item["news_name"] for item in news_data], [f"news{i}" for i in range(1, 6)])
+        self.assertEqual(news_data[4]["title"], "Inside Messi's record contract")
+
+    @patch("news_browser.news_scraper.logger")
+    def test_scrap_news_stops_at_cutoff(self, mock_logger):
+        # The site says there are 5 pages but the second one already has news older than 2 months
+        pages = [read_fixture("search_page_1.html"), read_fixture("search_page_2.html"), read_fixture("search_page_1.html")]
+
+        with patch.object(self.scraper, "search_news", return_value=True), \
+             patch.object(self.scraper, "read_page_counts", return_value=5), \
+             patch.object(self.scraper, "read_results_html", side_effect=pages) as read_results_html:
+            news_data = self.scraper.scrap_news("Messi", "Sports", 2)
+
+        # Two pages loaded, one 'Next Page' click, and only 6 of the 7 news of those pages parsed
+        self.assertEqual(read_results_html.call_count, 2)
+        self.assertEqual(self.browser.click_element.call_count, 1)
+        self.assertEqual(self.scraper.collector.pages_read, 2)
+        self.assertEqual(self.scraper.collector.items_parsed, 6)
+        self.assertEqual(len(news_data), 5)
+
+    @patch("news_browser.news_scraper.logger")
+    def test_sort_by_newest_checks_the_sort_when_the_results_do_not_change(self, mock_logger):
+        self.scraper.waiter.rerendered.side_effect = TimeoutError("not rendered again")
+        self.browser.get_selected_list_label.return_value = "Newest"
+
+        # The results were already sorted: the select and the URL say so
+        self.browser.get_location.return_value = "https://www.latimes.com/search?q=Messi&s=1"
+        self.assertTrue(self.scraper.sort_by_newest())
+        self.assertEqual(self.browser.select_from_list_by_label.call_count, 1)
+
+        # The sort was not applied: it is selected again, then given up
+        self.browser.get_location.return_value = "https://www.latimes.com/search?q=Messi&s=0"
+        self.assertFalse(self.scraper.sort_by_newest())
+        self.assertEqual(self.browser.select_from_list_by_label.call_count, 3)
+
+    @patch("news_browser.news_scraper.logger")
+    def test_scrap_news_reads_every_page_when_not_sorted(self, mock_logger):
+        pages = [read_fixture("search_page_2.html"), read_fixture("search_page_1.html")]
+        self.scraper.sorted_by_newest = False
+
+        # The old news of the first page does not stop the crawl, it is only left out
+        with patch.object(self.scraper, "search_news", return_value=True), \
+             patch.object(self.scraper, "read_page_counts", return_value=2), \
+             patch.object(self.scraper, "read_results_html", side_effect=pages):
+            news_data = self.scraper.scrap_news("Messi", "Sports", 2)
+
+        self.assertFalse(self.scraper.collector.reached_cutoff)
+        self.assertEqual(self.scraper.collector.pages_read, 2)
+        self.assertEqual(self.scraper.collector.items_skipped, 2)
+        self.assertEqual(len(news_data), 5)
+
+    @patch("news_browser.news_scraper.logger")
+    def test_scrap_news_with_javascript_extraction(self, mock_logger):
+        pages = [read_fixture("search_page_1.html"), read_fixture("search_page_2.html")]
+        with patch.object(self.scraper, "search_news", return_value=True), \
+             patch.object(self.scraper, "read_page_counts", return_value=2), \
+             patch.object(self.scraper, "read_results_html", side_effect=pages):
+            expected = self.scraper.scrap_news("Messi", "Sports", 2)
+
+        # In the "js" mode the browser sends back the fields, the HTML is never read
+        self.scraper.extraction_mode = "js"
+        self.browser.execute_javascript.side_effect = [parse_promos(page) for page in pages]
+        with patch.object(self.scraper, "search_news", return_value=True), \
+             patch.object(self.scraper, "read_page_counts", return_value=2), \
+             patch.object(self.scraper, "read_results_html") as read_results_html:
+            news_data = self.scraper.scrap_news("Messi", "Sports", 2)
+
+        read_results_html.assert_not_called()
+        self.browser.execute_javascript.assert_called_with(PROMOS_SCRIPT)
+        self.assertEqual(self.browser.execute_javascript.call_count, 2)
+        self.assertEqual(news_data, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+# Standard Python library imports
+import os
+import sys
+import unittest
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from news_browser.phrases import PhraseMatcher
+from news_browser.utils import word_counter
+
+
+class TestPhraseMatcher(unittest.TestCase):
+    def setUp(self):
+        self.texts = [
+            "Venezuelan culture is very rich. Many Venezuelans live in Venezuela.",
+            "This is a test sentence for testing.",
+            "Trump’s resilience gives California GOP dreams of payback in a state that has long been blue.",
+            "The New York Times and the new yorker",
+            "no match here",
+        ]
+
+    def test_counts_every_phrase_like_word_counter(self):
+        phrases = ["venezuela", "test", "Trump", "is", "new york", "e", "Trump/", "payback in"]
+        matcher = PhraseMatcher(phrases)
+        for text, counts in zip(self.texts, matcher.count_many(self.texts)):
+            self.assertEqual(list(counts), phrases)
+            for phrase in phrases:
+                self.assertEqual(counts[phrase], word_counter(text, phrase), (text, phrase))
+
+    def test_count(self):
+        matcher = PhraseMatcher(["venezuela", "rich", "Many"])
+        self.assertEqual(matcher.count(self.texts[0]), {"venezuela": 3, "rich": 1, "Many": 1})
+
+    def test_overlapping_phrases(self):
+        # "he" is inside "she" and "hers", every phrase is counted on its own
+        matcher = PhraseMatcher(["he", "she", "hers", "his"])
+        self.assertEqual(matcher.count("ushers say she is his"), {"he": 2, "she": 2, "hers": 1, "his": 1})
+
+    def test_duplicated_phrases_are_counted_once(self):
+        matcher = PhraseMatcher(["test", "test"])
+        self.assertEqual(matcher.phrases, ("test",))
+        self.assertEqual(matcher.count_many(self.texts[1:3]), [{"test": 2}, {"test": 0}])
+
+
+if __name__ == "__main__":
+    unittest.main()
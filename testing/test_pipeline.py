@@ -0,0 +1,138 @@
+# Standard Python library imports
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+# Third party libraries imports
+import openpyxl
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from news_browser.excel_creator import ExcelCreator
+from news_browser.http_scraper import HttpNewsScraper
+from news_browser.pipeline import NewsPipeline
+from testing.fixture_server import FixtureServer
+
+
+class FakeDownloader:
+    """
+    Stands in for the ImageDownloader: the first images take the longest, so they finish out of order.
+    """
+
+    def __init__(self, max_workers=4, fail_on=()):
+        self.max_workers = max_workers
+        self.fail_on = fail_on
+        self.downloaded = []
+        self.cache_saved = False
+        self.lock = threading.Lock()
+
+    def download_image(self, item):
+        if item["title"] in self.fail_on:
+            raise OSError("disk full")
+        time.sleep(0.02 if item["news_name"] == "news1" else 0.001)
+        item["image_path"] = f"downloads/{item['news_name']}.jpg"
+        with self.lock:
+            self.downloaded.append(item["news_name"])
+        return True
+
+    def save_cache(self):
+        self.cache_saved = True
+
+
+def make_pages(num_pages, per_page):
+    index = 0
+    for _ in range(num_pages):
+        page = []
+        for _ in range(per_page):
+            index += 1
+            page.append({"title": f"title {index}", "news_name": f"news{index}", "bool": index % 5 != 0,
+                         "image_url": "N/A" if index % 3 == 0 else f"https://example.com/{index}.jpg",
+                         "image_path": "N/A" if index % 3 == 0 else f"output/news{index}.jpg"})
+        yield page
+
+
+@patch("news_browser.pipeline.logger")
+class TestNewsPipeline(unittest.TestCase):
+    def test_exports_in_order_once_the_images_are_downloaded(self, mock_logger):
+        downloader = FakeDownloader()
+        exported = []
+
+        def export(items):
+            for item in items:
+                exported.append((item["news_name"], item["image_path"]))
+            return "report.xlsx"
+
+        news_data, result = NewsPipeline(downloader, queue_size=2).run(make_pages(4, 5), export)
+
+        # Every news is returned, but only those of interest are downloaded and exported, in the scraped order
+        self.assertEqual(len(news_data), 20)
+        self.assertEqual(result, "report.xlsx")
+        of_interest = [item for item in news_data if item["bool"]]
+        self.assertEqual([name for name, _ in exported], [item["news_name"] for item in of_interest])
+        for name, image_path in exported:
+            index = int(name[4:])
+            self.assertEqual(image_path, "N/A" if index % 3 == 0 else f"downloads/{name}.jpg")
+        self.assertEqual(sorted(downloader.downloaded), sorted(name for name, path in exported if path != "N/A"))
+        self.assertTrue(downloader.cache_saved)
+
+    def test_failed_downloads_and_exports_do_not_block(self, mock_logger):
+        downloader = FakeDownloader(max_workers=1, fail_on=("title 1",))
+        pipeline = NewsPipeline(downloader, queue_size=1)
+
+        # A failed download only leaves the news without its image
+        news_data, exported = pipeline.run(make_pages(2, 4), list)
+        self.assertEqual(exported[0]["image_path"], "output/news1.jpg")
+        self.assertEqual(pipeline.downloaded, 4)
+
+        # A failed export is raised once the scraping and the downloads are over
+        def export(items):
+            next(items)
+            raise ValueError("broken workbook")
+
+        with self.assertRaises(ValueError):
+            pipeline.run(make_pages(5, 4), export)
+
+    def test_scraper_errors_stop_the_threads(self, mock_logger):
+        def pages():
+            yield from make_pages(1, 3)
+            raise RuntimeError("the site went down")
+
+        downloader = FakeDownloader()
+        with self.assertRaises(RuntimeError):
+            NewsPipeline(downloader).run(pages(), list)
+        self.assertTrue(downloader.cache_saved)
+        self.assertFalse(any(thread.name.startswith("pipeline-") for thread in threading.enumerate()))
+
+    @patch("news_browser.http_scraper.logger")
+    @patch("news_browser.excel_creator.logger")
+    def test_streams_the_http_scraper_to_the_excel_file(self, mock_excel_logger, mock_http_logger, mock_logger):
+        with FixtureServer() as server, tempfile.TemporaryDirectory() as tmp:
+            scraper = HttpNewsScraper(server.base_url)
+            pages = scraper.iter_news("Messi", "sports", 2)
+            excel_creator = ExcelCreator(tmp)
+
+            def export(items):
+                return excel_creator.create_excel(items, "Messi", "sports", 2)
+
+            news_data, excel_file = NewsPipeline(FakeDownloader()).run(pages, export)
+            scraper.close()
+
+            self.assertEqual(len(news_data), 5)
+            workbook = openpyxl.load_workbook(excel_file, read_only=True)
+            rows = list(workbook.active.iter_rows(values_only=True))[1:]
+            workbook.close()
+            self.assertEqual([row[0] for row in rows], [item["title"] for item in news_data])
+            self.assertEqual(rows[0][3], "downloads/news1.jpg")
+            self.assertEqual(rows[2][3], "N/A")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+# Standard Python library imports
+import json
+import os
+import sys
+import tempfile
+import unittest
+import zipfile
+from datetime import datetime
+from functools import partial
+from unittest.mock import MagicMock, patch
+
+# Third party libraries imports
+import openpyxl
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from news_browser.http_scraper import HttpNewsScraper
+from news_browser.image_downloader import ImageDownloader
+from news_browser.news_collector import NewsCollector
+from news_browser.recording import ReplayScraper, SessionArchive, SessionRecorder, replay_session
+from testing.fixture_server import FixtureServer, read_fixture
+
+# The clock of the recorded crawl: the first day of a month, where "3 hours ago" is already the month before
+RECORDED_AT = datetime(2024, 5, 1, 0, 30)
+
+
+def image_body(image_url):
+    return f"JPEG of {image_url}".encode("utf-8")
+
+
+def make_session(image_url):
+    # A session that answers every image request with a small body
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.status_code = 200
+    response.headers = {"Content-Type": "image/jpeg"}
+    response.iter_content.return_value = [image_body(image_url)]
+    session = MagicMock()
+    session.get.return_value = response
+    return session
+
+
+@patch("news_browser.recording.logger")
+@patch("news_browser.http_scraper.logger")
+@patch("news_browser.image_downloader.logger")
+@patch("news_browser.excel_creator.logger")
+class TestRecording(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.archive_path = os.path.join(self.tmp.name, "session.zip")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def record(self):
+        # A live crawl over HTTP, with its images, recorded in the archive. Its clock is pinned, so the
+        # relative dates of the fixtures fall in the same months whatever the day the test runs
+        recorder = SessionRecorder(self.archive_path)
+        with FixtureServer() as server, \
+                patch("news_browser.http_scraper.NewsCollector", partial(NewsCollector, now=RECORDED_AT)):
+            scraper = HttpNewsScraper(server.base_url, recorder=recorder)
+            news_data = scraper.scrap_news("Messi", "sports", 2)
+            scraper.close()
+        recorder.session["recorded_at"] = RECORDED_AT.isoformat()
+        downloader = ImageDownloader(output_dir=os.path.join(self.tmp.name, "live"), recorder=recorder)
+        with patch.object(ImageDownloader, "_get_session", side_effect=make_session):
+            downloader.download_images(news_data)
+        self.assertEqual(recorder.close(), self.archive_path)
+        return news_data
+
+    def test_record_and_replay(self, *mock_loggers):
+        live = self.record()
+
+        with zipfile.ZipFile(self.archive_path) as archive:
+            names = archive.namelist()
+            session = json.loads(archive.read("session.json"))
+            self.assertEqual(archive.getinfo("pages/001.html").compress_type, zipfile.ZIP_DEFLATED)
+        self.assertEqual(session["pages"], ["pages/001.html", "pages/002.html"])
+        self.assertEqual(session["topics"], "topics.html")
+        self.assertEqual(len(session["images"]), 4)
+        self.assertIn("session.json", names)
+
+        # The replay has no server at all, and gives the same news, images and Excel file
+        news_data, excel_file = replay_session(self.archive_path, output_dir=os.path.join(self.tmp.name, "replay"))
+        self.assertEqual(len(news_data), 5)
+        self.assertEqual([item["month_ordinal"] for item in news_data], [item["month_ordinal"] for item in live])
+        self.assertEqual([(item["title"], item["date"], item["phrase_matches"]) for item in news_data],
+                         [(item["title"], item["date"], item["phrase_matches"]) for item in live])
+        replayed = next(item for item in news_data if item["image_url"] != "N/A")
+        with open(replayed["image_path"], "rb") as f:
+            self.assertEqual(f.read(), image_body(replayed["image_url"]))
+        workbook = openpyxl.load_workbook(excel_file, read_only=True)
+        self.assertEqual(len(list(workbook.active.iter_rows(values_only=True))), len(live) + 1)
+        workbook.close()
+
+    def test_replay_keeps_the_time_of_the_recording(self, *mock_loggers):
+        recorder = SessionRecorder(self.archive_path)
+        recorder.begin("Messi", "Sports", 1)
+        recorder.session["recorded_at"] = "2014-07-20T12:00:00"
+        recorder.add_topics(read_fixture("search_page_1.html"))
+        recorder.add_page(read_fixture("search_page_1.html"))
+        recorder.add_page(read_fixture("search_page_2.html"))
+        recorder.close()
+
+        # In July 2014 every news but the one of 2004 was of the current month
+        archive = SessionArchive(self.archive_path)
+        scraper = ReplayScraper(archive)
+        pages = list(scraper.iter_news("Messi", "Sports", 1))
+        self.assertEqual([len(items) for items in pages], [4, 2])
+        self.assertTrue(scraper.collector.reached_cutoff)
+        self.assertEqual(scraper.scrap_news("Messi", "Not a topic", 1), [])
+        archive.close()
+
+    def test_failed_sessions_leave_nothing(self, *mock_loggers):
+        recorder = SessionRecorder(self.archive_path)
+        self.assertIsNone(recorder.close())
+        recorder.begin("Messi", "Sports", 1)
+        recorder.add_page("<html>first try</html>")
+        recorder.begin("Messi", "Sports", 1)  # A retry starts again
+        recorder.add_page("<html>second try</html>")
+        recorder.close()
+        archive = SessionArchive(self.archive_path)
+        self.assertEqual(list(archive.pages()), ["<html>second try</html>"])
+        archive.close()
+        self.assertFalse(os.path.exists(f"{self.archive_path}.part"))
+
+        with zipfile.ZipFile(os.path.join(self.tmp.name, "other.zip"), "w") as other:
+            other.writestr("hello.txt", "hello")
+        with self.assertRaises(ValueError):
+            SessionArchive(os.path.join(self.tmp.name, "other.zip"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+# Standard Python library imports
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch, MagicMock
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from news_browser.article_store import ArticleStore
+from news_browser.browser import NewsBrowser
+from news_browser.image_cache import ImageCache
+from news_browser.sharding import ShardSupervisor
+from news_browser.topic_cache import TopicCache
+
+
+class FakeNewsBrowser:
+    """
+    Stands for the NewsBrowser of a worker, the search phrase tells how the search goes.
+    """
+    news_url = "https://www.latimes.com/"
+    search_dir = staticmethod(NewsBrowser.search_dir)
+
+    def __init__(self, load_work_items, headless, profile_dir, cache_dir="cache/"):
+        self.browser = MagicMock()
+        self.profile_dir = profile_dir
+        self.cache_dir = cache_dir
+
+    def open_news_site(self, url):
+        pass
+
+    def close_article_store(self):
+        pass
+
+    def process_query(self, variables, backend, output_root, create_excel):
+        if variables["search_phrase"] == "crash":
+            os._exit(3)  # The worker process dies without any goodbye
+        if variables["search_phrase"] == "error":
+            raise RuntimeError("The site changed")
+        report = {"search_phrase": variables["search_phrase"], "news_category": variables["news_category"],
+                  "num_months": variables["num_months"], "status": "done", "news": 1, "excel_file": None,
+                  "scrape_seconds": 0.0, "export_seconds": 0.0, "total_seconds": 0.0,
+                  "profile_dir": self.profile_dir, "output_root": output_root}
+        return report, [{"bool": True, "title": variables["search_phrase"], "image_path": "N/A"}], []
+
+
+class CachingNewsBrowser(FakeNewsBrowser):
+    """
+    A worker that fills the shared caches and article store as a real search does, many times in a row.
+    """
+
+    def process_query(self, variables, backend, output_root, create_excel):
+        phrase = variables["search_phrase"]
+        topic_cache = TopicCache(os.path.join(self.cache_dir, "topics.json"))
+        topic_cache.put(phrase, "Sports", f"facet-{phrase}")
+        topic_cache.save()
+
+        image_cache = ImageCache(os.path.join(self.cache_dir, "images"), max_bytes=1024 * 1024)
+        fd, tmp_path = tempfile.mkstemp(dir=image_cache.tmp_dir)
+        with os.fdopen(fd, "wb") as f:
+            f.write(phrase.encode("utf-8") * 100)
+        image_cache.store(f"http://a.com/{phrase}.jpg", tmp_path, phrase, {})
+        image_cache.evict()
+        image_cache.save()
+
+        store = ArticleStore(os.path.join(self.cache_dir, "articles.sqlite3"))
+        promo = {"title": phrase, "date": "3 hours ago", "description": "", "image_url": "N/A",
+                 "image_alt": "N/A", "article_url": f"https://www.latimes.com/{phrase}"}
+        store.add(phrase, "Sports", [(store.article_key(promo), promo, 24293)], now=datetime(2024, 5, 15, 12))
+        store.close()
+        return super().process_query(variables, backend, output_root, create_excel)
+
+
+class TestShardSupervisor(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        # With "fork" the workers see the patched NewsBrowser
+        self.supervisor = ShardSupervisor(num_workers=2, output_dir=self.tmp.name,
+                                          profiles_dir=os.path.join(self.tmp.name, "profiles"), mp_context="fork")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    @patch("news_browser.sharding.logger")
+    @patch("news_browser.sharding.ExcelCreator")
+    @patch("news_browser.sharding.NewsBrowser", FakeNewsBrowser)
+    def test_run_isolates_crashes(self, MockExcelCreator, mock_logger):
+        phrases = ["Messi", "crash", "error", "Trump", "Biden", "Maduro"]
+        searches = [{"search_phrase": phrase, "news_category": "Sports", "num_months": 1} for phrase in phrases]
+
+        reports, news_data = self.supervisor.run(searches, backend="browser")
+
+        # Only the search of the crashed worker is lost, the other worker does the rest
+        self.assertEqual([report["status"] for report in reports],
+                         ["done", "crashed", "failed", "done", "done", "done"])
+        self.assertEqual([data[0]["title"] if data else None for data in news_data],
+                         ["Messi", None, None, "Trump", "Biden", "Maduro"])
+
+        # Every worker has its own profile and output subdirectory
+        for report in reports:
+            if report["status"] == "done":
+                worker = report["worker"]
+                self.assertEqual(report["output_root"], os.path.join(self.tmp.name, f"worker{worker}"))
+                self.assertTrue(report["profile_dir"].endswith(os.path.join("profiles", f"worker{worker}")))
+
+        # The crashed worker is reported, the one alive has its throughput
+        metrics = {stats["worker"]: stats for stats in self.supervisor.throughput()}
+        self.assertEqual(len(metrics), 2)
+        crashed = [stats for stats in metrics.values() if stats["error"]]
+        self.assertEqual(len(crashed), 1)
+        self.assertIn("exit code 3", crashed[0]["error"])
+        alive = [stats for stats in metrics.values() if not stats["error"]][0]
+        self.assertGreater(alive["items_per_minute"], 0)
+
+        # The supervisor exports the merged news data and writes the report
+        MockExcelCreator.return_value.create_excel.return_value = "news.xlsx"
+        self.supervisor.export(reports, news_data)
+        self.assertEqual(MockExcelCreator.return_value.create_excel.call_count, 4)
+        with open(self.supervisor.write_report(reports), encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)["searches"]), 6)
+
+    @patch("news_browser.sharding.logger")
+    @patch("news_browser.article_store.logger")
+    @patch("news_browser.topic_cache.logger")
+    @patch("news_browser.sharding.NewsBrowser", CachingNewsBrowser)
+    def test_shards_share_one_cache_directory(self, mock_topic_logger, mock_store_logger, mock_logger):
+        cache_dir = os.path.join(self.tmp.name, "cache")
+        supervisor = ShardSupervisor(num_workers=2, output_dir=self.tmp.name, cache_dir=cache_dir,
+                                     profiles_dir=os.path.join(self.tmp.name, "profiles"), mp_context="fork")
+        phrases = [f"phrase{number:02d}" for number in range(24)]
+        searches = [{"search_phrase": phrase, "news_category": "Sports", "num_months": 1} for phrase in phrases]
+
+        reports, _ = supervisor.run(searches, backend="http")
+        self.assertEqual({report["status"] for report in reports}, {"done"})
+        self.assertEqual(len({report["worker"] for report in reports}), 2)
+
+        # Every worker saved its facets, images and news without losing those of the other one
+        topic_cache = TopicCache(os.path.join(cache_dir, "topics.json"))
+        self.assertEqual([topic_cache.get(phrase, "Sports") for phrase in phrases],
+                         [f"facet-{phrase}" for phrase in phrases])
+        image_cache = ImageCache(os.path.join(cache_dir, "images"))
+        self.assertTrue(all(image_cache.lookup(f"http://a.com/{phrase}.jpg") for phrase in phrases))
+        self.assertEqual(len(os.listdir(image_cache.blobs_dir)), len(phrases))
+        self.assertEqual(os.listdir(image_cache.tmp_dir), [])
+        store = ArticleStore(os.path.join(cache_dir, "articles.sqlite3"))
+        self.assertEqual(store.connection.execute("SELECT COUNT(*) FROM articles").fetchone()[0], len(phrases))
+        store.close()
+        self.assertFalse([name for name in os.listdir(cache_dir) if name.endswith(".tmp")])
+
+
+if __name__ == "__main__":
+    unittest.main()
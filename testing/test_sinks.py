@@ -0,0 +1,118 @@
+# Standard Python library imports
+import csv
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from news_browser import sinks
+from news_browser.excel_creator import ExcelCreator
+from news_browser.sinks import RECORD_FIELDS, open_sinks, parse_formats
+
+
+class TestSinks(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.news_data = [
+            {"bool": True, "title": "Title 1", "date": "Date 1", "description": "It cost $1.2 million",
+             "article_url": "https://www.latimes.com/news-1", "image_path": "N/A", "phrase_matches": 1,
+             "contain_money": True, "money_amounts": [{"amount": 1200000.0, "text": "$1.2 million", "span": (8, 20)}]},
+            {"bool": False, "title": "Title 2", "date": "Date 2", "description": "Description 2",
+             "image_path": "N/A", "phrase_matches": 0, "contain_money": False},
+            {"bool": True, "title": "Título 3", "date": "Date 3", "description": "Description, with \"quotes\"",
+             "image_path": "output/news3.jpg", "phrase_matches": 2, "contain_money": False},
+        ]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_parse_formats(self):
+        self.assertEqual(parse_formats(None), [])
+        self.assertEqual(parse_formats("CSV, jsonl,excel, csv"), ["csv", "jsonl"])
+        self.assertEqual(parse_formats(["jsonl"]), ["jsonl"])
+        with self.assertRaises(ValueError):
+            parse_formats("csv,xml")
+        with patch.object(sinks, "pa", None):
+            with self.assertRaises(ImportError):
+                parse_formats("parquet")
+
+    @patch("news_browser.excel_creator.logger")
+    def test_sinks_receive_the_news_of_the_excel(self, mock_logger):
+        output_sinks = open_sinks("csv,jsonl", self.tmp.name, "Messi", "Sports", 2)
+        excel_file = ExcelCreator(self.tmp.name).create_excel(self.news_data, "Messi", "Sports", 2, sinks=output_sinks)
+
+        csv_path, jsonl_path = [sink.path for sink in output_sinks]
+        self.assertEqual(excel_file, os.path.join(self.tmp.name, "Messi_Sports_2.xlsx"))
+        self.assertEqual(csv_path, os.path.join(self.tmp.name, "Messi_Sports_2.csv"))
+
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(list(rows[0]), RECORD_FIELDS)
+        self.assertEqual([row["title"] for row in rows], ["Title 1", "Título 3"])
+        self.assertEqual(rows[0]["money_amounts"], "$1,200,000.00")
+        self.assertEqual(rows[1]["description"], "Description, with \"quotes\"")
+
+        with open(jsonl_path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual([record["money_amounts"] for record in records], [[1200000.0], []])
+        self.assertEqual(records[1]["article_url"], "N/A")
+
+    @patch("news_browser.excel_creator.logger")
+    def test_no_files_without_news_of_interest(self, mock_logger):
+        output_sinks = open_sinks(["csv", "jsonl"], self.tmp.name, "Messi", "Sports", 2)
+        ExcelCreator(self.tmp.name).create_excel(self.news_data[1:2], "Messi", "Sports", 2, sinks=output_sinks)
+        self.assertEqual([sink.path for sink in output_sinks], [None, None])
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    @patch("news_browser.excel_creator.logger")
+    def test_failed_export_leaves_no_files(self, mock_logger):
+        output_sinks = open_sinks("csv,jsonl", self.tmp.name, "Messi", "Sports", 2)
+        news_data = self.news_data + [{"bool": True, "date": "Date 4"}]  # Its row can not be written
+
+        with self.assertRaises(KeyError):
+            ExcelCreator(self.tmp.name).create_excel(news_data, "Messi", "Sports", 2, sinks=output_sinks)
+        self.assertEqual([sink.path for sink in output_sinks], [None, None])
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+        # And the next export in the same directory clears the files of the previous one
+        for extension in (".csv", ".jsonl", ".parquet"):
+            open(os.path.join(self.tmp.name, f"Old_Search_1{extension}"), "w").close()
+        ExcelCreator(self.tmp.name)
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    def test_sinks_implement_every_hook(self):
+        class IncompleteSink(sinks.Sink):
+            format = "incomplete"
+            extension = ".txt"
+
+            def _open(self):
+                pass
+
+        # A sink that forgets a hook fails when it is created, not with its first news
+        with self.assertRaises(TypeError):
+            IncompleteSink(os.path.join(self.tmp.name, "news"))
+        with patch.object(sinks, "pa", None), self.assertRaises(ImportError):
+            sinks.ParquetSink(os.path.join(self.tmp.name, "news"))
+
+    # pyarrow is in the conda.yaml environment, where the test suite runs
+    @unittest.skipIf(sinks.pa is None, "pyarrow is not installed")
+    def test_parquet_sink(self):
+        import pyarrow.parquet as pq
+        with open_sinks("parquet", self.tmp.name, "Messi", "Sports", 2)[0] as sink:
+            for item in self.news_data:
+                sink.write(item)
+        table = pq.read_table(sink.path)
+        self.assertEqual(table.column_names, RECORD_FIELDS)
+        self.assertEqual(table.column("money_amounts").to_pylist(), [[1200000.0], [], []])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+# Standard Python library imports
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Third party libraries imports
+import openpyxl
+from PIL import Image
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from news_browser.excel_creator import ExcelCreator
+from news_browser.thumbnails import ThumbnailMaker
+
+
+@patch("news_browser.thumbnails.logger")
+class TestThumbnailMaker(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.maker = ThumbnailMaker(cache_dir=os.path.join(self.tmp.name, "thumbnails"), size=(120, 80),
+                                    max_workers=2)
+        self.images = []
+        for index, color in enumerate(["red", "green", "red"]):
+            image_path = os.path.join(self.tmp.name, f"news{index + 1}.jpg")
+            Image.new("RGB", (1200, 600), color).save(image_path)
+            self.images.append(image_path)
+        self.not_an_image = os.path.join(self.tmp.name, "news4.jpg")
+        with open(self.not_an_image, "w") as f:
+            f.write("<html>Not found</html>")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_make_thumbnails(self, mock_logger):
+        thumbnails = self.maker.make_thumbnails(self.images + [self.not_an_image, "N/A"])
+
+        # The same picture under two names has a single thumbnail, made once, what is not an image is left out
+        self.assertEqual(set(thumbnails), set(self.images))
+        self.assertEqual(thumbnails[self.images[0]], thumbnails[self.images[2]])
+        self.assertEqual(self.maker.made, 2)
+        with Image.open(thumbnails[self.images[1]]) as thumbnail:
+            self.assertEqual(thumbnail.size, (120, 60))
+
+    def test_thumbnails_are_cached(self, mock_logger):
+        first = self.maker.make_thumbnails(self.images)
+        second = self.maker.make_thumbnails(self.images)
+        self.assertEqual(first, second)
+        self.assertEqual((self.maker.hits, self.maker.made), (3, 0))
+
+    def test_known_digests_are_not_hashed_again(self, mock_logger):
+        first = self.maker.make_thumbnails(self.images)
+        digests = {image_path: os.path.basename(thumbnail_path).split("_")[0]
+                   for image_path, thumbnail_path in first.items()}
+
+        # The digests kept by the ImageDownloader are used as they are, no image is read to hash it
+        with patch("news_browser.thumbnails.hashlib.sha256") as sha256:
+            self.assertEqual(self.maker.make_thumbnails(self.images, digests), first)
+        sha256.assert_not_called()
+
+    @patch("news_browser.excel_creator.logger")
+    def test_create_excel_embeds_the_thumbnails(self, mock_excel_logger, mock_logger):
+        news_data = [
+            {"bool": True, "title": f"Title {index}", "date": "Date", "description": "Description",
+             "image_path": image_path, "phrase_matches": 1, "contain_money": False}
+            for index, image_path in enumerate([self.images[0], "N/A", self.images[1]], start=1)
+        ]
+
+        excel_file = ExcelCreator(self.tmp.name).create_excel(news_data, "Messi", "Sports", 1, thumbnails=self.maker)
+
+        ws = openpyxl.load_workbook(excel_file).active
+        anchors = sorted((image.anchor._from.col, image.anchor._from.row) for image in ws._images)
+        self.assertEqual(anchors, [(3, 1), (3, 3)])  # Column D of the first and third news (0-based)
+        self.assertEqual(ws.cell(row=2, column=4).value, self.images[0])
+        self.assertEqual(ws.row_dimensions[2].height, 60 * 0.75 + 4)  # As high as the 120x60 thumbnail
+
+
+if __name__ == "__main__":
+    unittest.main()
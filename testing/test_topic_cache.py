@@ -0,0 +1,70 @@
+# Standard Python library imports
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from news_browser.promo_parser import find_topic, parse_topics
+from news_browser.topic_cache import TopicCache
+from testing.fixture_server import read_fixture
+
+
+class TestTopicCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "topics.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    @patch('news_browser.topic_cache.logger')
+    def test_put_get_and_persist(self, mock_logger):
+        cache = TopicCache(self.path)
+        self.assertIsNone(cache.get("Messi", "Sports"))
+
+        cache.put("Messi", "Sports", "0000-abc")
+        cache.save()
+
+        # The next run finds it, whatever the case of the phrase and the category
+        self.assertEqual(TopicCache(self.path).get(" messi", "SPORTS"), "0000-abc")
+        self.assertIsNone(TopicCache(self.path).get("Messi", "Politics"))
+
+    @patch('news_browser.topic_cache.logger')
+    def test_expired_entries_are_ignored(self, mock_logger):
+        cache = TopicCache(self.path, ttl=0)
+        cache.put("Messi", "Sports", "0000-abc")
+        self.assertIsNone(cache.get("Messi", "Sports"))
+
+    @patch('news_browser.topic_cache.logger')
+    def test_caches_shared_by_two_processes(self, mock_logger):
+        # Two caches on the same file stand for two workers of a sharded run
+        first, second = TopicCache(self.path), TopicCache(self.path)
+        first.put("Messi", "Sports", "0000-abc")
+        second.put("Trump", "Politics", "0000-def")
+        first.save()
+        second.save()
+
+        # The last save keeps the facets of the other worker, and no temporary file is left behind
+        cache = TopicCache(self.path)
+        self.assertEqual(cache.get("Messi", "Sports"), "0000-abc")
+        self.assertEqual(cache.get("Trump", "Politics"), "0000-def")
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ["topics.json", "topics.json.lock"])
+
+    def test_find_topic(self):
+        topics = parse_topics(read_fixture("search_page_1.html"))
+
+        position, topic = find_topic(topics, "sports")
+        self.assertEqual(position, 1)
+        self.assertEqual(topic["value"], "00000168-8694-d257-a96e-c7d7f8bb0000")
+        self.assertIsNone(find_topic(topics, "Not a topic"))
+
+
+if __name__ == "__main__":
+    unittest.main()
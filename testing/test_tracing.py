@@ -0,0 +1,92 @@
+# Standard Python library imports
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from news_browser import tracing
+from news_browser.http_scraper import HttpNewsScraper
+from testing.fixture_server import FixtureServer
+
+
+@tracing.traced("add")
+def add(a, b):
+    return a + b
+
+
+@patch("news_browser.tracing.logger")
+class TestTracing(unittest.TestCase):
+    def tearDown(self):
+        tracing.disable()
+
+    def test_disabled_tracing_records_nothing(self, mock_logger):
+        self.assertIsNone(tracing.current())
+        self.assertIs(tracing.span("page", page=1), tracing.span("parse"))
+        with tracing.span("page"):
+            self.assertEqual(add(1, 2), 3)
+        self.assertIsNone(tracing.disable())
+
+    def test_spans_and_summary(self, mock_logger):
+        tracer = tracing.enable()
+        for page in range(1, 21):
+            with tracing.span("page", page=page):
+                pass
+        with self.assertRaises(ValueError):
+            with tracing.span("parse"):
+                raise ValueError("bad page")
+        thread = threading.Thread(target=add, args=(1, 2), name="download-1")
+        thread.start()
+        thread.join()
+
+        summary = tracer.summary()
+        self.assertEqual({name: stats["count"] for name, stats in summary.items()}, {"page": 20, "parse": 1, "add": 1})
+        self.assertLessEqual(summary["page"]["p50_ms"], summary["page"]["p95_ms"])
+        self.assertEqual(tracing.percentile([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 50), 5)
+        self.assertEqual(tracing.percentile([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 95), 10)
+        self.assertEqual(tracing.percentile([7], 95), 7)
+        self.assertIs(tracing.disable(), tracer)
+
+        # The spans of the other thread have their own track
+        events = [event for event in tracer.trace_events() if event["ph"] == "X"]
+        self.assertEqual(events[0]["args"], {"page": 1})
+        self.assertEqual(len({event["tid"] for event in events}), 2)
+        self.assertTrue(all(event["dur"] >= 0 and event["ts"] >= 0 for event in events))
+
+    def test_write_chrome_trace(self, mock_logger):
+        tracer = tracing.enable()
+        with tracing.span("create_excel"):
+            pass
+        with tempfile.TemporaryDirectory() as tmp:
+            path = tracer.write(os.path.join(tmp, "output", "trace.json"))
+            with open(path, encoding="utf-8") as f:
+                trace = json.load(f)
+        self.assertEqual(trace["traceEvents"][0]["name"], "create_excel")
+        self.assertEqual(trace["traceEvents"][0]["ph"], "X")
+        self.assertEqual(trace["traceEvents"][-1]["name"], "thread_name")
+        self.assertEqual(trace["otherData"]["summary"]["create_excel"]["count"], 1)
+
+    @patch("news_browser.http_scraper.logger")
+    def test_http_scraper_stages(self, mock_http_logger, mock_logger):
+        tracer = tracing.enable()
+        with FixtureServer() as server:
+            scraper = HttpNewsScraper(server.base_url)
+            scraper.scrap_news("Messi", "sports", 2)
+            scraper.close()
+
+        summary = tracer.summary()
+        self.assertEqual(summary["search_news"]["count"], 1)
+        self.assertEqual(summary["page"]["count"], 2)
+        self.assertEqual(summary["parse"]["count"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
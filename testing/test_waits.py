@@ -0,0 +1,97 @@
+# Standard Python library imports
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+# Third party libraries imports
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+
+# Taking the correct directory to import the files
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(current_dir)
+sys.path.append(project_dir)
+
+# Local module imports
+from news_browser.waits import PageWaiter
+
+
+class TestPageWaiter(unittest.TestCase):
+    def setUp(self):
+        self.browser = MagicMock()
+        self.waiter = PageWaiter(self.browser, timeout=1, poll_interval=0.01)
+
+    def test_until_returns_as_soon_as_condition_is_met(self):
+        # The condition fails twice (once with a WebDriver exception) and then succeeds
+        results = iter([None, NoSuchElementException("not yet"), "ready"])
+
+        def condition():
+            result = next(results)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        self.assertEqual(self.waiter.until(condition, "my step"), "ready")
+        self.assertEqual(len(self.waiter.timings), 1)
+        self.assertEqual(self.waiter.timings[0]["step"], "my step")
+        self.assertTrue(self.waiter.timings[0]["success"])
+        self.assertLess(self.waiter.timings[0]["seconds"], 1)
+
+    def test_until_timeout(self):
+        with self.assertRaises(TimeoutError):
+            self.waiter.until(lambda: False, "never", timeout=0.05)
+        self.assertEqual(self.waiter.summary()["never"]["failures"], 1)
+
+    def test_staleness(self):
+        # The element is still attached the first time and stale the second time
+        element = MagicMock()
+        element.is_enabled.side_effect = [True, StaleElementReferenceException("gone")]
+        self.assertTrue(self.waiter.staleness(element, "next page loaded"))
+        self.assertEqual(element.is_enabled.call_count, 2)
+
+        # Without an old element there is nothing to wait for
+        self.assertTrue(self.waiter.staleness(None, "next page loaded"))
+
+    def test_rerendered(self):
+        # The first news is updated in place: same element, new text
+        element = MagicMock(text="Old news")
+        texts = iter(["Old news", "Newest news"])
+        type(element).text = property(lambda self: next(texts))
+        self.assertTrue(self.waiter.rerendered(element, lambda: element, "results sorted by newest"))
+
+        # The first news is another element
+        other = MagicMock(text="Old news")
+        self.assertTrue(self.waiter.rerendered(MagicMock(text="Old news"), lambda: other, "results sorted by newest"))
+
+        # Nothing changes (the results were already sorted): it gives up at the timeout
+        same = MagicMock(text="Old news")
+        with self.assertRaises(TimeoutError):
+            self.waiter.rerendered(same, lambda: same, "results sorted by newest", timeout=0.05)
+        self.assertTrue(self.waiter.rerendered(None, lambda: None, "results sorted by newest"))
+
+    def test_any_visible_returns_the_visible_locator(self):
+        self.browser.is_element_visible.side_effect = lambda locator: locator == "class:no-results"
+        found = self.waiter.any_visible(["class:results", "class:no-results"], "search results loaded")
+        self.assertEqual(found, "class:no-results")
+
+    def test_summary(self):
+        self.waiter.element_visible("class:results", "results visible")
+        self.waiter.element_visible("class:results", "results visible")
+        self.browser.wait_until_element_is_visible.assert_called_with("class:results", timeout=1)
+
+        summary = self.waiter.summary()
+        self.assertEqual(summary["results visible"]["count"], 2)
+        self.assertEqual(summary["results visible"]["failures"], 0)
+
+    def test_only_the_last_timings_are_kept(self):
+        waiter = PageWaiter(self.browser, timeout=1, poll_interval=0.01, max_timings=3)
+        for _ in range(10):
+            waiter.element_visible("class:results", "results visible")
+
+        # The summary still counts every wait
+        self.assertEqual(len(waiter.timings), 3)
+        self.assertEqual(waiter.summary()["results visible"]["count"], 10)
+
+
+if __name__ == "__main__":
+    unittest.main()